@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Keyword Cost Attribution
+Joins the Naver search-ad cost sheet (kwd.csv, 총비용) with SMLOG keyword conversions
+and answers cost-per-conversion by keyword / media / date window without re-running the notebook
+
+- Both sides are pre-aggregated to one row per (date, media, keyword) before joining,
+  so duplicate keywords in the cost sheet can never fan out into a cartesian join
+- Keywords are resolved through the persisted KeywordIndex first (spacing / case / full-width
+  variants share one spelling; SMLOG keywords missing from the sheet may near-match a sheet keyword)
+- One hash join (pd.merge on the three keys) builds the daily fact table
+- Refresh is incremental: only dates whose SMLOG sources changed (merge watermark) are re-joined;
+  the cost sheet is re-aggregated only when its signature changes
+- Queries slice a date-sorted fact table and group the slice (milliseconds for the full history)
+"""
+
+import json
+import os
+import sys
+
+import pandas as pd
+
+# The SMLOG merged store lives in the scraper folder; the shared logger in the naverplace package
+SMLOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Nov.25__smartlog.scrapper')
+if SMLOG_DIR not in sys.path:
+    sys.path.insert(0, SMLOG_DIR)
+
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.run_log import get_logger
+from smlog_merge import SMLogMergeStore, file_signature, SOURCE_COLUMN
+from smlog_cache import load_csv
+from kwd_index import KeywordIndex
+
+
+logger = get_logger(__name__)
+
+COST_SHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'kwd.csv')
+SMLOG_DATA_DIR = os.path.join(SMLOG_DIR, 'smlog_data')
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache', 'attribution')
+SMLOG_VAR = '키워드'
+# Bump when keyword resolution or the tables change: cached tables are rebuilt
+ATTRIBUTION_VERSION = 3
+# Near matches only for SMLOG keywords with no canonical match (conservative: one-character edits of long keywords)
+NEAR_JOIN_THRESHOLD = 0.9
+
+# The cost sheet only covers Naver search ads: its cost is attributed to SMLOG media '네이버'
+COST_MEDIA = '네이버'
+COST_COLUMNS = {
+    '일별': 'date',
+    '키워드': 'keyword',
+    '노출수': 'impressions',
+    '클릭수': 'ad_clicks',
+    '총비용(VAT포함,원)': 'cost',
+}
+# conv_rev is revenue (₩), not a conversion count
+CONVERSION_COLUMNS = ('conv_ask', 'conv_join', 'conv_order')
+SMLOG_SUM_COLUMNS = ('totalClick', 'validClick') + CONVERSION_COLUMNS + ('conv_rev',)
+KEYS = ['date', 'media', 'keyword']
+FACT_COLUMNS = ['cost', 'impressions', 'ad_clicks', 'totalClick', 'validClick', 'convs', 'conv_rev'] + list(CONVERSION_COLUMNS)
+
+
+def aggregate_cost_sheet(path=COST_SHEET_PATH, index=None):
+    """kwd.csv (header on the 2nd row) -> one row per (date, media, keyword)"""
+    raw = load_csv(path, header=1, usecols=list(COST_COLUMNS))
+    df = raw.rename(columns=COST_COLUMNS)
+    df = df[df['keyword'] != '-']
+    if index is not None:
+        # Sheet spellings are registered first so they become the representatives
+        index.add(df['keyword'])
+        df['keyword'] = index.resolve(df['keyword'], near=False)
+    df['date'] = pd.to_datetime(df['date'].astype(str).str.rstrip('.'), format='%Y.%m.%d', errors='coerce')
+    df['media'] = COST_MEDIA
+    return df.dropna(subset=['date']).groupby(KEYS, as_index=False, sort=False)[['cost', 'impressions', 'ad_clicks']].sum()
+
+
+def aggregate_conversions(df, index=None):
+    """Typed SMLOG keyword rows -> one row per (date, media, keyword) with a convs total"""
+    if df is None or len(df) == 0:
+        return pd.DataFrame(columns=KEYS + list(SMLOG_SUM_COLUMNS) + ['convs'])
+    if index is not None:
+        df = df.copy()
+        df['keyword'] = index.resolve(df['keyword'], threshold=NEAR_JOIN_THRESHOLD)
+        index.add(df['keyword'])
+    daily = df.groupby(KEYS, as_index=False, sort=False)[list(SMLOG_SUM_COLUMNS)].sum()
+    daily['convs'] = daily[list(CONVERSION_COLUMNS)].sum(axis=1)
+    return daily
+
+
+def join_daily(cost_daily, conv_daily):
+    """The single join path: outer hash join on (date, media, keyword)"""
+    fact = pd.merge(cost_daily, conv_daily, on=KEYS, how='outer')
+    for column in FACT_COLUMNS:
+        if column not in fact.columns:
+            fact[column] = 0
+    fact[FACT_COLUMNS] = fact[FACT_COLUMNS].fillna(0)
+    return fact[KEYS + FACT_COLUMNS]
+
+
+def with_cost_per_conv(df):
+    df = df.copy()
+    convs = df['convs'].astype('float64')
+    df['cost_per_conv'] = (df['cost'] / convs.where(convs > 0)).round(2)
+    return df
+
+
+class KeywordAttribution:
+    """Pre-aggregated cost/conversion tables + daily fact table with incremental refresh"""
+
+    def __init__(self, cost_path=COST_SHEET_PATH, smlog_data_dir=SMLOG_DATA_DIR, cache_dir=CACHE_DIR):
+        self.cost_path = cost_path
+        self.store = SMLogMergeStore(smlog_data_dir)
+        self.cache_dir = cache_dir
+        self.state_path = os.path.join(cache_dir, 'state.json')
+        self.index = KeywordIndex(os.path.join(cache_dir, 'keyword_index.json'))
+        self.state = {'version': ATTRIBUTION_VERSION, 'cost_signature': None, 'smlog_files': {}}
+        self.cost_daily = self.conv_daily = self.fact = None
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == ATTRIBUTION_VERSION:
+                self.state = state
+                self.cost_daily = self._read_table('cost_daily')
+                self.conv_daily = self._read_table('conv_daily')
+                self.fact = self._read_table('fact')
+        self._index_fact()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _table_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}.parquet")
+
+    def _read_table(self, name):
+        path = self._table_path(name)
+        return pd.read_parquet(path) if os.path.exists(path) else None
+
+    def _save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for name in ('cost_daily', 'conv_daily', 'fact'):
+            table = getattr(self, name)
+            if table is not None:
+                table.to_parquet(self._table_path(name), index=False)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _index_fact(self):
+        """Date-sorted fact table so window queries are a binary-searched slice"""
+        if self.fact is not None:
+            self.fact = self.fact.sort_values('date', kind='stable').reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+    def changed_smlog_sources(self):
+        """SMLOG keyword sources added/changed (or re-read with other excluded dates) and removed since the last refresh"""
+        current = self.store.state.get(SMLOG_VAR, {}).get('files', {})
+        seen = self.state['smlog_files']
+        changed = [
+            rel for rel, entry in current.items()
+            if (seen.get(rel, {}).get('signature'), seen.get(rel, {}).get('excluded', []))
+            != (entry['signature'], entry.get('excluded', []))
+        ]
+        removed = [rel for rel in seen if rel not in current]
+        return changed, removed
+
+    def reload_conversions(self, changed, removed):
+        """
+        Rebuild conv_daily for every date the changed/removed sources held
+        (a range export covers many dates, so dates come from the rows, not the file name)
+
+        Returns:
+            Set of re-aggregated dates ('YYYY-MM-DD')
+        """
+        current = self.store.state.get(SMLOG_VAR, {}).get('files', {})
+        seen = self.state['smlog_files']
+        columns = ['media', 'keyword'] + list(SMLOG_SUM_COLUMNS) + ['date']
+
+        def source_dates(rows):
+            if len(rows) == 0:
+                return {}
+            days = rows['date'].dt.strftime('%Y-%m-%d')
+            return {rel: sorted(d.unique()) for rel, d in days.groupby(rows[SOURCE_COLUMN])}
+
+        rows = self.store.load_sources(SMLOG_VAR, changed, columns=columns, keep_source=True)
+        dates_by_source = {rel: seen.get(rel, {}).get('dates', []) for rel in current if rel not in changed}
+        dates_by_source.update(source_dates(rows))
+
+        changed_dates = set()
+        for rel in changed + removed:
+            changed_dates.update(seen.get(rel, {}).get('dates', []))
+            changed_dates.update(dates_by_source.get(rel, []))
+
+        # Unchanged sources with rows on those dates feed the same (date, media, keyword) rows
+        others = [rel for rel in current if rel not in changed and changed_dates & set(dates_by_source.get(rel, []))]
+        if others:
+            rows = pd.concat([rows, self.store.load_sources(SMLOG_VAR, others, columns=columns, keep_source=True)], ignore_index=True)
+
+        changed_ts = pd.to_datetime(sorted(changed_dates))
+        if len(rows):
+            rows = rows[rows['date'].isin(changed_ts)].drop(columns=[SOURCE_COLUMN])
+        fresh = aggregate_conversions(rows, self.index)
+        if self.conv_daily is not None:
+            kept = self.conv_daily[~self.conv_daily['date'].isin(changed_ts)]
+            fresh = pd.concat([kept, fresh], ignore_index=True)
+        self.conv_daily = fresh
+        self.state['smlog_files'] = {
+            rel: {'signature': entry['signature'], 'excluded': entry.get('excluded', []), 'dates': dates_by_source.get(rel, [])}
+            for rel, entry in current.items()
+        }
+        return changed_dates
+
+    def refresh(self, merge=True):
+        """
+        Bring the tables up to date
+
+        Args:
+            merge: run the SMLOG incremental merge for 키워드 first
+
+        Returns:
+            Number of dates re-joined
+        """
+        if merge:
+            self.store.merge([SMLOG_VAR])
+
+        cost_changed = False
+        if os.path.exists(self.cost_path):
+            signature = file_signature(self.cost_path)
+            if signature != self.state['cost_signature'] or self.cost_daily is None:
+                self.cost_daily = aggregate_cost_sheet(self.cost_path, self.index)
+                self.state['cost_signature'] = signature
+                cost_changed = True
+                logger.info(f"  ✓ [Attribution] Cost sheet re-aggregated: {len(self.cost_daily)} (date, keyword) rows")
+
+        changed, removed = self.changed_smlog_sources()
+        changed_dates = self.reload_conversions(changed, removed) if changed or removed else set()
+
+        if self.cost_daily is None:
+            logger.warning(f"  ⚠ [Attribution] No cost sheet at {self.cost_path}")
+            return 0
+        conv_daily = self.conv_daily if self.conv_daily is not None else aggregate_conversions(None)
+
+        if self.fact is None or cost_changed:
+            # Cost sheet exports cover every date again: one full join
+            self.fact = join_daily(self.cost_daily, conv_daily)
+            rejoined = self.fact['date'].nunique()
+        elif changed_dates:
+            changed_ts = pd.to_datetime(sorted(changed_dates))
+            patch = join_daily(
+                self.cost_daily[self.cost_daily['date'].isin(changed_ts)],
+                conv_daily[conv_daily['date'].isin(changed_ts)],
+            )
+            self.fact = pd.concat([self.fact[~self.fact['date'].isin(changed_ts)], patch], ignore_index=True)
+            rejoined = len(changed_dates)
+        else:
+            logger.info("  ✓ [Attribution] Up to date")
+            return 0
+
+        self._index_fact()
+        self._save()
+        self.index.save()
+        logger.info(f"  ✓ [Attribution] {rejoined} dates joined, fact table {len(self.fact)} rows")
+        return rejoined
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def window(self, start=None, end=None):
+        """Fact rows in [start, end] (inclusive, 'YYYY-MM-DD') via binary search on the sorted dates"""
+        if self.fact is None:
+            return pd.DataFrame(columns=KEYS + FACT_COLUMNS)
+        dates = self.fact['date'].values
+        lo = 0 if start is None else dates.searchsorted(pd.Timestamp(start).to_datetime64(), side='left')
+        hi = len(dates) if end is None else dates.searchsorted(pd.Timestamp(end).to_datetime64(), side='right')
+        return self.fact.iloc[lo:hi]
+
+    def cost_per_conv(self, by=('keyword',), start=None, end=None, keywords=None, media=None):
+        """
+        Cost per conversion over a date window
+
+        Args:
+            by: grouping columns (any of 'keyword', 'media', 'date')
+            start, end: inclusive date bounds ('YYYY-MM-DD'), None = open
+            keywords: optional list of keywords to keep
+            media: optional list of media to keep
+
+        Returns:
+            DataFrame with summed cost/clicks/conversions and cost_per_conv, sorted by cost
+        """
+        df = self.window(start, end)
+        if keywords is not None:
+            df = df[df['keyword'].isin(keywords)]
+        if media is not None:
+            df = df[df['media'].isin(media)]
+        result = df.groupby(list(by), as_index=False, sort=False)[FACT_COLUMNS].sum()
+        return with_cost_per_conv(result).sort_values('cost', ascending=False, ignore_index=True)
+
+    def totals(self, start=None, end=None):
+        """Overall cost, conversions, cost per conversion and the share of cost with zero conversions"""
+        per_keyword = self.cost_per_conv(('keyword',), start, end)
+        cost = per_keyword['cost'].sum()
+        convs = per_keyword['convs'].sum()
+        wasted = per_keyword.loc[per_keyword['convs'] == 0, 'cost'].sum()
+        return {
+            'cost': float(cost),
+            'convs': float(convs),
+            'cost_per_conv': round(cost / convs, 2) if convs else None,
+            'zero_conv_cost_share': round(wasted / cost, 4) if cost else None,
+        }
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Keyword cost-per-conversion')
+    parser.add_argument('--by', default='keyword', help="Comma-separated grouping: keyword,media,date")
+    parser.add_argument('--start', default=None, help='YYYY-MM-DD')
+    parser.add_argument('--end', default=None, help='YYYY-MM-DD')
+    parser.add_argument('--top', type=int, default=30)
+    args = parser.parse_args()
+
+    attribution = KeywordAttribution()
+    attribution.refresh()
+    result = attribution.cost_per_conv(tuple(args.by.split(',')), args.start, args.end)
+    logger.info(result.head(args.top).to_string())
+    logger.info(f"Totals: {attribution.totals(args.start, args.end)}")
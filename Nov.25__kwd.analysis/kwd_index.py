@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Keyword Index
+Canonical keyword forms + character n-gram index so SMLOG keywords and Naver ad keywords
+join on the same key instead of exact strings
+
+- Canonical form: NFKC (full-width -> half-width), casefold, whitespace/separators removed
+- Key: the canonical form (one id and representative spelling per canonical form)
+- Near matches: candidates share character bigrams, scored by Dice coefficient
+- The index is persisted (JSON) and grown incrementally; lookups run on unique values only
+"""
+
+import json
+import os
+from collections import Counter
+
+import pandas as pd
+
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache', 'keyword_index.json')
+INDEX_VERSION = 1
+NGRAM = 2
+NEAR_THRESHOLD = 0.8
+
+_SEPARATORS = r"[\s\-_·.,/+()\[\]'\"]+"
+
+
+def canonicalize(keywords):
+    """Vectorized canonical form of a keyword Series"""
+    return (
+        pd.Series(keywords, dtype='string')
+        .str.normalize('NFKC')
+        .str.casefold()
+        .str.replace(_SEPARATORS, '', regex=True)
+    )
+
+
+def canonical(keyword):
+    return canonicalize([keyword]).iloc[0]
+
+
+def ngrams(text, n=NGRAM):
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class KeywordIndex:
+    """Canonical form -> representative spelling, plus an n-gram postings index for near matches"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.canonicals = []        # id -> canonical form
+        self.representatives = []   # id -> first spelling seen (cost sheet spelling when registered first)
+        self.ids = {}               # canonical form -> id
+        self.postings = {}          # n-gram -> [ids]
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.canonicals = data['canonicals']
+                self.representatives = data['representatives']
+                self.postings = data['postings']
+                self.ids = {c: i for i, c in enumerate(self.canonicals)}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'canonicals': self.canonicals,
+                'representatives': self.representatives,
+                'postings': self.postings,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def add(self, keywords):
+        """Register keywords (only unseen canonical forms are indexed); returns the number added"""
+        unique = pd.Series(pd.unique(pd.Series(keywords, dtype='string').dropna()), dtype='string')
+        forms = canonicalize(unique)
+        added = 0
+        for spelling, form in zip(unique, forms):
+            if not form or form in self.ids:
+                continue
+            new_id = len(self.canonicals)
+            self.ids[form] = new_id
+            self.canonicals.append(form)
+            self.representatives.append(spelling)
+            for gram in ngrams(form):
+                self.postings.setdefault(gram, []).append(new_id)
+            added += 1
+        return added
+
+    def nearest(self, form, threshold=NEAR_THRESHOLD):
+        """Best indexed canonical form by bigram Dice coefficient, or (None, 0.0)"""
+        grams = ngrams(form)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        best_id, best_score = None, 0.0
+        for candidate_id, overlap in shared.items():
+            score = 2 * overlap / (len(grams) + len(ngrams(self.canonicals[candidate_id])))
+            if score > best_score:
+                best_id, best_score = candidate_id, score
+        if best_score < threshold:
+            return None, 0.0
+        return best_id, best_score
+
+    def match(self, keywords, near=True, threshold=NEAR_THRESHOLD):
+        """
+        Map keywords onto indexed entries
+
+        Returns:
+            DataFrame (one row per unique keyword): keyword, canonical, representative, match ('exact'/'near'/None), score
+        """
+        unique = pd.Series(pd.unique(pd.Series(keywords, dtype='string').dropna()), dtype='string')
+        forms = canonicalize(unique)
+        rows = []
+        for spelling, form in zip(unique, forms):
+            entry_id, kind, score = self.ids.get(form), 'exact', 1.0
+            if entry_id is None and near and form:
+                entry_id, score = self.nearest(form, threshold)
+                kind = 'near' if entry_id is not None else None
+            rows.append({
+                'keyword': spelling,
+                'canonical': form,
+                'representative': self.representatives[entry_id] if entry_id is not None else None,
+                'match': kind if entry_id is not None else None,
+                'score': score if entry_id is not None else 0.0,
+            })
+        return pd.DataFrame(rows, columns=['keyword', 'canonical', 'representative', 'match', 'score'])
+
+    def resolve(self, keywords, near=True, threshold=NEAR_THRESHOLD):
+        """
+        Replace each keyword with its representative spelling
+        Unmatched keywords collapse onto the first spelling of their canonical form in this batch
+        """
+        series = pd.Series(keywords, dtype='string')
+        matched = self.match(series, near, threshold)
+        fallback = matched.groupby('canonical', sort=False)['keyword'].transform('first')
+        mapping = dict(zip(matched['keyword'], matched['representative'].fillna(fallback)))
+        return series.map(mapping).fillna(series)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+네이버 스마트플레이스 대량 백필 실행 파일
+
+구조:
+- 코디네이터가 한 번 로그인하여 세션(storage state)을 파일로 저장
+- (사업장, 모듈, 날짜) 작업을 N개 샤드로 나누어 작업 프로세스 N개에 분배
+  (프로세스마다 자체 브라우저/이벤트 루프, 같은 세션 파일로 시작)
+- 작업 프로세스는 NaverPlaceDataCollector의 작업 큐(재시도/백오프/데드레터)로 샤드 처리
+- 코디네이터가 진행 상황을 모아 manifest.json에 기록 (다시 실행하면 완료된 작업은 건너뜀)
+
+사용 예:
+    python backfill.py --start 2025-01-01 --end 2025-12-31 --workers 4
+    python backfill.py --start 2025-06-01 --end 2025-06-30 --modules booking_trend_chart place_inflow_channel
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import time
+from datetime import datetime, timedelta
+
+from playwright.async_api import async_playwright
+
+from main import NaverPlaceDataCollector
+from modules import PlaceHourlyInflowGraphScraper, PlaceInflowChannelScraper, PlaceInflowSegmentScraper, SmartcallCallStatisticsScraper, SmartcallTopMediaScraper, SmartcallTopKeywordScraper, BookingTrendChartScraper
+from modules.business_catalog import BusinessProfile, load_business_catalog
+from modules.naverplace_login import NaverPlaceLogin, load_credentials
+from modules.rate_limiter import HostRateLimiter, HostLimitConfig, scaled_config, scaled_host_configs, set_rate_limiter
+from modules.task_queue import TaskQueue, CollectionTask, DONE, DEAD
+from modules.run_log import get_logger, configure_logging
+from modules.strategy_stats import stats_path
+
+
+logger = get_logger(__name__)
+
+
+# 모듈 이름 → 스크래퍼 클래스
+SCRAPER_CLASSES = {
+    "place_hourly_inflow_graph": PlaceHourlyInflowGraphScraper,
+    "place_inflow_channel": PlaceInflowChannelScraper,
+    "place_inflow_segment": PlaceInflowSegmentScraper,
+    "smartcall_call_statistics": SmartcallCallStatisticsScraper,
+    "smartcall_top_media": SmartcallTopMediaScraper,
+    "smartcall_top_keyword": SmartcallTopKeywordScraper,
+    "booking_trend_chart": BookingTrendChartScraper,
+}
+
+
+class BackfillManifest:
+    """백필 작업별 최종 상태 (코디네이터만 기록, flush_interval마다 모아서 저장)"""
+
+    def __init__(self, path: str, flush_interval: float = 5.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.entries = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("tasks", {})
+
+    def is_done(self, task_id: str) -> bool:
+        return self.entries.get(task_id, {}).get("status") == DONE
+
+    def update(self, message: dict):
+        self.entries[message["task_id"]] = {
+            "status": message["status"],
+            "attempts": message["attempts"],
+            "shard": message["shard"],
+            "last_error": message.get("last_error"),
+            "updated_at": datetime.now().isoformat(),
+        }
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= self.flush_interval:
+            self.save()
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"tasks": self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self):
+        """저장되지 않은 변경이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    def counts(self) -> dict:
+        result = {DONE: 0, DEAD: 0}
+        for entry in self.entries.values():
+            if entry["status"] in result:
+                result[entry["status"]] += 1
+        return result
+
+
+def build_task_space(businesses: list, module_names: list, start_date: str, end_date: str) -> list:
+    """(사업장, 모듈, 날짜) 전체 작업 목록"""
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    tasks = []
+    for business in businesses:
+        for module_name in module_names:
+            current_date = start_dt
+            while current_date <= end_dt:
+                tasks.append(CollectionTask(business.key, module_name, current_date.strftime("%Y-%m-%d")))
+                current_date += timedelta(days=1)
+    return tasks
+
+
+def shard_tasks(tasks: list, num_shards: int) -> list:
+    """라운드 로빈 분배 (샤드마다 여러 모듈/날짜가 고르게 섞이도록)"""
+    shards = [[] for _ in range(num_shards)]
+    for i, task in enumerate(tasks):
+        shards[i % num_shards].append(task)
+    return [shard for shard in shards if shard]
+
+
+async def save_session_state(username: str, password: str, business: BusinessProfile, storage_state_path: str,
+                             output_base_dir: str = "data/naverplace") -> bool:
+    """코디네이터 로그인 후 세션 파일 저장"""
+    login_handler = NaverPlaceLogin(username, password, business=business, output_base_dir=output_base_dir)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False)
+        context = await browser.new_context()
+        page = await context.new_page()
+        try:
+            if not await login_handler.perform_login(page):
+                return False
+            await login_handler.navigate_to_base(page)
+            await context.storage_state(path=storage_state_path)
+            logger.info(f"✓ Session state saved: {storage_state_path}")
+            return True
+        finally:
+            await browser.close()
+
+
+async def run_shard_async(shard_id: int, num_shards: int, task_dicts: list, settings: dict, progress_queue):
+    """작업 프로세스 본체: 세션 파일로 브라우저를 열고 샤드 작업 큐 처리"""
+    # 작업 프로세스별 로그 파일 (spawn이라 프로세스마다 다시 설정)
+    configure_logging(settings["log_level"], os.path.join(settings["backfill_dir"], "_logs", f"shard_{shard_id}.jsonl"), shard=shard_id)
+
+    # 전체 호스트 예산을 작업 프로세스 수로 나눠 사용
+    set_rate_limiter(HostRateLimiter(scaled_host_configs(1 / num_shards), default_config=scaled_config(HostLimitConfig(), 1 / num_shards)))
+
+    businesses = [BusinessProfile(**b) for b in settings["businesses"]]
+    task_queue = TaskQueue(os.path.join(settings["backfill_dir"], f"shard_{shard_id}"))
+    task_queue.clear()
+    task_queue.add_many([CollectionTask(**t) for t in task_dicts])
+
+    collector = NaverPlaceDataCollector(
+        settings["username"],
+        settings["password"],
+        output_base_dir=settings["output_base_dir"],
+        businesses=businesses,
+        max_concurrency=settings["tabs_per_worker"],
+        task_queue=task_queue,
+        metrics_path=os.path.join(settings["backfill_dir"], "_metrics", f"shard_{shard_id}.prom"),
+        strategy_stats_path=stats_path(settings["output_base_dir"], shard_id),  # 샤드마다 자기 파일에 기록
+    )
+    for module_name in settings["module_names"]:
+        collector.register_scraper(SCRAPER_CLASSES[module_name](settings["username"], settings["password"]))
+
+    def report(task):
+        progress_queue.put({
+            "shard": shard_id,
+            "task_id": task.task_id,
+            "status": task.status,
+            "attempts": task.attempts,
+            "last_error": task.last_error,
+        })
+    collector.on_task_finished = report
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(storage_state=settings["storage_state_path"])
+        page = await context.new_page()
+        try:
+            # 세션이 만료됐으면 이 프로세스에서 다시 로그인
+            await collector.login_handler.navigate_to_base(page)
+            if await collector.login_handler.is_login_form_visible(page):
+                logger.warning(f"  ⚠ [Shard {shard_id}] Session expired, logging in again...")
+                if not await collector.login_handler.perform_login(page):
+                    logger.error(f"  ✗ [Shard {shard_id}] Login failed")
+                    return
+
+            await collector.process_queue(context, page)
+        finally:
+            await browser.close()
+
+
+def run_shard(shard_id: int, num_shards: int, task_dicts: list, settings: dict, progress_queue):
+    """작업 프로세스 진입점"""
+    try:
+        asyncio.run(run_shard_async(shard_id, num_shards, task_dicts, settings, progress_queue))
+    except Exception as e:
+        logger.error(f"\n✗ [Shard {shard_id}] Error: {e}", exc_info=True)
+    finally:
+        progress_queue.put({"shard": shard_id, "event": "finished"})
+
+
+def run_backfill(start_date: str, end_date: str, module_names: list, num_workers: int,
+                 tabs_per_worker: int = 1, output_base_dir: str = "data/naverplace", log_level: str = None) -> bool:
+    """코디네이터: 로그인 → 샤딩 → 작업 프로세스 실행 → 진행 상황/매니페스트 병합"""
+    logger.info("=" * 70)
+    logger.info("Naver SmartPlace Backfill")
+    logger.info("=" * 70)
+
+    username, password = load_credentials()
+    businesses = load_business_catalog()
+
+    backfill_dir = os.path.join(output_base_dir, "_backfill")
+    os.makedirs(backfill_dir, exist_ok=True)
+    manifest = BackfillManifest(os.path.join(backfill_dir, "manifest.json"))
+
+    # 완료된 작업은 건너뜀
+    all_tasks = build_task_space(businesses, module_names, start_date, end_date)
+    tasks = [task for task in all_tasks if not manifest.is_done(task.task_id)]
+    logger.info(f"\n[Backfill] {len(all_tasks)} tasks in range, {len(all_tasks) - len(tasks)} already done, {len(tasks)} to run")
+    if not tasks:
+        return True
+
+    storage_state_path = os.path.join(backfill_dir, "storage_state.json")
+    logger.info("\n[Step 1] Logging in (coordinator)...")
+    if not asyncio.run(save_session_state(username, password, businesses[0], storage_state_path, output_base_dir)):
+        logger.error("  ✗ Login failed")
+        return False
+
+    shards = shard_tasks(tasks, max(1, num_workers))
+    settings = {
+        "username": username,
+        "password": password,
+        "businesses": [b.to_dict() for b in businesses],
+        "module_names": module_names,
+        "output_base_dir": output_base_dir,
+        "backfill_dir": backfill_dir,
+        "storage_state_path": storage_state_path,
+        "tabs_per_worker": tabs_per_worker,
+        "log_level": log_level,
+    }
+
+    # Step 2: 작업 프로세스 실행 (spawn: 프로세스마다 깨끗한 이벤트 루프/브라우저)
+    logger.info(f"\n[Step 2] Starting {len(shards)} worker processes ({tabs_per_worker} tab(s) each)...")
+    mp_context = multiprocessing.get_context("spawn")
+    progress_queue = mp_context.Queue()
+    processes = []
+    for shard_id, shard in enumerate(shards):
+        process = mp_context.Process(
+            target=run_shard,
+            args=(shard_id, len(shards), [t.to_dict() for t in shard], settings, progress_queue),
+            name=f"backfill-shard-{shard_id}",
+        )
+        process.start()
+        processes.append(process)
+
+    # Step 3: 진행 상황 수집 및 매니페스트 병합
+    finished_shards = set()
+    total = len(tasks)
+    try:
+        while len(finished_shards) < len(processes):
+            try:
+                message = progress_queue.get(timeout=5)
+            except queue.Empty:
+                # 작업 프로세스가 보고 없이 죽은 경우
+                for shard_id, process in enumerate(processes):
+                    if not process.is_alive() and shard_id not in finished_shards:
+                        logger.warning(f"  ⚠ [Backfill] Shard {shard_id} exited with code {process.exitcode}")
+                        finished_shards.add(shard_id)
+                continue
+
+            if message.get("event") == "finished":
+                finished_shards.add(message["shard"])
+                logger.info(f"  ✓ [Backfill] Shard {message['shard']} finished ({len(finished_shards)}/{len(processes)})")
+                continue
+
+            manifest.update(message)
+            counts = manifest.counts()
+            logger.info(f"  ℹ [Backfill] {message['task_id']} → {message['status']} | done {counts[DONE]}, dead {counts[DEAD]} (this run: {total} tasks)")
+    finally:
+        # 중단(Ctrl+C 등)돼도 모아 둔 진행 상황은 기록
+        manifest.flush()
+
+    for process in processes:
+        process.join()
+
+    # Step 4: 결과 요약
+    counts = manifest.counts()
+    remaining = [task.task_id for task in all_tasks if not manifest.is_done(task.task_id)]
+    logger.info("\n" + "=" * 70)
+    logger.info("BACKFILL SUMMARY")
+    logger.info("=" * 70)
+    logger.info(f"  Done: {len(all_tasks) - len(remaining)}/{len(all_tasks)}")
+    logger.info(f"  Dead-lettered: {counts[DEAD]}")
+    logger.info(f"  Manifest: {manifest.path}")
+    if remaining:
+        logger.info("  ℹ Re-run the same command to retry the remaining tasks")
+    logger.info("=" * 70)
+    return not remaining
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Naver SmartPlace multi-process backfill")
+    parser.add_argument("--start", required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--modules", nargs="+", default=list(SCRAPER_CLASSES), choices=list(SCRAPER_CLASSES), help="수집할 모듈 (기본: 전체)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="작업 프로세스 수 (기본: CPU 코어 수 - 1)")
+    parser.add_argument("--tabs", type=int, default=1, help="작업 프로세스당 탭 수")
+    parser.add_argument("--output-dir", default="data/naverplace", help="출력 경로")
+    parser.add_argument("--log-level", default=None, help="로그 레벨 (DEBUG/INFO/WARNING, 기본: INFO)")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level, os.path.join(args.output_dir, "_backfill", "_logs", "coordinator.jsonl"))
+    run_backfill(args.start, args.end, args.modules, args.workers, args.tabs, args.output_dir, args.log_level)
+
+
+if __name__ == "__main__":
+    main()
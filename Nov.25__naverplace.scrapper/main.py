@@ -7,32 +7,255 @@
 - 세션 종료
 """
 
+import argparse
 import asyncio
+import os
+from collections import deque
 from datetime import datetime, timedelta
 from playwright.async_api import async_playwright
 from modules.naverplace_login import NaverPlaceLogin, load_credentials
-from modules import PlaceHourlyInflowGraphScraper, PlaceInflowChannelScraper, PlaceInflowSegmentScraper, SmartcallCallStatisticsScraper, SmartcallTopMediaScraper, SmartcallTopKeywordScraper, BookingTrendChartScraper
+from modules import SmartcallCallStatisticsScraper, SmartcallTopMediaScraper, SmartcallTopKeywordScraper, BookingTrendChartScraper
+from modules.business_catalog import DEFAULT_BUSINESS, load_business_catalog, business_output_dir
+from modules.rate_limiter import get_rate_limiter
+from modules.task_queue import TaskQueue, CollectionTask
+from modules.browser_watchdog import BrowserSlot, RecycleConfig
+from modules.run_log import get_logger, configure_logging, task_context, DEFAULT_LOG_PATH
+from modules.run_metrics import get_metrics
+from modules.strategy_stats import StrategyStats, set_strategy_stats, stats_path
+from pipeline.sources import output_modules
+from pipeline.validate import OutputValidator
+
+
+logger = get_logger(__name__)
 
 
 class NaverPlaceDataCollector:
     """네이버 스마트플레이스 데이터 수집기"""
     
-    def __init__(self, username: str, password: str, output_base_dir: str = "data/naverplace"):
+    def __init__(self, username: str, password: str, output_base_dir: str = "data/naverplace", businesses: list = None, max_concurrency: int = 3, task_queue: TaskQueue = None, recycle_config: RecycleConfig = None, pipeline_depth: int = 1, metrics_path: str = None, metrics_port: int = None, strategy_stats_path: str = None):
         self.username = username
         self.password = password
         self.output_base_dir = output_base_dir
-        self.login_handler = NaverPlaceLogin(username, password)
+        self.businesses = businesses or [DEFAULT_BUSINESS]
+        self.max_concurrency = max(1, max_concurrency)  # 동시에 열리는 탭 수 (전체 사업장 공통 상한)
+        self.task_queue = task_queue or TaskQueue(os.path.join(output_base_dir, "_queue"))
+        self.recycle_config = recycle_config or RecycleConfig()  # 탭/컨텍스트 재생성 기준
+        self.slots = []
+        self.pipeline_depth = max(0, pipeline_depth)  # 작업자마다 미리 열어둘 다음 작업 수 (0: 파이프라인 없음)
+        self.login_handler = NaverPlaceLogin(username, password, business=self.businesses[0], output_base_dir=output_base_dir)
         self.scrapers = []  # 스크래퍼 템플릿 리스트
+        self.business_by_key = {b.key: b for b in self.businesses}
+        self.scraper_by_module = {}
+        self.on_task_finished = None  # 작업 하나가 끝날 때마다 호출 (task) - 진행 상황 보고용
+        self.metrics = get_metrics()
+        self.metrics_path = metrics_path or os.path.join(output_base_dir, "_metrics", "collector.prom")  # Prometheus 텍스트 파일
+        self.metrics_port = metrics_port  # 지정하면 실행 중 http://127.0.0.1:<port>/metrics 노출
+        self.strategy_stats_path = strategy_stats_path or stats_path(output_base_dir)  # 이 프로세스가 기록하는 전략 통계 파일
     
     def register_scraper(self, scraper):
         """스크래퍼 등록 (템플릿으로 사용)"""
         self.scrapers.append(scraper)
+        self.scraper_by_module[scraper.get_module_name()] = scraper
+    
+    def get_business_output_dir(self, business) -> str:
+        """사업장이 하나면 기존 경로 유지, 여러 개면 사업장별 파티션 사용"""
+        if len(self.businesses) == 1:
+            return self.output_base_dir
+        return business_output_dir(self.output_base_dir, business)
+    
+    def build_tasks(self) -> list:
+        """등록된 모듈 × 사업장 × 날짜 작업 목록 생성"""
+        tasks = []
+        for scraper_template in self.scrapers:
+            module_name = scraper_template.get_module_name()
+            
+            # 날짜 범위 파싱
+            try:
+                start_dt = datetime.strptime(scraper_template.start_date, "%Y-%m-%d")
+                end_dt = datetime.strptime(scraper_template.end_date, "%Y-%m-%d")
+            except ValueError as e:
+                logger.error(f"\n✗ Invalid date format in {module_name}: {e}")
+                continue
+            
+            for business in self.businesses:
+                current_date = start_dt
+                while current_date <= end_dt:
+                    tasks.append(CollectionTask(business.key, module_name, current_date.strftime("%Y-%m-%d")))
+                    current_date += timedelta(days=1)
+        return tasks
+    
+    def spawn_scraper(self, task: CollectionTask):
+        """작업에 맞는 날짜/사업장 지정 스크래퍼 생성"""
+        business = self.business_by_key[task.business_key]
+        scraper_template = self.scraper_by_module[task.module_name]
+        return scraper_template.spawn(
+            task.target_date,
+            task.target_date,
+            business=business,
+            output_base_dir=self.get_business_output_dir(business)
+        )
     
-    async def run(self) -> bool:
+    async def run_scraper(self, scraper, page):
+        """수집 → 저장"""
+        try:
+            data = await scraper.scrape(page)
+            await scraper.save_results(data)
+        finally:
+            # 스크래퍼가 탭에 등록한 리스너 제거 (탭을 계속 쓰는 동안 누적 방지)
+            scraper.detach_page_listeners()
+    
+    async def prefetch(self, entry: dict):
+        """다음 작업 페이지 미리 열기 (실패해도 본 작업에서 다시 이동하므로 무시)"""
+        task = entry["task"]
+        with task_context(business=task.business_key, module=task.module_name, date=task.target_date):
+            try:
+                await entry["scraper"].prefetch(entry["page"])
+            except Exception as e:
+                logger.warning(f"  ⚠ Prefetch failed for {task.task_id}: {e}")
+    
+    def start_prefetch(self, entry: dict):
+        entry["prefetch"] = asyncio.create_task(self.prefetch(entry))
+    
+    async def worker(self, worker_id: int, slot: BrowserSlot):
+        """
+        큐에서 작업을 하나씩 꺼내 실행 (슬롯 하나 전담)
+        pipeline_depth > 0이면 현재 작업을 추출/저장하는 동안 다음 작업들의 페이지를 슬롯의 다른 탭에서 미리 열어둠
+        """
+        await slot.ensure_pages(self.pipeline_depth + 1)
+        pipeline = deque()  # {"task", "scraper", "page", "prefetch"}
+        
+        while True:
+            # 파이프라인 채우기 (맨 앞 작업은 대기해서라도 가져오고, 나머지는 바로 실행 가능한 작업만)
+            while len(pipeline) < self.pipeline_depth + 1:
+                task = self.task_queue.get_ready() if pipeline else await self.task_queue.get()
+                if task is None:
+                    break
+                used_pages = [entry["page"] for entry in pipeline]
+                entry = {
+                    "task": task,
+                    "scraper": self.spawn_scraper(task),
+                    "page": next(page for page in slot.pages if page not in used_pages),
+                    "prefetch": None,
+                }
+                if pipeline:
+                    self.start_prefetch(entry)
+                pipeline.append(entry)
+            
+            if not pipeline:
+                return
+            
+            entry = pipeline.popleft()
+            task = entry["task"]
+            if entry["prefetch"] is not None:
+                await entry["prefetch"]
+            
+            # 이 작업 동안의 모든 로그에 (사업장, 모듈, 날짜) 컨텍스트 첨부
+            with task_context(business=task.business_key, module=task.module_name, date=task.target_date):
+                logger.info(f"\n{'=' * 70}")
+                logger.info(f"[Worker {worker_id}] {task.task_id} (attempt {task.attempts + 1}/{self.task_queue.max_attempts})")
+                logger.info("=" * 70)
+                
+                if await self.task_queue.run(task, lambda: self.run_scraper(entry["scraper"], entry["page"])):
+                    logger.info(f"  ✓ {task.task_id} completed successfully")
+                if self.on_task_finished is not None:
+                    self.on_task_finished(task)
+                self.metrics.write_textfile(self.metrics_path)
+            # 작업 간 간격은 호스트별 레이트 리미터가 조절 (다음 page.goto에서 대기)
+            
+            kind, reason = await slot.check()
+            if kind:
+                # 미리 열던 탭이 닫히기 전에 진행 중인 prefetch를 마치고, 새 탭에서 다시 시작
+                for pending in pipeline:
+                    if pending["prefetch"] is not None:
+                        await pending["prefetch"]
+                await slot.recycle(kind, reason)
+                for i, pending in enumerate(pipeline):
+                    # 옛 탭에 묶인 리스너/캡처 응답을 버리고 새 스크래퍼로 새 탭에 다시 연결
+                    pending["scraper"].detach_page_listeners()
+                    pending["scraper"] = self.spawn_scraper(pending["task"])
+                    pending["page"] = slot.pages[i + 1]
+                    self.start_prefetch(pending)
+    
+    def prepare_queue(self, replay_dead_letters: bool = False):
+        """작업 큐 구성 (이전 실행이 중단됐으면 남은 작업부터 이어서 처리)"""
+        if replay_dead_letters:
+            self.task_queue.replay_dead_letters()
+        added = self.task_queue.add_many(self.build_tasks())
+        # 현재 카탈로그/등록 모듈에 없는 작업(이전 실행 잔여분)은 제외
+        stale = [
+            task_id for task_id, task in self.task_queue.tasks.items()
+            if task.business_key not in self.business_by_key or task.module_name not in self.scraper_by_module
+        ]
+        for task_id in stale:
+            del self.task_queue.tasks[task_id]
+        if stale:
+            logger.info(f"  ℹ [Queue] Dropped {len(stale)} tasks for unregistered businesses/modules")
+            self.task_queue.save()
+        logger.info(f"\n[Queue] {added} new tasks, {len(self.task_queue.tasks)} total")
+    
+    async def process_queue(self, context, page):
+        """
+        작업자 max_concurrency개로 큐 처리 (작업자마다 로그인 세션을 복사한 전용 컨텍스트)
+        
+        Args:
+            context: 로그인된 BrowserContext
+            page: 이미 열려 있는 첫 번째 탭
+        """
+        # 전략 통계는 실행 위치가 아니라 출력 경로 아래에 기록
+        strategy_stats = StrategyStats(self.strategy_stats_path)
+        set_strategy_stats(strategy_stats)
+        
+        # 탭 안의 XHR 429/5xx/느린 응답도 감속 신호로 반영
+        rate_limiter = get_rate_limiter()
+        storage_state = await context.storage_state()
+        
+        self.slots = []
+        for slot_id in range(1, self.max_concurrency + 1):
+            if slot_id == 1:
+                slot_context, slot_page = context, page
+            else:
+                slot_context = await context.browser.new_context(storage_state=storage_state)
+                slot_page = await slot_context.new_page()
+            rate_limiter.observe(slot_page)
+            self.slots.append(BrowserSlot(slot_id, slot_context, slot_page, self.recycle_config, on_new_page=rate_limiter.observe))
+        
+        if self.metrics_port:
+            self.metrics.start_http_server(self.metrics_port)
+        try:
+            await asyncio.gather(*(self.worker(slot.slot_id, slot) for slot in self.slots))
+        finally:
+            self.task_queue.flush()
+            strategy_stats.flush()
+            self.metrics.write_textfile(self.metrics_path)
+    
+    def print_summary(self):
+        """(사업장, 모듈)별 결과 요약"""
+        logger.info("\n" + "=" * 70)
+        logger.info("SUMMARY")
+        logger.info("=" * 70)
+        for (business_key, module_name), counts in self.task_queue.summary().items():
+            prefix = f"[{business_key}] " if len(self.businesses) > 1 else ""
+            if counts["done"] == counts["total"]:
+                status = f"✓ Success ({counts['done']}/{counts['total']} dates)"
+            else:
+                status = f"⚠ Partial ({counts['done']}/{counts['total']} dates, {counts['dead']} dead-lettered)"
+            logger.info(f"  {prefix}{module_name}: {status}")
+        if os.path.exists(self.task_queue.dead_letter_path):
+            logger.info(f"  ℹ Failed tasks saved to {self.task_queue.dead_letter_path} (replay with --replay-dead-letters)")
+        get_rate_limiter().print_summary()
+        for slot in self.slots:
+            logger.info(f"  [Watchdog] {slot.summary()}")
+        logger.info(f"  ℹ Metrics saved to {self.metrics_path}")
+        logger.info("=" * 70)
+    
+    async def run(self, replay_dead_letters: bool = False) -> bool:
         """메인 실행 함수"""
-        print("=" * 70)
-        print("Naver SmartPlace Data Collector")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("Naver SmartPlace Data Collector")
+        logger.info(f"Businesses: {', '.join(b.key for b in self.businesses)} (max concurrency: {self.max_concurrency})")
+        logger.info("=" * 70)
+        
+        self.prepare_queue(replay_dead_letters)
         
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=False)
@@ -41,141 +264,57 @@ class NaverPlaceDataCollector:
             
             try:
                 # Step 1: 로그인
-                print("\n[Step 1] Logging in...")
+                logger.info("\n[Step 1] Logging in...")
                 if not await self.login_handler.perform_login(page):
-                    print("  ✗ Login failed")
+                    logger.error("  ✗ Login failed")
                     return False
                 
                 # 베이스 페이지로 이동
                 if not await self.login_handler.navigate_to_base(page):
-                    print("  ⚠ Navigation warning, continuing...")
+                    logger.warning("  ⚠ Navigation warning, continuing...")
                 
-                # Step 2: 각 모듈 실행하여 데이터 수집
-                print("\n[Step 2] Running scrapers...")
-                results = {}
-                
-                for i, scraper_template in enumerate(self.scrapers, 1):
-                    module_name = scraper_template.get_module_name()
-                    start_date = scraper_template.start_date
-                    end_date = scraper_template.end_date
-                    
-                    # 날짜 범위 파싱
-                    try:
-                        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                    except ValueError as e:
-                        print(f"\n✗ Invalid date format in {module_name}: {e}")
-                        results[module_name] = f"✗ Error: Invalid date format"
-                        continue
-                    
-                    # 날짜 범위 생성
-                    current_date = start_dt
-                    date_list = []
-                    while current_date <= end_dt:
-                        date_list.append(current_date.strftime("%Y-%m-%d"))
-                        current_date += timedelta(days=1)
-                    
-                    print(f"\n{'=' * 70}")
-                    print(f"Scraper {i}/{len(self.scrapers)}: {module_name}")
-                    print(f"Date range: {start_date} to {end_date} ({len(date_list)} days)")
-                    print("=" * 70)
-                    
-                    # 각 날짜별로 데이터 수집
-                    date_results = {}
-                    for date_idx, target_date in enumerate(date_list, 1):
-                        print(f"\n[{date_idx}/{len(date_list)}] Processing date: {target_date}")
-                        
-                        try:
-                            # 각 날짜별로 새로운 스크래퍼 인스턴스 생성 (start_date=end_date=target_date)
-                            scraper_class = type(scraper_template)
-                            
-                            # 스크래퍼 클래스에 따라 적절한 인스턴스 생성
-                            if scraper_class == PlaceHourlyInflowGraphScraper:
-                                scraper = PlaceHourlyInflowGraphScraper(
-                                    self.username,
-                                    self.password,
-                                    start_date=target_date,
-                                    end_date=target_date,
-                                    output_base_dir=self.output_base_dir
-                                )
-                            elif scraper_class == PlaceInflowChannelScraper:
-                                scraper = PlaceInflowChannelScraper(
-                                    self.username,
-                                    self.password,
-                                    start_date=target_date,
-                                    end_date=target_date,
-                                    output_base_dir=self.output_base_dir
-                                )
-                            elif scraper_class == PlaceInflowSegmentScraper:
-                                scraper = PlaceInflowSegmentScraper(
-                                    self.username,
-                                    self.password,
-                                    start_date=target_date,
-                                    end_date=target_date,
-                                    output_base_dir=self.output_base_dir
-                                )
-                            else:
-                                # 일반적인 방법으로 생성
-                                scraper = scraper_class(
-                                    self.username,
-                                    self.password,
-                                    start_date=target_date,
-                                    end_date=target_date,
-                                    output_base_dir=self.output_base_dir
-                                )
-                            
-                            # 데이터 수집
-                            data = await scraper.scrape(page)
-                            await scraper.save_results(data)
-                            date_results[target_date] = "✓ Success"
-                            print(f"  ✓ {target_date} completed successfully")
-                            
-                        except Exception as e:
-                            print(f"  ✗ Error on {target_date}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            date_results[target_date] = f"✗ Error: {str(e)}"
-                        
-                        # 날짜 간 대기 시간
-                        if date_idx < len(date_list):
-                            await asyncio.sleep(1)
-                    
-                    # 날짜별 결과 요약
-                    success_count = sum(1 for status in date_results.values() if status.startswith("✓"))
-                    if success_count == len(date_list):
-                        results[module_name] = f"✓ Success ({success_count}/{len(date_list)} dates)"
-                    else:
-                        results[module_name] = f"⚠ Partial ({success_count}/{len(date_list)} dates)"
-                    
-                    # 모듈 간 대기 시간
-                    if i < len(self.scrapers):
-                        await asyncio.sleep(2)
+                # Step 2: 작업 큐 처리
+                logger.info("\n[Step 2] Running scrapers...")
+                await self.process_queue(context, page)
                 
                 # Step 3: 결과 요약
-                print("\n" + "=" * 70)
-                print("SUMMARY")
-                print("=" * 70)
-                for module_name, status in results.items():
-                    print(f"  {module_name}: {status}")
-                print("=" * 70)
+                self.print_summary()
+                
+                # 모든 작업이 끝났으면 큐 비움 (다음 실행은 새로 시작)
+                if self.task_queue.is_finished():
+                    self.task_queue.clear()
+                
+                # Step 4: 결과 품질 검증 (실패 날짜는 큐에 다시 넣어 다음 실행에서 재수집)
+                logger.info("\n[Step 4] Validating results...")
+                try:
+                    OutputValidator(self.output_base_dir, task_queue=self.task_queue).validate(output_modules(list(self.scraper_by_module)))
+                except Exception as e:
+                    logger.warning(f"  ⚠ [Validate] Skipped: {e}")
                 
                 return True
                 
             except Exception as e:
-                print(f"\n✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"\n✗ Error: {e}", exc_info=True)
                 return False
                 
             finally:
-                # Step 4: 세션 종료
-                print("\n[Step 3] Closing browser session...")
+                # Step 5: 세션 종료
+                logger.info("\n[Step 5] Closing browser session...")
                 await browser.close()
-                print("✓ Browser session closed")
+                logger.info("✓ Browser session closed")
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="Naver SmartPlace Data Collector")
+    parser.add_argument("--replay-dead-letters", action="store_true", help="데드레터 작업을 다시 큐에 넣고 실행")
+    parser.add_argument("--log-level", default=None, help="로그 레벨 (DEBUG/INFO/WARNING, 기본: INFO)")
+    parser.add_argument("--metrics-port", type=int, default=None, help="실행 중 /metrics를 노출할 로컬 포트 (기본: 파일만 저장)")
+    args = parser.parse_args()
+    
+    # 콘솔 + JSON lines 로그 (data/naverplace/_logs/run.jsonl)
+    configure_logging(args.log_level, DEFAULT_LOG_PATH)
+    
     # 자격증명 로드
     username, password = load_credentials()
     
@@ -183,8 +322,11 @@ def main():
     start_date = "2025-11-15"
     end_date = "2025-11-18"
     
-    # 데이터 수집기 생성
-    collector = NaverPlaceDataCollector(username, password)
+    # 사업장 카탈로그 로드 (../data/business_catalog.json, 없으면 기본 사업장)
+    businesses = load_business_catalog()
+    
+    # 데이터 수집기 생성 (사업장별 병렬 실행, 동시 탭 수 상한 3)
+    collector = NaverPlaceDataCollector(username, password, businesses=businesses, max_concurrency=3, metrics_port=args.metrics_port)
     
     # # 스크래퍼 등록 (start_date, end_date 파라미터 포함)
     # collector.register_scraper(
@@ -245,7 +387,7 @@ def main():
             end_date="2025-12-15"
         )
     )
-    asyncio.run(collector.run())
+    asyncio.run(collector.run(replay_dead_letters=args.replay_dead_letters))
 
 if __name__ == "__main__":
     main()
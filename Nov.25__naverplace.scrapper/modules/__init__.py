@@ -2,17 +2,60 @@
 네이버 스마트플레이스 스크래퍼 모듈
 """
 
-from .base_scraper import BaseScraper
-from .place_hourly_inflow_graph import PlaceHourlyInflowGraphScraper
-from .place_inflow_channel import PlaceInflowChannelScraper
-from .place_inflow_segment import PlaceInflowSegmentScraper
-from .smartcall_call_statistics import SmartcallCallStatisticsScraper
-from .smartcall_top_media import SmartcallTopMediaScraper
-from .smartcall_top_keyword import SmartcallTopKeywordScraper
-from .booking_trend_chart import BookingTrendChartScraper
+import importlib
+
+from .run_log import get_logger, configure_logging, task_context
+from .run_metrics import CollectionMetrics, get_metrics
+from .business_catalog import BusinessProfile, DEFAULT_BUSINESS, load_business_catalog
+from .rate_limiter import HostRateLimiter, get_rate_limiter
+from .task_queue import TaskQueue, CollectionTask
+from .browser_watchdog import BrowserSlot, RecycleConfig
+from .strategy_stats import StrategyStats, get_strategy_stats, set_strategy_stats
+from .selector_resolver import SelectorResolver, get_selector_resolver
+
+# Playwright/pandas를 쓰는 스크래퍼는 처음 접근할 때 import
+# (SMLOG 스크립트, pipeline 등이 modules.rate_limiter/run_log만 가져갈 때 스크래퍼 전체를 로드하지 않도록)
+_LAZY_EXPORTS = {
+    'BaseScraper': '.base_scraper',
+    'PlaceHourlyInflowGraphScraper': '.place_hourly_inflow_graph',
+    'PlaceInflowChannelScraper': '.place_inflow_channel',
+    'PlaceInflowSegmentScraper': '.place_inflow_segment',
+    'SmartcallCallStatisticsScraper': '.smartcall_call_statistics',
+    'SmartcallTopMediaScraper': '.smartcall_top_media',
+    'SmartcallTopKeywordScraper': '.smartcall_top_keyword',
+    'BookingTrendChartScraper': '.booking_trend_chart',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
+    'get_logger',
+    'configure_logging',
+    'task_context',
+    'CollectionMetrics',
+    'get_metrics',
     'BaseScraper', 
+    'BusinessProfile',
+    'DEFAULT_BUSINESS',
+    'load_business_catalog',
+    'HostRateLimiter',
+    'get_rate_limiter',
+    'TaskQueue',
+    'CollectionTask',
+    'BrowserSlot',
+    'RecycleConfig',
+    'StrategyStats',
+    'get_strategy_stats',
+    'set_strategy_stats',
+    'SelectorResolver',
+    'get_selector_resolver',
     'PlaceHourlyInflowGraphScraper', 
     'PlaceInflowChannelScraper', 
     'PlaceInflowSegmentScraper',
@@ -4,24 +4,212 @@
 모든 스크래퍼 모듈의 공통 인터페이스
 """
 
+import asyncio
 import os
 import json
+import time
 import pandas as pd
 from datetime import datetime
 from abc import ABC, abstractmethod
 from playwright.async_api import Page
+from .business_catalog import BusinessProfile, DEFAULT_BUSINESS
+from .rate_limiter import get_rate_limiter
+from .strategy_stats import get_strategy_stats
+from .run_log import get_logger
+from .run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
 
 
 class BaseScraper(ABC):
     """모든 스크래퍼의 베이스 클래스"""
     
-    def __init__(self, username: str, password: str, start_date: str = None, end_date: str = None, output_base_dir: str = "data/naverplace"):
+    # 빈 기간 감지 (모듈별 선언, 비어 있으면 감지하지 않음)
+    # empty_state_texts: 조회 기간에 데이터가 없을 때 페이지에 표시되는 문구
+    # data_ready_selector: 데이터가 있을 때만 나타나는 요소 (있으면 빈 기간으로 보지 않음)
+    # empty_state_anchor: 모듈 섹션 안의 요소 - 문구는 이 요소가 속한 섹션(SectionBox) 안에서만 찾음
+    #   (같은 페이지의 다른 모듈 섹션이 비어 있어도 영향 없음, 요소가 없으면 빈 기간으로 단정하지 않음)
+    empty_state_texts = ()
+    data_ready_selector = None
+    empty_state_anchor = None
+    
+    def __init__(self, username: str, password: str, start_date: str = None, end_date: str = None, output_base_dir: str = "data/naverplace", business: BusinessProfile = None):
         self.username = username
         self.password = password
         self.start_date = start_date
         self.end_date = end_date
         self.output_base_dir = output_base_dir
+        self.business = business or DEFAULT_BUSINESS
         self.network_responses = []
+        self.rate_limiter = get_rate_limiter()
+        self._page_listeners = []  # (page, event, handler) - detach_page_listeners()에서 제거
+        self._prefetched_page = None  # prefetch()로 stats_url을 미리 열어둔 탭
+    
+    def add_page_listener(self, page: Page, event: str, handler):
+        """탭에 이벤트 리스너 등록 (작업이 끝나면 detach_page_listeners로 제거)"""
+        page.on(event, handler)
+        self._page_listeners.append((page, event, handler))
+    
+    def detach_page_listeners(self):
+        """이 스크래퍼가 등록한 리스너 모두 제거"""
+        for page, event, handler in self._page_listeners:
+            try:
+                page.remove_listener(event, handler)
+            except Exception:
+                pass
+        self._page_listeners = []
+    
+    async def goto(self, page: Page, url: str, **kwargs):
+        """호스트별 레이트 리미터를 거쳐 페이지 이동"""
+        return await self.rate_limiter.goto(page, url, **kwargs)
+    
+    async def prepare_page(self, page: Page):
+        """stats_url 이동 직전 준비 (네트워크 리스너 등록 등) - 필요한 모듈에서 오버라이드"""
+        pass
+    
+    async def open_stats_page(self, page: Page, settle_seconds: float = 5):
+        """
+        stats_url로 이동 후 로딩 대기
+        prefetch()로 이 탭에 이미 열어둔 경우 이동/대기 생략
+        """
+        if self._prefetched_page is page:
+            self._prefetched_page = None
+            logger.info(f"  ✓ Using prefetched page: {self.stats_url}")
+            return
+        await self.prepare_page(page)
+        logger.info(f"  Navigating to: {self.stats_url}")
+        await self.goto(page, self.stats_url, wait_until="networkidle")
+        await asyncio.sleep(settle_seconds)  # 페이지 로딩 대기
+        get_metrics().sleep_seconds.inc(settle_seconds, reason="settle")
+    
+    async def prefetch(self, page: Page):
+        """다음 작업용 탭에 stats_url을 미리 열어둠 (파이프라인 실행 시 이전 작업과 동시에 진행)"""
+        await self.open_stats_page(page)
+        self._prefetched_page = page
+    
+    async def wait_for_data_ready(self, page: Page, timeout: int = 10000) -> bool:
+        """데이터 요소(data_ready_selector)가 나타날 때까지 대기 (시간 초과 시 False)"""
+        if not self.data_ready_selector:
+            return True
+        try:
+            await page.wait_for_selector(self.data_ready_selector, timeout=timeout)
+            return True
+        except Exception:
+            return False
+    
+    async def is_empty_period(self, page: Page) -> bool:
+        """모듈 섹션이 빈 기간 상태인지 확인 (섹션 안에 문구가 보이고 데이터 요소가 없을 때)"""
+        if not self.empty_state_texts:
+            return False
+        try:
+            return await page.evaluate(
+                """
+                ([texts, readySelector, anchorSelector]) => {
+                    let scope = document.body;
+                    if (anchorSelector) {
+                        const anchor = document.querySelector(anchorSelector);
+                        if (!anchor) {
+                            return false;
+                        }
+                        scope = anchor.closest("[class*='SectionBox_root']") || anchor;
+                    }
+                    if (!scope || (readySelector && scope.querySelector(readySelector))) {
+                        return false;
+                    }
+                    const scopeText = scope.innerText || '';
+                    return texts.some(text => scopeText.includes(text));
+                }
+                """,
+                [list(self.empty_state_texts), self.data_ready_selector, self.empty_state_anchor]
+            )
+        except Exception as e:
+            logger.warning(f"  ⚠ [EmptyState] Check failed: {e}")
+            return False
+    
+    async def empty_data(self, page: Page) -> dict:
+        """빈 기간일 때 기록할 모듈별 데이터 키 (0 또는 빈 목록) - 필요한 모듈에서 오버라이드"""
+        return {}
+    
+    async def check_empty_period(self, page: Page) -> dict:
+        """
+        데이터 대기(wait_for_data_ready, 차트 로드 대기)가 시간 초과된 뒤 호출:
+        빈 기간이면 추출 전략을 모두 건너뛰고 바로 기록할 결과 반환
+        
+        Returns:
+            dict: 빈 결과 ("empty_period": True) 또는 None (데이터 있음)
+        """
+        if not await self.is_empty_period(page):
+            return None
+        logger.info(f"  ℹ [EmptyState] No data for {self.start_date} ~ {self.end_date}, skipping extraction")
+        result = {
+            "url": self.stats_url,
+            "scraped_at": datetime.now().isoformat(),
+            "empty_period": True,
+        }
+        result.update(await self.empty_data(page))
+        result["page_title"] = await page.title()
+        return result
+    
+    async def run_strategies(self, strategies: list, is_success=None, stats_key: str = None):
+        """
+        추출 전략을 과거에 가장 빠르게 성공한 순서대로 시도 (실패했을 때만 다음 전략으로)
+        
+        Args:
+            strategies: [(전략 이름, 인자 없는 코루틴 함수), ...] - 기본 순서
+            is_success: 결과 성공 판정 함수 (기본: 결과가 비어 있지 않으면 성공)
+            stats_key: 통계 구분 키 (기본: 모듈 이름)
+        
+        Returns:
+            tuple: (성공한 전략 이름 또는 None, 마지막 결과)
+        """
+        stats = get_strategy_stats()
+        key = stats_key or self.get_module_name()
+        functions = dict(strategies)
+        order = stats.order(key, [name for name, _ in strategies])
+        if order != [name for name, _ in strategies]:
+            logger.info(f"  ℹ [Strategy] Learned order for {key}: {' → '.join(order)}")
+        
+        result = None
+        for name in order:
+            started = time.monotonic()
+            try:
+                result = await functions[name]()
+            except Exception as e:
+                logger.warning(f"  ⚠ [Strategy] {name} raised: {e}")
+                result = None
+            elapsed = time.monotonic() - started
+            success = is_success(result) if is_success else bool(result)
+            stats.record(key, name, success, elapsed)
+            if success:
+                logger.info(f"  ✓ [Strategy] {name} succeeded ({elapsed:.1f}s)")
+                return name, result
+            logger.warning(f"  ⚠ [Strategy] {name} found no data, falling back...")
+        return None, result
+    
+    def extra_init_kwargs(self) -> dict:
+        """spawn 시 그대로 넘길 모듈별 추가 생성자 인자 (필요한 모듈에서 오버라이드)"""
+        return {}
+    
+    def spawn(self, start_date: str, end_date: str, business: BusinessProfile = None, output_base_dir: str = None):
+        """
+        템플릿 스크래퍼로부터 날짜/사업장만 바꾼 새 인스턴스 생성
+        
+        Args:
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            business: 대상 사업장 (기본: 템플릿과 동일)
+            output_base_dir: 출력 경로 (기본: 템플릿과 동일)
+        """
+        return type(self)(
+            self.username,
+            self.password,
+            start_date=start_date,
+            end_date=end_date,
+            output_base_dir=output_base_dir or self.output_base_dir,
+            business=business or self.business,
+            **self.extra_init_kwargs()
+        )
     
     @abstractmethod
     async def scrape(self, page: Page) -> dict:
@@ -78,45 +266,45 @@ class BaseScraper(ABC):
         
         # CSV 저장 (다양한 데이터 키 지원)
         csv_data = None
-        print(f"\n[Save Results] Checking data keys: {list(data.keys())}")
+        logger.debug("\n[Save Results] Checking data keys: %s", list(data.keys()))
         
         if data.get("hover_data"):
             csv_data = data["hover_data"]
-            print(f"  ✓ Found hover_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found hover_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("time_based_data"):
             csv_data = data["time_based_data"]
-            print(f"  ✓ Found time_based_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found time_based_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("channel_data"):
             csv_data = data["channel_data"]
-            print(f"  ✓ Found channel_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found channel_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("segment_data"):
             csv_data = data["segment_data"]
-            print(f"  ✓ Found segment_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found segment_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("call_statistics_data") is not None:
             csv_data = data["call_statistics_data"]
-            print(f"  ✓ Found call_statistics_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found call_statistics_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
             if isinstance(csv_data, list):
                 if len(csv_data) > 0:
-                    print(f"    First row sample: {csv_data[0]}")
+                    logger.debug("    First row sample: %s", csv_data[0])
                 else:
-                    print(f"    ⚠ Warning: call_statistics_data is empty list")
+                    logger.warning(f"    ⚠ Warning: call_statistics_data is empty list")
             else:
-                print(f"    ⚠ Warning: call_statistics_data is not a list: {type(csv_data)}")
+                logger.warning(f"    ⚠ Warning: call_statistics_data is not a list: {type(csv_data)}")
         elif data.get("top_media_data"):
             csv_data = data["top_media_data"]
-            print(f"  ✓ Found top_media_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found top_media_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("top_keyword_data"):
             csv_data = data["top_keyword_data"]
-            print(f"  ✓ Found top_keyword_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found top_keyword_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         elif data.get("combined_data"):
             csv_data = data["combined_data"]
-            print(f"  ✓ Found combined_data: {len(csv_data) if isinstance(csv_data, list) else 'N/A'} items")
+            logger.debug("  ✓ Found combined_data: %s items", len(csv_data) if isinstance(csv_data, list) else 'N/A')
         else:
-            print(f"  ⚠ No CSV data key found in data")
+            logger.warning(f"  ⚠ No CSV data key found in data")
         
         # csv_data가 None이 아니고 리스트인 경우 CSV 저장 (빈 리스트도 포함)
         if csv_data is not None and isinstance(csv_data, list):
-            print(f"  [CSV Save] csv_data type: {type(csv_data)}, length: {len(csv_data)}")
+            logger.debug("  [CSV Save] csv_data type: %s, length: %s", type(csv_data), len(csv_data))
             
             try:
                 # event_dt 컬럼 추가 (YYYY-MM-DD 형식)
@@ -128,37 +316,37 @@ class BaseScraper(ABC):
                     if isinstance(row, dict):
                         row["event_dt"] = target_date
                     else:
-                        print(f"  ⚠ Warning: row is not a dict: {type(row)}, value: {row}")
+                        logger.warning(f"  ⚠ Warning: row is not a dict: {type(row)}, value: {row}")
                 
                 df = pd.DataFrame(csv_data)
-                print(f"  [DataFrame] Created DataFrame with {len(df)} rows, {len(df.columns)} columns")
+                logger.debug("  [DataFrame] Created DataFrame with %s rows, %s columns", len(df), len(df.columns))
                 if len(df.columns) > 0:
-                    print(f"    Columns: {list(df.columns)}")
+                    logger.debug("    Columns: %s", list(df.columns))
                 
                 # CSV 파일명: 모듈명__시작일_종료일.csv
                 csv_filename = f"{module_name}{date_suffix}.csv"
                 csv_path = os.path.join(output_dir, csv_filename)
                 df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-                print(f"✓ CSV saved: {csv_path}")
+                get_metrics().record_output(module_name, csv_path, rows=len(df))
+                logger.info(f"✓ CSV saved: {csv_path}")
                 
                 # 데이터 요약 출력
                 if len(csv_data) > 0:
                     self._print_data_summary(csv_data)
                 else:
-                    print(f"  ⚠ Warning: CSV file created but contains no data rows")
+                    logger.warning(f"  ⚠ Warning: CSV file created but contains no data rows")
             except Exception as e:
-                print(f"  ✗ Error saving CSV: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"  ✗ Error saving CSV: {e}", exc_info=True)
         else:
-            print(f"  ⚠ No CSV data to save (csv_data is {csv_data}, type: {type(csv_data)})")
+            logger.warning(f"  ⚠ No CSV data to save (csv_data is {csv_data}, type: {type(csv_data)})")
         
         # JSON 저장 (CSV와 동일한 파일명 형식 사용)
         json_filename = f"{module_name}{date_suffix}.json"
         json_path = os.path.join(output_dir, json_filename)
         with open(json_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"✓ JSON saved: {json_path}")
+        get_metrics().record_output(module_name, json_path)
+        logger.info(f"✓ JSON saved: {json_path}")
     
     def _print_data_summary(self, data: list):
         """
@@ -174,13 +362,13 @@ class BaseScraper(ABC):
         if isinstance(data[0], dict) and "hour" in data[0]:
             valid_data = [d for d in data if d.get("count") is not None]
             if valid_data:
-                print(f"\n  Data Summary:")
-                print(f"    - Total time points with data: {len(valid_data)}")
+                logger.info(f"\n  Data Summary:")
+                logger.info(f"    - Total time points with data: {len(valid_data)}")
                 hours = [d['hour'] for d in valid_data if d.get('hour') is not None]
                 if hours:
-                    print(f"    - Hour range: {min(hours)}시 ~ {max(hours)}시")
+                    logger.info(f"    - Hour range: {min(hours)}시 ~ {max(hours)}시")
                 counts = [d['count'] for d in valid_data if d.get('count') is not None]
                 if counts:
                     total_count = sum(counts)
-                    print(f"    - Total count: {total_count}회")
+                    logger.info(f"    - Total count: {total_count}회")
 
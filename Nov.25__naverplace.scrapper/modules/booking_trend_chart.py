@@ -6,43 +6,256 @@
 import asyncio
 import json
 import re
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import datetime
+import pandas as pd
 from playwright.async_api import Page
 from .base_scraper import BaseScraper
+from .business_catalog import BusinessProfile
+from .strategy_stats import get_strategy_stats
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 체크박스 피쳐명 -> reports API metric 매핑 (체크박스 변경 시 API 요청이 발생하지 않으므로 metric으로 필터링)
+FEATURE_METRIC_MAP = {
+    '신청': 'REQUESTED',
+    '확정': 'CONFIRMED',
+    '취소': 'CANCELLED',  # 모든 취소 타입 포함
+    '예약자 취소': 'CANCELLED',
+    '사업자 취소': 'CANCELLED',
+    '미확정 자동 취소': 'CANCELLED',
+    '완료': 'ENDED',
+    '변경': 'CHANGED',
+    '노쇼': 'NOSHOW'
+}
+
+# 취소 세부 타입 피쳐 -> cancelledType 매칭 키워드
+CANCELLED_TYPE_MAP = {
+    '예약자 취소': ['예약자 취소', '고객 취소', '예약자'],
+    '사업자 취소': ['사업자 취소', '사업자'],
+    '미확정 자동 취소': ['사업자 미확정 취소', '미확정']
+}
+
+REPORT_BUCKETS = ['day_trend', 'bookingCo', 'cancelled', 'price_sum']
+
+# 값 필드 탐색 시 제외할 키
+NON_VALUE_KEYS = {'date', 'dateLabel', 'label', 'day', 'feature', 'dateStr', 'day_trend', 'cancelledType', 'metric', 'bizItemId', 'bizItemName', 'bizItemOrder', 'bizItemRegDateTime'}
+
+
+def detect_report_bucket(url: str) -> str:
+    """reports API URL에서 bucket 이름 추출"""
+    for bucket in REPORT_BUCKETS:
+        if bucket in url:
+            return bucket
+    return 'unknown'
+
+
+def report_item_to_point(item: dict) -> tuple:
+    """reports result 항목에서 (날짜 라벨, 값) 추출"""
+    date_value = item.get('day_trend') or item.get('date') or item.get('dateLabel') or item.get('label') or item.get('day') or item.get('dateStr')
+    value = item.get('value') or item.get('count') or item.get('data') or item.get('amount') or item.get('total') or item.get('bookingCount_sum')
+    if value is None:
+        for key, val in item.items():
+            if key not in NON_VALUE_KEYS and isinstance(val, (int, float)):
+                value = val
+                break
+    return date_value, value
+
+
+def parse_chart_dates(labels: pd.Series, end_dt: pd.Timestamp) -> pd.Series:
+    """차트 라벨 컬럼을 날짜로 일괄 변환 (파싱 불가 시 NaT)
+    
+    지원 형식: '2025-12-15', '2025.12.15', '20251215', '12월 15일', '12.15' 등.
+    연도가 없는 라벨은 end_dt 연도를 쓰고, end_dt보다 뒤가 되면 전년도로 본다 (12월→1월 구간).
+    """
+    text = labels.astype("string").str.strip()
+    
+    compact = text.str.extract(r"^(?P<y>\d{4})(?P<m>\d{2})(?P<d>\d{2})$")
+    loose = text.str.extract(r"(?:(?P<y>\d{4})\D+)?(?P<m>\d{1,2})\D+(?P<d>\d{1,2})")
+    parts = compact.fillna(loose).apply(pd.to_numeric, errors="coerce")
+    
+    year_missing = parts["y"].isna()
+    parts["y"] = parts["y"].fillna(end_dt.year)
+    dates = pd.to_datetime(
+        {"year": parts["y"], "month": parts["m"], "day": parts["d"]},
+        errors="coerce"
+    )
+    rolled_back = year_missing & (dates > end_dt + pd.Timedelta(days=31))
+    dates = dates.mask(rolled_back, dates - pd.DateOffset(years=1))
+    return dates
+
+
+class ReportResponseIndex:
+    """캡처된 reports API 응답을 bucket/metric 기준으로 한 번만 색인
+    
+    응답마다 metric별 (라벨, 값) 포인트 목록을 만들고, CANCELLED는 취소 세부 타입별로 미리 분리해 둔다.
+    피쳐별 시리즈는 색인 조회만으로 구한다.
+    """
+    
+    def __init__(self, responses: list):
+        # bizItemId bucket 제외 (비즈니스 아이템 목록이므로 차트 데이터 아님)
+        self.responses = [
+            r for r in responses
+            if '/reports' in r.get('url', '') and r.get('data') and 'bizItemId' not in r.get('url', '')
+        ]
+        self.by_bucket = defaultdict(list)  # bucket -> [응답 위치]
+        self.entries = []  # 응답 위치 -> {"bucket", "url", "all", "by_metric", "cancelled"}
+        
+        for position, response in enumerate(self.responses):
+            url = response.get('url', '')
+            bucket = detect_report_bucket(url)
+            api_data = response.get('data')
+            result_list = api_data.get('result') if isinstance(api_data, dict) else None
+            
+            entry = {
+                "bucket": bucket,
+                "url": url,
+                "all": [],
+                "by_metric": defaultdict(list),
+                "cancelled": defaultdict(list),
+                "generic": None,
+            }
+            
+            if isinstance(result_list, list):
+                for item in result_list:
+                    if isinstance(item, dict):
+                        point = report_item_to_point(item)
+                        entry["all"].append(point)
+                        metric = item.get('metric', '')
+                        entry["by_metric"][metric].append(point)
+                        if metric == 'CANCELLED':
+                            cancelled_type = item.get('cancelledType', '')
+                            for feature_name, expected_types in CANCELLED_TYPE_MAP.items():
+                                # cancelledType이 비어 있으면 모든 세부 타입에 포함 (기존 필터 규칙)
+                                if not cancelled_type or any(t in cancelled_type for t in expected_types):
+                                    entry["cancelled"][feature_name].append(point)
+                    elif isinstance(item, (int, float)):
+                        entry["all"].append((None, item))
+            else:
+                entry["generic"] = self._parse_generic_payload(api_data)
+            
+            self.entries.append(entry)
+            self.by_bucket[bucket].append(position)
+    
+    @staticmethod
+    def _parse_generic_payload(api_data) -> list:
+        """result 배열이 없는 응답 구조 처리 ({dates, data} / {labels, datasets} / 배열)"""
+        if isinstance(api_data, dict) and 'dates' in api_data and 'data' in api_data:
+            return list(zip(api_data.get('dates', []), api_data.get('data', [])))
+        if isinstance(api_data, dict) and 'labels' in api_data and 'datasets' in api_data:
+            datasets = api_data.get('datasets', [])
+            if datasets:
+                return list(zip(api_data.get('labels', []), datasets[0].get('data', [])))
+            return []
+        if isinstance(api_data, list):
+            points = []
+            for item in api_data:
+                if isinstance(item, dict):
+                    points.append((
+                        item.get('date') or item.get('label') or item.get('dateLabel'),
+                        item.get('value') or item.get('count') or item.get('data'),
+                    ))
+                else:
+                    points.append((None, item))
+            return points
+        return []
+    
+    def _candidates(self, entry: dict, feature_name: str) -> list:
+        """응답 하나에서 피쳐에 해당하는 포인트 목록"""
+        if feature_name in CANCELLED_TYPE_MAP:
+            return entry["cancelled"].get(feature_name, [])
+        expected_metric = FEATURE_METRIC_MAP.get(feature_name)
+        if expected_metric:
+            return entry["by_metric"].get(expected_metric, [])
+        return entry["all"]
+    
+    def bucket_metrics(self) -> dict:
+        """디버깅용 bucket -> metric 목록"""
+        return {
+            entry["bucket"]: sorted(m for m in entry["by_metric"].keys() if m)
+            for entry in self.entries
+        }
+    
+    def series_for(self, feature_name: str = None) -> list:
+        """피쳐의 포인트 리스트 (가장 많은 매칭 항목을 가진 응답 사용)"""
+        if not self.entries:
+            return []
+        
+        best_points = None
+        if feature_name in FEATURE_METRIC_MAP:
+            best_count = 0
+            for entry in self.entries:
+                if entry["generic"] is not None:
+                    continue
+                points = self._candidates(entry, feature_name)
+                if len(points) > best_count:
+                    best_count = len(points)
+                    best_points = points
+        
+        if best_points is None:
+            # 매칭 응답이 없으면 첫 번째 응답을 사용 (기존 동작)
+            first = self.entries[0]
+            best_points = first["generic"] if first["generic"] is not None else self._candidates(first, feature_name)
+        
+        return [
+            {
+                "point_index": i,
+                "label": label,
+                "value": value,
+                "feature": feature_name,
+                "source": "api"
+            }
+            for i, (label, value) in enumerate(best_points)
+        ]
 
 
 class BookingTrendChartScraper(BaseScraper):
     """예약 트렌드 차트 데이터 스크래퍼"""
     
-    def __init__(self, username: str, password: str, start_date: str = "2025-12-15", end_date: str = "2025-12-21", output_base_dir: str = "data/naverplace"):
-        super().__init__(username, password, start_date, end_date, output_base_dir)
+    empty_state_texts = ("조회 기간에 수집된 데이터가 없습니다",)
+    data_ready_selector = "[class*='StatisticsIndicators__chart-wrap'] canvas"
+    empty_state_anchor = "[class*='StatisticsIndicators__statistic-contents-in'] > div:nth-child(3)"  # 추이 차트 패널
+    
+    def __init__(self, username: str, password: str, start_date: str = "2025-12-15", end_date: str = "2025-12-21", output_base_dir: str = "data/naverplace", business: BusinessProfile = None, output_format: str = "wide"):
+        super().__init__(username, password, start_date, end_date, output_base_dir, business)
+        # combined_data 형식: "wide" (날짜별 1행) 또는 "long" (날짜×피쳐별 1행)
+        self.output_format = output_format
         # URL 동적 생성 (period=1은 일별, period=2는 주별)
         period = 1  # 일별 데이터
         self.stats_url = (
-            f"https://partner.booking.naver.com/bizes/603738/statistics/booking"
+            f"https://partner.booking.naver.com/bizes/{self.business.booking_business_id}/statistics/booking"
             f"?endDate={end_date}&period={period}&startDate={start_date}"
         )
         self.network_responses = []
+        self._response_index = None
+        self._response_index_key = None
     
     def get_module_name(self) -> str:
         return "booking_trend_chart"
     
+    def extra_init_kwargs(self) -> dict:
+        return {"output_format": self.output_format}
+    
     async def wait_for_chart_load(self, page: Page, timeout: int = 15000) -> bool:
         """차트가 로드될 때까지 대기"""
-        print("\n[Chart] Waiting for chart to load...")
+        logger.info("\n[Chart] Waiting for chart to load...")
         try:
             chart_selector = "#app > div > div.BaseLayout__container__L0brn > div.BaseLayout__contents__k3cMt > div > div > div.StatisticsIndicators__statistic-contents-out-scroll__MoPQ5 > div.StatisticsIndicators__statistic-contents-in__sFa1a > div:nth-child(3) > div.panel-body > div > div > div.StatisticsIndicators__chart-wrap__4UCu\\+.StatisticsIndicators__chart-wrap-m__b8qFo"
             await page.wait_for_selector(chart_selector, timeout=timeout)
-            print("  ✓ Chart container found")
+            logger.info("  ✓ Chart container found")
             await asyncio.sleep(3)  # 차트 렌더링 대기
             return True
         except Exception as e:
-            print(f"  ⚠ Chart loading timeout or error: {e}")
+            logger.warning(f"  ⚠ Chart loading timeout or error: {e}")
             return False
     
     async def get_checkbox_features(self, page: Page) -> list:
         """체크박스 그룹에서 각 피쳐명 추출"""
-        print("\n[Checkboxes] Extracting checkbox features...")
+        logger.info("\n[Checkboxes] Extracting checkbox features...")
         
         features = []
         
@@ -89,22 +302,94 @@ class BookingTrendChartScraper(BaseScraper):
             
             if js_result.get('features'):
                 features = js_result['features']
-                print(f"  ✓ Found {len(features)} checkbox features")
+                logger.info(f"  ✓ Found {len(features)} checkbox features")
                 for i, feat in enumerate(features, 1):
                     status = "✓" if feat.get('checked') else "○"
-                    print(f"    {i}. {status} {feat.get('feature')}")
+                    logger.debug("    %s. %s %s", i, status, feat.get('feature'))
             else:
-                print("  ⚠ No checkbox features found")
+                logger.warning("  ⚠ No checkbox features found")
             
             return features
             
         except Exception as e:
-            print(f"  ✗ Error extracting checkbox features: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting checkbox features: {e}", exc_info=True)
             return features
     
-    async def toggle_checkbox(self, page: Page, checkbox_index: int) -> bool:
+    async def arm_chart_update_watcher(self, page: Page, timeout: float = 5.0) -> dict:
+        """현재 차트 props.data 참조를 기록하고, 참조가 바뀌면 resolve되는 Promise를 페이지에 설치
+        
+        Promise는 window.__bookingChartWatch에 저장되며 timeout 초가 지나면 {updated: false}로 resolve된다.
+        """
+        return await page.evaluate(
+            """
+            (timeoutMs) => {
+                const findChartProps = () => {
+                    const canvas = document.querySelector('[class*="chart-wrap"] canvas') ||
+                                  document.querySelector('.panel-body canvas') ||
+                                  document.querySelector('canvas');
+                    if (!canvas) return [];
+                    
+                    const fiberKey = Object.keys(canvas).find(k => k.startsWith('__reactFiber'));
+                    if (!fiberKey) return [];
+                    
+                    const isChartProps = (props) => props && Array.isArray(props.data) && props.data.length > 0 &&
+                        Array.isArray(props.data[0]) && typeof props.data[0][0] === 'string';
+                    
+                    let fiber = canvas[fiberKey];
+                    let depth = 0;
+                    while (fiber && depth < 30) {
+                        // DOM 노드의 fiber가 alternate일 수 있으므로 양쪽 모두 확인
+                        const found = [fiber.memoizedProps, fiber.alternate && fiber.alternate.memoizedProps].filter(isChartProps);
+                        if (found.length > 0) return found;
+                        fiber = fiber.return;
+                        depth++;
+                    }
+                    return [];
+                };
+                
+                const initialData = new Set(findChartProps().map(props => props.data));
+                const deadline = performance.now() + timeoutMs;
+                const schedule = (fn) => document.hidden ? setTimeout(fn, 50) : requestAnimationFrame(fn);
+                
+                window.__bookingChartWatch = new Promise((resolve) => {
+                    const check = () => {
+                        const changed = findChartProps().find(props => !initialData.has(props.data));
+                        if (changed) {
+                            resolve({
+                                updated: true,
+                                seriesCount: changed.data.length,
+                                firstSeriesFeature: changed.data[0][0],
+                                firstSeriesLength: changed.data[0].length,
+                                labelsLength: changed.label?.length || 0
+                            });
+                            return;
+                        }
+                        if (performance.now() > deadline) {
+                            resolve({ updated: false, timeout: true });
+                            return;
+                        }
+                        schedule(check);
+                    };
+                    schedule(check);
+                });
+                
+                return { armed: true, hadData: initialData.size > 0 };
+            }
+            """,
+            int(timeout * 1000)
+        )
+    
+    async def wait_for_chart_update(self, page: Page, timeout: float = 5.0) -> dict:
+        """arm_chart_update_watcher로 설치한 Promise 하나만 await (차트 재렌더링 시점에 바로 반환)"""
+        try:
+            return await asyncio.wait_for(
+                page.evaluate("() => window.__bookingChartWatch || { updated: false, error: 'watcher not armed' }"),
+                timeout=timeout + 1
+            )
+        except Exception as e:
+            return {"updated": False, "error": str(e)}
+    
+    async def toggle_checkbox(self, page: Page, checkbox_index: int, update_timeout: float = 5.0) -> bool:
         """특정 체크박스를 활성화하고 차트 업데이트 대기"""
         try:
             # label을 클릭하는 방식으로 변경 (input이 disabled일 수 있음)
@@ -112,44 +397,9 @@ class BookingTrendChartScraper(BaseScraper):
             
             # label이 나타날 때까지 대기
             await page.wait_for_selector(label_selector, timeout=10000)
-            await asyncio.sleep(1)
             
-            # 체크박스 클릭 전 차트 데이터 스냅샷 (업데이트 확인용)
-            chart_snapshot_before = await page.evaluate(
-                """
-                () => {
-                    // CanvasJS 차트 인스턴스 찾기
-                    if (window.CanvasJS && window.CanvasJS.Chart) {
-                        const charts = window.CanvasJS.Chart.charts || [];
-                        if (charts.length > 0) {
-                            const chart = charts[0];
-                            if (chart.options && chart.options.data) {
-                                return {
-                                    found: true,
-                                    dataPointsCount: chart.options.data[0]?.dataPoints?.length || 0,
-                                    dataHash: JSON.stringify(chart.options.data).substring(0, 100)
-                                };
-                            }
-                        }
-                    }
-                    // Chart.js 인스턴스 찾기
-                    if (window.Chart && window.Chart.instances) {
-                        const chartIds = Object.keys(window.Chart.instances);
-                        if (chartIds.length > 0) {
-                            const chart = window.Chart.instances[chartIds[0]];
-                            if (chart.data && chart.data.datasets) {
-                                return {
-                                    found: true,
-                                    dataPointsCount: chart.data.datasets[0]?.data?.length || 0,
-                                    dataHash: JSON.stringify(chart.data).substring(0, 100)
-                                };
-                            }
-                        }
-                    }
-                    return { found: false };
-                }
-                """
-            )
+            # 클릭 전 차트 props.data 참조를 기록하는 watcher 설치 (업데이트 확인용)
+            await self.arm_chart_update_watcher(page, update_timeout)
             
             # JavaScript로 직접 클릭 (더 안정적)
             clicked = await page.evaluate(
@@ -165,8 +415,6 @@ class BookingTrendChartScraper(BaseScraper):
                         return false;
                     }}
                     
-                    const wasChecked = input.checked;
-                    
                     // label 클릭
                     label.click();
                     
@@ -181,68 +429,20 @@ class BookingTrendChartScraper(BaseScraper):
             )
             
             if clicked:
-                # 차트 업데이트 대기 (CanvasJS 방식: render() 호출 확인 또는 데이터 변경 감지)
-                await asyncio.sleep(1)  # 초기 대기
-                
-                # 차트가 업데이트될 때까지 대기 (최대 5초)
-                for attempt in range(10):
-                    chart_snapshot_after = await page.evaluate(
-                        """
-                        () => {
-                            // CanvasJS 차트 인스턴스 찾기
-                            if (window.CanvasJS && window.CanvasJS.Chart) {
-                                const charts = window.CanvasJS.Chart.charts || [];
-                                if (charts.length > 0) {
-                                    const chart = charts[0];
-                                    if (chart.options && chart.options.data) {
-                                        return {
-                                            found: true,
-                                            dataPointsCount: chart.options.data[0]?.dataPoints?.length || 0,
-                                            dataHash: JSON.stringify(chart.options.data).substring(0, 100)
-                                        };
-                                    }
-                                }
-                            }
-                            // Chart.js 인스턴스 찾기
-                            if (window.Chart && window.Chart.instances) {
-                                const chartIds = Object.keys(window.Chart.instances);
-                                if (chartIds.length > 0) {
-                                    const chart = window.Chart.instances[chartIds[0]];
-                                    if (chart.data && chart.data.datasets) {
-                                        return {
-                                            found: true,
-                                            dataPointsCount: chart.data.datasets[0]?.data?.length || 0,
-                                            dataHash: JSON.stringify(chart.data).substring(0, 100)
-                                        };
-                                    }
-                                }
-                            }
-                            return { found: false };
-                        }
-                        """
-                    )
-                    
-                    # 차트 데이터가 변경되었는지 확인
-                    if chart_snapshot_before.get('found') and chart_snapshot_after.get('found'):
-                        if (chart_snapshot_before.get('dataHash') != chart_snapshot_after.get('dataHash') or
-                            chart_snapshot_before.get('dataPointsCount') != chart_snapshot_after.get('dataPointsCount')):
-                            print(f"  ✓ Checkbox {checkbox_index} toggled - Chart data updated")
-                            return True
-                    
-                    await asyncio.sleep(0.5)
-                
-                # 차트 업데이트가 감지되지 않았지만 체크박스는 클릭됨
-                print(f"  ✓ Checkbox {checkbox_index} toggled (chart update not detected, continuing...)")
-                await asyncio.sleep(2)  # 추가 대기
+                # 차트 props.data 참조가 바뀌는 순간까지만 대기
+                update = await self.wait_for_chart_update(page, update_timeout)
+                if update.get('updated'):
+                    logger.info(f"  ✓ Checkbox {checkbox_index} toggled - Chart data updated")
+                else:
+                    # 차트 업데이트가 감지되지 않았지만 체크박스는 클릭됨
+                    logger.info(f"  ✓ Checkbox {checkbox_index} toggled (chart update not detected, continuing...)")
                 return True
             else:
-                print(f"  ⚠ Failed to toggle checkbox {checkbox_index}")
+                logger.warning(f"  ⚠ Failed to toggle checkbox {checkbox_index}")
                 return False
                 
         except Exception as e:
-            print(f"  ⚠ Error toggling checkbox {checkbox_index}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning(f"  ⚠ Error toggling checkbox {checkbox_index}: {e}", exc_info=True)
             return False
     
     async def uncheck_checkbox(self, page: Page, checkbox_index: int) -> bool:
@@ -290,13 +490,12 @@ class BookingTrendChartScraper(BaseScraper):
         except Exception:
             return False
     
-    async def ensure_checkbox_checked(self, page: Page, checkbox_index: int) -> bool:
-        """특정 체크박스가 체크되어 있는지 확인하고, 체크되어 있지 않으면 체크"""
+    async def ensure_checkbox_checked(self, page: Page, checkbox_index: int, update_timeout: float = 5.0) -> bool:
+        """특정 체크박스가 체크되어 있는지 확인하고, 체크되어 있지 않으면 체크 (클릭한 경우 차트 업데이트까지 대기)"""
         try:
             label_selector = f"#app > div > div.BaseLayout__container__L0brn > div.BaseLayout__contents__k3cMt > div > div > div.StatisticsIndicators__statistic-contents-out-scroll__MoPQ5 > div.StatisticsIndicators__statistic-contents-in__sFa1a > div:nth-child(3) > div.panel-footer.StatisticsIndicators__statistics-footer-group__nyT3T > div > label:nth-child({checkbox_index + 1})"
             
             await page.wait_for_selector(label_selector, timeout=10000)
-            await asyncio.sleep(1)
             
             # 현재 상태 확인
             current_state = await page.evaluate(
@@ -316,9 +515,11 @@ class BookingTrendChartScraper(BaseScraper):
             
             # 이미 체크되어 있으면 그대로 유지
             if current_state.get('checked', False):
-                await asyncio.sleep(1)
                 return True
             
+            # 클릭 전 차트 props.data 참조를 기록하는 watcher 설치
+            await self.arm_chart_update_watcher(page, update_timeout)
+            
             # 체크되어 있지 않으면 클릭하여 체크
             try:
                 await page.evaluate(
@@ -333,12 +534,17 @@ class BookingTrendChartScraper(BaseScraper):
                     }}
                     """
                 )
-                await asyncio.sleep(0.5)
             except Exception:
                 return False
             
+            # props.data 참조가 바뀔 때까지 대기 (실제 재렌더링 시간만 소요)
+            update = await self.wait_for_chart_update(page, update_timeout)
+            if update.get('updated'):
+                logger.info(f"    ✓ props.data 업데이트 확인 (시리즈: {update.get('seriesCount')}, 첫 피쳐: {update.get('firstSeriesFeature')})")
+            else:
+                logger.warning(f"    ⚠ props.data 업데이트를 확인하지 못했지만 계속 진행...")
+            
             # 클릭 후 상태 확인
-            await asyncio.sleep(1)
             after_state = await page.evaluate(
                 f"""
                 () => {{
@@ -355,12 +561,12 @@ class BookingTrendChartScraper(BaseScraper):
             return False
                 
         except Exception as e:
-            print(f"  ⚠ Error ensuring checkbox {checkbox_index} is checked: {e}")
+            logger.warning(f"  ⚠ Error ensuring checkbox {checkbox_index} is checked: {e}")
             return False
     
     async def extract_chart_data_via_hover(self, page: Page) -> list:
         """그래프에 롤오버하여 데이터 추출 (fallback 방식 - JS 추출 실패 시에만 사용)"""
-        print("\n[Data Extraction] Extracting chart data via hover...")
+        logger.info("\n[Data Extraction] Extracting chart data via hover...")
         
         chart_data = []
         
@@ -369,20 +575,20 @@ class BookingTrendChartScraper(BaseScraper):
             
             chart_container = await page.query_selector(chart_selector)
             if not chart_container:
-                print("  ✗ Chart container not found")
+                logger.error("  ✗ Chart container not found")
                 return chart_data
             
             canvas = await chart_container.query_selector("canvas")
             if not canvas:
-                print("  ✗ Canvas element not found")
+                logger.error("  ✗ Canvas element not found")
                 return chart_data
             
             canvas_box = await canvas.bounding_box()
             if not canvas_box:
-                print("  ✗ Canvas bounding box not available")
+                logger.error("  ✗ Canvas bounding box not available")
                 return chart_data
             
-            print(f"  Canvas size: {canvas_box['width']} x {canvas_box['height']}")
+            logger.info(f"  Canvas size: {canvas_box['width']} x {canvas_box['height']}")
             
             chart_start_y = canvas_box['y'] + 20
             chart_end_y = canvas_box['y'] + canvas_box['height'] - 40
@@ -533,7 +739,7 @@ class BookingTrendChartScraper(BaseScraper):
                                 "y_position": y,
                             }
                             point_found = True
-                            print(f"    ✓ Found tooltip at point {point_idx}: {tooltip_result[:100]}")
+                            logger.debug("    ✓ Found tooltip at point %s: %s", point_idx, tooltip_result[:100])
                             break
                         
                         # 디버깅: tooltip이 없는 경우
@@ -570,9 +776,9 @@ class BookingTrendChartScraper(BaseScraper):
                                 """
                             )
                             if debug_info:
-                                print(f"    [Debug] Found {len(debug_info)} candidate elements")
+                                logger.debug("    [Debug] Found %s candidate elements", len(debug_info))
                                 for i, cand in enumerate(debug_info[:3], 1):
-                                    print(f"      {i}. {cand.get('text', '')[:30]} (z:{cand.get('zIndex')}, pos:{cand.get('position')})")
+                                    logger.debug("      %s. %s (z:%s, pos:%s)", i, cand.get('text', '')[:30], cand.get('zIndex'), cand.get('position'))
                                 
                     except Exception:
                         continue
@@ -617,7 +823,7 @@ class BookingTrendChartScraper(BaseScraper):
                     }
                     chart_data.append(point_data)
                     if point_idx % 5 == 0 or value is not None:
-                        print(f"  ✓ Point {point_idx}: {date_label or 'N/A'} - {value or 'N/A'} ({feature_name or 'N/A'})")
+                        logger.debug("  ✓ Point %s: %s - %s (%s)", point_idx, date_label or 'N/A', value or 'N/A', feature_name or 'N/A')
                 else:
                     point_data = {
                         "point_index": point_idx,
@@ -630,18 +836,16 @@ class BookingTrendChartScraper(BaseScraper):
                     }
                     chart_data.append(point_data)
             
-            print(f"  ✓ Extracted data from {len([d for d in chart_data if d.get('tooltip_text')])} data points")
+            logger.info(f"  ✓ Extracted data from {len([d for d in chart_data if d.get('tooltip_text')])} data points")
             return chart_data
             
         except Exception as e:
-            print(f"  ✗ Error extracting chart data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting chart data: {e}", exc_info=True)
             return chart_data
     
     async def extract_props_data_simple(self, page: Page) -> dict:
         """React props.data에서 차트 데이터 간단하게 추출 (체크박스 변경 시 업데이트됨)"""
-        print("\n[Data Extraction] Extracting chart data from React props.data...")
+        logger.info("\n[Data Extraction] Extracting chart data from React props.data...")
         
         try:
             result = await page.evaluate(
@@ -725,15 +929,15 @@ class BookingTrendChartScraper(BaseScraper):
             )
             
             if result.get('error'):
-                print(f"  ⚠ {result.get('error')}")
+                logger.warning(f"  ⚠ {result.get('error')}")
                 if result.get('selector'):
-                    print(f"    Selector used: {result.get('selector')}")
+                    logger.info(f"    Selector used: {result.get('selector')}")
                 if result.get('foundProps'):
-                    print(f"    Found props at depths: {result.get('foundProps')}")
+                    logger.info(f"    Found props at depths: {result.get('foundProps')}")
                 return {"time_based_data": [], "error": result.get('error')}
             
-            print(f"  ✓ Found data at depth {result.get('depth')}: {result.get('seriesCount')} series")
-            print(f"    Selector: {result.get('selector')}")
+            logger.info(f"  ✓ Found data at depth {result.get('depth')}: {result.get('seriesCount')} series")
+            logger.info(f"    Selector: {result.get('selector')}")
             
             # 파싱: datasets를 time_based_data 형식으로 변환
             time_based_data = []
@@ -758,7 +962,7 @@ class BookingTrendChartScraper(BaseScraper):
                         'dataset_label': feature_name
                     })
                 
-                print(f"    - {feature_name}: {len(values)} points")
+                logger.debug("    - %s: %s points", feature_name, len(values))
             
             return {
                 "source": result.get('source'),
@@ -768,14 +972,12 @@ class BookingTrendChartScraper(BaseScraper):
             }
             
         except Exception as e:
-            print(f"  ✗ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error: {e}", exc_info=True)
             return {"time_based_data": [], "error": str(e)}
     
     async def extract_chart_data_via_js(self, page: Page) -> dict:
         """JavaScript를 사용하여 차트 데이터 직접 추출 (place_hourly_inflow_graph.py 참조)"""
-        print("\n[Data Extraction] Extracting chart data via JavaScript...")
+        logger.info("\n[Data Extraction] Extracting chart data via JavaScript...")
         
         try:
             chart_selector = "#app > div > div.BaseLayout__container__L0brn > div.BaseLayout__contents__k3cMt > div > div > div.StatisticsIndicators__statistic-contents-out-scroll__MoPQ5 > div.StatisticsIndicators__statistic-contents-in__sFa1a > div:nth-child(3) > div.panel-body > div > div > div.StatisticsIndicators__chart-wrap__4UCu\\+.StatisticsIndicators__chart-wrap-m__b8qFo"
@@ -842,16 +1044,16 @@ class BookingTrendChartScraper(BaseScraper):
             )
             
             if debug_info:
-                print(f"  [Debug] Container found: {debug_info.get('containerFound')}")
-                print(f"  [Debug] Canvas found: {debug_info.get('canvasFound')}")
-                print(f"  [Debug] Chart libraries: {debug_info.get('chartLibraries', [])}")
-                print(f"  [Debug] React: {debug_info.get('reactFound')}, Vue: {debug_info.get('vueFound')}, Angular: {debug_info.get('angularFound')}, ECharts: {debug_info.get('echartsFound')}, CanvasJS: {debug_info.get('canvasJSFound')}")
+                logger.info(f"  [Debug] Container found: {debug_info.get('containerFound')}")
+                logger.info(f"  [Debug] Canvas found: {debug_info.get('canvasFound')}")
+                logger.info(f"  [Debug] Chart libraries: {debug_info.get('chartLibraries', [])}")
+                logger.info(f"  [Debug] React: {debug_info.get('reactFound')}, Vue: {debug_info.get('vueFound')}, Angular: {debug_info.get('angularFound')}, ECharts: {debug_info.get('echartsFound')}, CanvasJS: {debug_info.get('canvasJSFound')}")
                 if debug_info.get('chartInstances'):
-                    print(f"  [Debug] Chart.js instances: {debug_info.get('chartInstances')}")
+                    logger.info(f"  [Debug] Chart.js instances: {debug_info.get('chartInstances')}")
                 if debug_info.get('canvasJSInstances'):
-                    print(f"  [Debug] CanvasJS instances: {debug_info.get('canvasJSInstances')}")
+                    logger.info(f"  [Debug] CanvasJS instances: {debug_info.get('canvasJSInstances')}")
                     if debug_info.get('canvasJSDataPoints'):
-                        print(f"  [Debug] CanvasJS data points: {debug_info.get('canvasJSDataPoints')}")
+                        logger.info(f"  [Debug] CanvasJS data points: {debug_info.get('canvasJSDataPoints')}")
             
             chart_data_result = await page.evaluate(
                 """
@@ -1606,10 +1808,10 @@ class BookingTrendChartScraper(BaseScraper):
             }
             
             if chart_data_result and not chart_data_result.get('error'):
-                print(f"  ✓ Chart library: {chart_data_result.get('source')}")
+                logger.info(f"  ✓ Chart library: {chart_data_result.get('source')}")
                 time_based_data = result.get("time_based_data", [])
                 if time_based_data:
-                    print(f"  ✓ Parsed {len(time_based_data)} data points")
+                    logger.info(f"  ✓ Parsed {len(time_based_data)} data points")
                     # 피쳐별로 그룹화하여 출력
                     features_found = {}
                     for item in time_based_data:
@@ -1619,45 +1821,47 @@ class BookingTrendChartScraper(BaseScraper):
                         features_found[feature_name].append(item)
                     
                     for feature_name, feature_data in features_found.items():
-                        print(f"    - {feature_name}: {len(feature_data)} points")
+                        logger.debug("    - %s: %s points", feature_name, len(feature_data))
                         # 샘플 출력
                         for i, item in enumerate(feature_data[:2]):
                             if item.get('value') is not None:
-                                print(f"      [{i}] {item.get('label', 'N/A')}: {item.get('value')}")
+                                logger.debug("      [%s] %s: %s", i, item.get('label', 'N/A'), item.get('value'))
             else:
                 error_msg = chart_data_result.get('error') if chart_data_result else 'No data found'
-                print(f"  ⚠ {error_msg}")
+                logger.warning(f"  ⚠ {error_msg}")
                 
                 # 디버깅 정보 출력
                 if chart_data_result and chart_data_result.get('debug'):
                     debug_info = chart_data_result.get('debug')
-                    print(f"  [Debug] Chart container keys: {debug_info.get('chartContainerKeys', [])[:5]}")
-                    print(f"  [Debug] Canvas keys: {debug_info.get('canvasKeys', [])[:5]}")
-                    print(f"  [Debug] Chart.js instances: {debug_info.get('chartJsInstances', 0)}")
-                    print(f"  [Debug] CanvasJS instances: {debug_info.get('canvasJSInstances', 0)}")
-                    print(f"  [Debug] React: {debug_info.get('reactFound')}, ReactProps: {debug_info.get('reactPropsFound')}, Vue: {debug_info.get('vueFound')}, Angular: {debug_info.get('angularFound')}, ECharts: {debug_info.get('echartsFound')}, CanvasJS: {debug_info.get('hasCanvasJS')}")
+                    logger.info(f"  [Debug] Chart container keys: {debug_info.get('chartContainerKeys', [])[:5]}")
+                    logger.info(f"  [Debug] Canvas keys: {debug_info.get('canvasKeys', [])[:5]}")
+                    logger.info(f"  [Debug] Chart.js instances: {debug_info.get('chartJsInstances', 0)}")
+                    logger.info(f"  [Debug] CanvasJS instances: {debug_info.get('canvasJSInstances', 0)}")
+                    logger.info(f"  [Debug] React: {debug_info.get('reactFound')}, ReactProps: {debug_info.get('reactPropsFound')}, Vue: {debug_info.get('vueFound')}, Angular: {debug_info.get('angularFound')}, ECharts: {debug_info.get('echartsFound')}, CanvasJS: {debug_info.get('hasCanvasJS')}")
                     react_props_keys = debug_info.get('reactPropsKeys', [])
                     container_react_props_keys = debug_info.get('containerReactPropsKeys', [])
                     if react_props_keys:
-                        print(f"  [Debug] Canvas React Props keys: {react_props_keys[:10]}")
+                        logger.info(f"  [Debug] Canvas React Props keys: {react_props_keys[:10]}")
                     else:
-                        print(f"  [Debug] Canvas React Props keys: (empty or not found)")
+                        logger.info(f"  [Debug] Canvas React Props keys: (empty or not found)")
                     if container_react_props_keys:
-                        print(f"  [Debug] Container React Props keys: {container_react_props_keys[:10]}")
+                        logger.info(f"  [Debug] Container React Props keys: {container_react_props_keys[:10]}")
                     else:
-                        print(f"  [Debug] Container React Props keys: (empty or not found)")
+                        logger.info(f"  [Debug] Container React Props keys: (empty or not found)")
             
             return result
             
         except Exception as e:
-            print(f"  ✗ Error extracting via JS: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting via JS: {e}", exc_info=True)
             return {}
     
+    async def prepare_page(self, page: Page):
+        """페이지 이동 전에 reports/차트 API 응답 캡처 시작"""
+        await self.setup_network_interception(page)
+    
     async def setup_network_interception(self, page: Page):
         """네트워크 요청을 가로채서 데이터 추출"""
-        print("\n[Network] Setting up network interception...")
+        logger.info("\n[Network] Setting up network interception...")
         
         self.network_responses = []
         
@@ -1675,11 +1879,29 @@ class BookingTrendChartScraper(BaseScraper):
                             "data": data,
                             "timestamp": datetime.now().isoformat()
                         })
-                        print(f"  ✓ Captured API response: {url[:80]}...")
+                        logger.info(f"  ✓ Captured API response: {url[:80]}...")
                 except Exception:
                     pass
         
-        page.on("response", handle_response)
+        self.add_page_listener(page, "response", handle_response)
+    
+    def get_response_index(self, responses_before_count: int = 0) -> ReportResponseIndex:
+        """캡처된 reports 응답 색인 반환 (응답 수가 바뀐 경우에만 재구성)"""
+        # responses_before_count는 reports 응답 수 기준: 먼저 reports만 거른 뒤 자른다
+        all_reports_responses = [
+            r for r in self.network_responses
+            if '/reports' in r.get('url', '') and r.get('data')
+        ]
+        responses = all_reports_responses[responses_before_count:]
+        if not responses:
+            # 새 응답이 없으면 전체 reports 응답 사용
+            responses = all_reports_responses
+        
+        cache_key = (responses_before_count, len(self.network_responses))
+        if self._response_index is None or self._response_index_key != cache_key:
+            self._response_index = ReportResponseIndex(responses)
+            self._response_index_key = cache_key
+        return self._response_index
     
     async def extract_chart_data_from_api(self, feature_name: str = None, responses_before_count: int = 0) -> list:
         """네트워크 API 응답에서 차트 데이터 추출
@@ -1688,528 +1910,215 @@ class BookingTrendChartScraper(BaseScraper):
             feature_name: 체크박스 피쳐명
             responses_before_count: 체크박스 체크 전의 응답 수 (새로운 응답만 확인하기 위해)
         """
-        print(f"\n[API Extraction] Extracting chart data from API responses...")
-        
-        chart_data = []
-        
-        # metric 필드 매핑 (체크박스 변경 시 API 요청이 발생하지 않으므로 metric으로 필터링)
-        feature_metric_map = {
-            '신청': 'REQUESTED',
-            '확정': 'CONFIRMED',
-            '취소': 'CANCELLED',  # 모든 취소 타입 포함
-            '예약자 취소': 'CANCELLED',
-            '사업자 취소': 'CANCELLED',
-            '미확정 자동 취소': 'CANCELLED',
-            '완료': 'ENDED',
-            '변경': 'CHANGED',
-            '노쇼': 'NOSHOW'
-        }
-        
-        # 취소 타입 필터링을 위한 설정 (함수 전체에서 사용)
-        cancelled_type_map = {
-            '예약자 취소': ['예약자 취소', '고객 취소', '예약자'],
-            '사업자 취소': ['사업자 취소', '사업자'],
-            '미확정 자동 취소': ['사업자 미확정 취소', '미확정']
-        }
-        
-        # 최근 API 응답 중 reports API 찾기
-        all_reports_responses = [
-            r for r in self.network_responses 
-            if '/reports' in r.get('url', '') and r.get('data')
-        ]
-        
-        if not all_reports_responses:
-            print("  ⚠ No reports API responses found")
-            return chart_data
+        logger.info(f"\n[API Extraction] Extracting chart data from API responses...")
         
-        # 체크박스 체크 후 발생한 새로운 응답만 사용
-        reports_responses = all_reports_responses[responses_before_count:]
+        index = self.get_response_index(responses_before_count)
+        if not index.responses:
+            logger.warning("  ⚠ No valid reports API responses found (excluding bizItemId)")
+            return []
         
-        if not reports_responses:
-            print(f"  ⚠ No new API responses after checkbox check (using all responses)")
-            reports_responses = all_reports_responses
-        
-        # bizItemId bucket 제외 (비즈니스 아이템 목록이므로 차트 데이터 아님)
-        reports_responses = [
-            r for r in reports_responses
-            if 'bizItemId' not in r.get('url', '')
-        ]
-        
-        if not reports_responses:
-            print("  ⚠ No valid reports API responses found (excluding bizItemId)")
-            return chart_data
-        
-        # 모든 bucket을 확인하고 metric으로 필터링하여 가장 많은 데이터를 가진 응답 선택
-        best_response = None
-        best_data_count = 0
-        bucket_metrics_info = []  # 디버깅용
-        
-        for response in reports_responses:
-            api_data = response.get('data', {})
-            url = response.get('url', '')
-            
-            if 'result' in api_data and isinstance(api_data.get('result'), list):
-                result_list = api_data.get('result', [])
-                
-                # bucket 이름 추출
-                bucket_name = 'unknown'
-                for bucket in ['day_trend', 'bookingCo', 'cancelled', 'price_sum']:
-                    if bucket in url:
-                        bucket_name = bucket
-                        break
-                
-                # 해당 bucket의 모든 metric 확인 (디버깅용)
-                metrics_found = set()
-                for item in result_list[:10]:  # 처음 10개만 확인
-                    if isinstance(item, dict) and item.get('metric'):
-                        metrics_found.add(item.get('metric'))
-                
-                bucket_metrics_info.append({
-                    'bucket': bucket_name,
-                    'url': url[:60],
-                    'total_items': len(result_list),
-                    'metrics': list(metrics_found)
-                })
-                
-                # metric 필터링으로 유효한 데이터 개수 확인
-                valid_count = 0
-                if feature_name in feature_metric_map:
-                    expected_metric = feature_metric_map[feature_name]
-                    for item in result_list:
-                        if isinstance(item, dict):
-                            item_metric = item.get('metric', '')
-                            if item_metric == expected_metric:
-                                # 취소 타입 추가 필터링
-                                if feature_name in cancelled_type_map:
-                                    item_cancelled_type = item.get('cancelledType', '')
-                                    expected_types = cancelled_type_map[feature_name]
-                                    if not any(expected_type in item_cancelled_type for expected_type in expected_types):
-                                        if item_cancelled_type:
-                                            continue
-                                valid_count += 1
-                
-                # 가장 많은 유효한 데이터를 가진 응답 선택
-                if valid_count > best_data_count:
-                    best_data_count = valid_count
-                    best_response = response
-        
-        # 디버깅 정보 출력
-        if bucket_metrics_info:
-            print(f"  [Debug] Available buckets and metrics:")
-            for info in bucket_metrics_info:
-                print(f"    - {info['bucket']}: {info['total_items']} items, metrics: {info['metrics']}")
-        
-        # 가장 좋은 응답 사용
-        if best_response:
-            api_data = best_response.get('data', {})
-            print(f"  ✓ Selected best API response: {best_response.get('url', '')[:80]}... ({best_data_count} valid items)")
-        elif reports_responses:
-            # metric 필터링으로 데이터를 찾지 못한 경우
-            if feature_name in feature_metric_map:
-                expected_metric = feature_metric_map[feature_name]
-                print(f"  ⚠ No response found with metric '{expected_metric}'")
-                print(f"    Available metrics in buckets:")
-                for info in bucket_metrics_info:
-                    print(f"      - {info['bucket']}: {info['metrics']}")
-            # 첫 번째 응답 사용 (나중에 필터링)
-            api_data = reports_responses[0].get('data', {})
-            print(f"  ⚠ Using first available response (will filter by metric): {reports_responses[0].get('url', '')[:80]}...")
+        chart_data = index.series_for(feature_name)
+        if chart_data:
+            logger.info(f"  ✓ Extracted {len(chart_data)} data points from API")
         else:
-            print("  ⚠ No API responses available")
-            return chart_data
-        
-        # 필터링 통계 변수 초기화
-        total_items = 0
-        filtered_count = 0
-        
-        # 구조 5: {result: [...], resultMetric: ...} - 실제 확인된 구조
-        if 'result' in api_data and isinstance(api_data.get('result'), list):
-            result_list = api_data.get('result', [])
-            print(f"    Found 'result' array with {len(result_list)} items")
-            
-            # 첫 번째 항목 구조 확인 (디버깅)
-            if len(result_list) > 0:
-                first_item = result_list[0]
-                if isinstance(first_item, dict):
-                    print(f"    First item keys: {list(first_item.keys())[:10]}")
-                    print(f"    First item sample: {str(first_item)[:200]}")
-            
-            # 필터링 전 항목 수
-            total_items = len(result_list)
-            filtered_count = 0
-            
-            # result 배열의 각 항목 처리
-            for i, item in enumerate(result_list):
-                if isinstance(item, dict):
-                    # metric 필드로 필터링 (체크박스 변경 시 API 요청이 발생하지 않으므로)
-                    if feature_name in feature_metric_map:
-                        expected_metric = feature_metric_map[feature_name]
-                        item_metric = item.get('metric', '')
-                        # metric이 일치하지 않으면 스킵
-                        if item_metric != expected_metric:
-                            filtered_count += 1
-                            continue
-                    
-                    # 취소 타입 필터링 (취소 관련 피쳐인 경우)
-                    # '취소'는 모든 취소 타입을 포함하므로 필터링하지 않음
-                    if feature_name in cancelled_type_map:
-                        item_cancelled_type = item.get('cancelledType', '')
-                        expected_types = cancelled_type_map[feature_name]
-                        # cancelledType이 예상된 타입 중 하나와 일치하는지 확인
-                        if not any(expected_type in item_cancelled_type for expected_type in expected_types):
-                            # cancelledType이 있고 예상과 다르면 스킵
-                            if item_cancelled_type:
-                                filtered_count += 1
-                                continue
-                    
-                    # 날짜 필드 추출 (day_trend 필드 확인)
-                    date_value = item.get('day_trend') or item.get('date') or item.get('dateLabel') or item.get('label') or item.get('day') or item.get('dateStr')
-                    
-                    # 값 필드 추출
-                    value = item.get('value') or item.get('count') or item.get('data') or item.get('amount') or item.get('total') or item.get('bookingCount_sum')
-                    
-                    # 숫자 필드 찾기 (date가 아닌 숫자 필드)
-                    if value is None:
-                        for key, val in item.items():
-                            if key not in ['date', 'dateLabel', 'label', 'day', 'feature', 'dateStr', 'day_trend', 'cancelledType', 'metric', 'bizItemId', 'bizItemName', 'bizItemOrder', 'bizItemRegDateTime'] and isinstance(val, (int, float)):
-                                value = val
-                                break
-                    
-                    chart_data.append({
-                        "point_index": len(chart_data),  # 실제 추가된 인덱스 사용
-                        "label": date_value,
-                        "value": value,
-                        "feature": feature_name or item.get('feature'),
-                        "source": "api"
-                    })
-                elif isinstance(item, (int, float)):
-                    # 단순 숫자 배열인 경우
-                    chart_data.append({
-                        "point_index": i,
-                        "label": None,
-                        "value": item,
-                        "feature": feature_name,
-                        "source": "api"
-                    })
-        
-        # 구조 1: {dates: [...], data: [...], labels: [...]}
-        elif 'dates' in api_data and 'data' in api_data:
-            dates = api_data.get('dates', [])
-            data_values = api_data.get('data', [])
-            for i, (date, value) in enumerate(zip(dates, data_values)):
-                chart_data.append({
-                    "point_index": i,
-                    "label": date,
-                    "value": value,
-                    "feature": feature_name,
-                    "source": "api"
-                })
-        
-        # 구조 2: {labels: [...], datasets: [{data: [...]}]}
-        elif 'labels' in api_data and 'datasets' in api_data:
-            labels = api_data.get('labels', [])
-            datasets = api_data.get('datasets', [])
-            if datasets and len(datasets) > 0:
-                data_values = datasets[0].get('data', [])
-                for i, (label, value) in enumerate(zip(labels, data_values)):
-                    chart_data.append({
-                        "point_index": i,
-                        "label": label,
-                        "value": value,
-                        "feature": feature_name or datasets[0].get('label'),
-                        "source": "api"
-                    })
-        
-        # 구조 3: 배열 형태 [{date: ..., value: ...}, ...]
-        elif isinstance(api_data, list):
-            for i, item in enumerate(api_data):
-                if isinstance(item, dict):
-                    chart_data.append({
-                        "point_index": i,
-                        "label": item.get('date') or item.get('label') or item.get('dateLabel'),
-                        "value": item.get('value') or item.get('count') or item.get('data'),
-                        "feature": feature_name or item.get('feature'),
-                        "source": "api"
-                    })
-        
-        # 구조 4: 단순 배열 [value1, value2, ...]
-        elif isinstance(api_data, list) and len(api_data) > 0 and not isinstance(api_data[0], dict):
-            for i, value in enumerate(api_data):
-                chart_data.append({
-                    "point_index": i,
-                    "label": None,
-                    "value": value,
-                    "feature": feature_name,
-                    "source": "api"
-                })
-            
-            if chart_data:
-                print(f"  ✓ Extracted {len(chart_data)} data points from API")
-                if len(chart_data) > 0:
-                    print(f"    Sample: {chart_data[0]}")
-                if filtered_count > 0:
-                    print(f"    Filtered out {filtered_count} items (total: {total_items})")
-            else:
-                if 'result' in api_data and isinstance(api_data.get('result'), list):
-                    result_list_for_debug = api_data.get('result', [])
-                    if filtered_count > 0:
-                        print(f"  ⚠ All {total_items} items were filtered out (filtered: {filtered_count})")
-                        if feature_name in feature_metric_map:
-                            expected_metric = feature_metric_map[feature_name]
-                            print(f"    Feature '{feature_name}' expects metric: {expected_metric}")
-                            # 실제 metric 값들 확인
-                            actual_metrics = set()
-                            for item in result_list_for_debug[:10]:  # 처음 10개만 확인
-                                if isinstance(item, dict) and item.get('metric'):
-                                    actual_metrics.add(item.get('metric'))
-                            if actual_metrics:
-                                print(f"    Actual metric values found: {list(actual_metrics)}")
-                        if feature_name in cancelled_type_map:
-                            print(f"    Feature '{feature_name}' expects cancelledType: {cancelled_type_map[feature_name]}")
-                            # 실제 cancelledType 값들 확인
-                            actual_types = set()
-                            for item in result_list_for_debug[:10]:  # 처음 10개만 확인
-                                if isinstance(item, dict) and item.get('cancelledType'):
-                                    actual_types.add(item.get('cancelledType'))
-                            if actual_types:
-                                print(f"    Actual cancelledType values found: {list(actual_types)}")
-                    else:
-                        print(f"  ⚠ API response structure not recognized")
-                else:
-                    print(f"  ⚠ API response structure not recognized")
-                if isinstance(api_data, dict):
-                    print(f"    Keys: {list(api_data.keys())[:10]}")
-                    # 첫 번째 값의 구조 확인
-                    if api_data:
-                        first_key = list(api_data.keys())[0]
-                        first_value = api_data[first_key]
-                        print(f"    First key '{first_key}' type: {type(first_value).__name__}")
-                        if isinstance(first_value, (list, dict)) and len(str(first_value)) < 200:
-                            print(f"    First value sample: {str(first_value)[:200]}")
-                elif isinstance(api_data, list):
-                    print(f"    Array length: {len(api_data)}")
-                    if len(api_data) > 0:
-                        print(f"    First item type: {type(api_data[0]).__name__}")
-                        if isinstance(api_data[0], dict):
-                            print(f"    First item keys: {list(api_data[0].keys())[:10]}")
-                else:
-                    print(f"    Type: {type(api_data).__name__}")
-        
+            expected_metric = FEATURE_METRIC_MAP.get(feature_name)
+            if expected_metric:
+                logger.warning(f"  ⚠ No response found with metric '{expected_metric}'")
+            logger.info(f"    Available metrics in buckets:")
+            for bucket, metrics in index.bucket_metrics().items():
+                logger.debug("      - %s: %s", bucket, metrics)
         return chart_data
     
-    async def scrape(self, page: Page) -> dict:
-        """통계 페이지에서 데이터 스크래핑
+    def extract_all_features_from_api(self, feature_names: list) -> dict:
+        """색인 한 번으로 모든 피쳐의 API 시리즈 추출 (피쳐명 -> 포인트 리스트)"""
+        index = self.get_response_index()
+        if index.responses:
+            logger.info(f"  [Index] {len(index.responses)} responses, buckets/metrics: {index.bucket_metrics()}")
+        return {feature_name: index.series_for(feature_name) for feature_name in feature_names}
+    
+    def build_feature_frame(self, all_feature_data: dict) -> pd.DataFrame:
+        """피쳐별 시리즈를 하나의 long DataFrame(date, feature, value, label, tooltip, source)으로 정렬
         
-        효율화: JS 방식으로 차트 데이터를 직접 추출 (place_hourly_inflow_graph.py 참조)
-        JS 추출 실패 시에만 hover 방식을 fallback으로 사용
+        날짜는 포인트 라벨(API day_trend, props '12월 01일' 등)에서 컬럼 단위로 파싱하고,
+        라벨이 없거나 파싱되지 않는 포인트만 end_date 기준 위치로 날짜를 계산한다.
         """
-        print("\n[Scraping] Starting booking trend chart scraping...")
+        frames = []
+        for feature_name, feat_data in all_feature_data.items():
+            points = feat_data.get("hover_data", [])
+            if points:
+                frame = pd.DataFrame.from_records(points, columns=["value", "label", "tooltip_text"])
+                frame["pos"] = range(len(frame))
+                frame["n_points"] = len(frame)
+                frame["feature"] = feature_name
+                frame["source"] = feat_data.get("data_source", "unknown")
+                frames.append(frame)
         
-        await self.setup_network_interception(page)
+        if not frames:
+            return pd.DataFrame({
+                "date": pd.Series(dtype="datetime64[ns]"),
+                "feature": pd.Series(dtype="string"),
+                "value": pd.Series(dtype="Float64"),
+                "label": pd.Series(dtype="string"),
+                "tooltip": pd.Series(dtype="string"),
+                "source": pd.Series(dtype="string"),
+            })
         
-        print(f"  Navigating to: {self.stats_url}")
-        await page.goto(self.stats_url, wait_until="networkidle")
-        await asyncio.sleep(5)
+        long_df = pd.concat(frames, ignore_index=True)
+        end_dt = pd.Timestamp(self.end_date or self.start_date)
         
-        await page.evaluate("window.scrollTo(0, 500)")
-        await asyncio.sleep(2)
+        parsed = parse_chart_dates(long_df["label"], end_dt)
+        positional = end_dt - pd.to_timedelta(long_df["n_points"] - 1 - long_df["pos"], unit="D")
         
-        if not await self.wait_for_chart_load(page):
-            print("  ⚠ Chart may not be fully loaded, continuing anyway...")
+        values = pd.to_numeric(long_df["value"], errors="coerce").astype("Float64")
+        if values.dropna().mod(1).eq(0).all():
+            values = values.astype("Int64")
         
-        # 모든 API 응답이 로드될 때까지 충분히 대기
-        print("\n[Wait] Waiting for all API responses to be captured...")
-        await asyncio.sleep(5)  # 추가 대기 시간
+        feature_df = pd.DataFrame({
+            "date": parsed.fillna(positional),
+            "feature": long_df["feature"].astype("string"),
+            "value": values,
+            "label": long_df["label"].astype("string"),
+            "tooltip": long_df["tooltip_text"].astype("string"),
+            "source": long_df["source"].astype("string"),
+        })
+        # 같은 날짜가 여러 번 나오면 마지막 포인트 사용
+        return feature_df.drop_duplicates(subset=["date", "feature"], keep="last").sort_values(["date", "feature"], ignore_index=True)
+    
+    def build_combined_data(self, all_feature_data: dict, output_format: str = "wide") -> list:
+        """피쳐별 시리즈를 실제 날짜 기준으로 결합
         
-        # 캡처된 API 응답 수 확인
-        reports_responses_count = len([
-            r for r in self.network_responses 
-            if '/reports' in r.get('url', '')
-        ])
-        print(f"  ✓ Captured {reports_responses_count} reports API responses")
+        Args:
+            all_feature_data: 피쳐명 -> {"hover_data": [...], "data_source": ...}
+            output_format: "wide" (날짜별 1행, {피쳐}_value/_label/_tooltip 컬럼) 또는 "long" (날짜×피쳐별 1행)
+        """
+        feature_df = self.build_feature_frame(all_feature_data)
+        feature_names = list(all_feature_data.keys())
         
-        if reports_responses_count == 0:
-            print("  ⚠ Warning: No reports API responses captured. Data extraction may fail.")
+        if output_format == "long":
+            combined = feature_df.assign(date=feature_df["date"].dt.strftime("%Y-%m-%d"))
+            return json.loads(combined.to_json(orient="records", force_ascii=False))
+        
+        # 날짜 축: 수집된 날짜 전체 구간 (없으면 요청 구간)
+        if len(feature_df) > 0:
+            date_index = pd.date_range(feature_df["date"].min(), feature_df["date"].max(), freq="D", name="date")
         else:
-            # 각 응답의 bucket 정보 출력
-            buckets_found = set()
-            for response in self.network_responses:
-                url = response.get('url', '')
-                if '/reports' in url:
-                    for bucket in ['day_trend', 'bookingCo', 'cancelled', 'price_sum']:
-                        if bucket in url:
-                            buckets_found.add(bucket)
-                            break
-            print(f"  ✓ Found buckets: {', '.join(buckets_found) if buckets_found else 'unknown'}")
+            date_index = pd.date_range(self.start_date, self.end_date or self.start_date, freq="D", name="date")
+        date_strs = pd.Series(date_index.strftime("%Y-%m-%d"), index=date_index)
         
-        # 체크박스 피쳐 목록 가져오기
-        features = await self.get_checkbox_features(page)
+        wide = feature_df.pivot(index="date", columns="feature", values=["value", "label", "tooltip"]).reindex(date_index)
         
-        if not features:
-            print("  ⚠ No checkbox features found, extracting default chart data...")
-            # API 방식 우선 시도
-            api_data = await self.extract_chart_data_from_api(None, 0)
-            js_data = {}
-            hover_data = []
-            
-            if api_data and len(api_data) > 0:
-                hover_data = api_data
-                print(f"  ✓ Using data from API extraction ({len(hover_data)} points)")
+        columns = {"date": date_strs}
+        for feature_name in feature_names:
+            if feature_name in wide["value"].columns:
+                value = wide["value"][feature_name]
+                present = wide["label"][feature_name].notna() | value.notna()
+                label = wide["label"][feature_name].astype("string")
+                tooltip = wide["tooltip"][feature_name].astype("string")
             else:
-                # JS 방식 시도
-                js_data = await self.extract_chart_data_via_js(page)
-                time_based_data = js_data.get("time_based_data", [])
-                
-                if time_based_data and len(time_based_data) > 0:
-                    hover_data = time_based_data
-                    print(f"  ✓ Using data from JS extraction ({len(hover_data)} points)")
-                else:
-                    hover_data = []
-                    print("  ✗ Both API and JS extraction failed. No data collected.")
+                present = pd.Series(False, index=date_index)
+                value = pd.Series(pd.NA, index=date_index, dtype="Int64")
+                label = tooltip = pd.Series(pd.NA, index=date_index, dtype="string")
             
-            result = {
-                "url": self.stats_url,
-                "scraped_at": datetime.now().isoformat(),
-                "hover_data": hover_data,
-                "js_data": js_data,
-                "page_title": await page.title(),
-            }
-            return result
-        
-        # 모든 체크박스별로 데이터 수집
-        # 중요: 체크박스 변경 시 새로운 API 요청이 발생하지 않으므로,
-        # 이미 캡처된 모든 API 응답에서 각 피쳐의 데이터를 추출
-        print("\n[Strategy] Extracting data from all captured API responses (no new requests on checkbox change)")
+            # 데이터가 없는 날짜는 0으로 채우기 (None 대신)
+            columns[f"{feature_name}_value"] = pd.to_numeric(value, errors="coerce").where(present, 0).astype(feature_df["value"].dtype)
+            columns[f"{feature_name}_label"] = label.where(present, date_strs)
+            columns[f"{feature_name}_tooltip"] = tooltip.where(present, f"{feature_name}: 0")
         
-        all_feature_data = {}
+        combined = pd.DataFrame(columns).reset_index(drop=True)
+        return json.loads(combined.to_json(orient="records", force_ascii=False))
+    
+    async def fill_features_from_api(self, feature_data: dict, feature_names: list) -> int:
+        """
+        이미 캡처된 API 응답에서 데이터가 없는 피쳐 채우기
+        (체크박스 변경 시 새로운 API 요청이 발생하지 않으므로 모든 응답에서 한 번에 추출)
         
-        # 먼저 모든 API 응답에서 각 피쳐별 데이터를 한 번에 추출
-        print("\n[Pre-extraction] Extracting data for all features from captured API responses...")
-        for idx, feature_info in enumerate(features):
-            feature_name = feature_info.get('feature', f'feature_{idx}')
-            print(f"  [{idx + 1}/{len(features)}] Extracting data for: {feature_name}")
-            
-            # 모든 API 응답에서 해당 피쳐의 데이터 추출 (responses_before_count=0으로 설정하여 모든 응답 확인)
-            api_data = await self.extract_chart_data_from_api(feature_name, 0)
+        Returns:
+            int: 새로 채운 피쳐 수
+        """
+        logger.info("\n[API] Extracting data for all features from captured API responses...")
+        missing = [name for name in feature_names if not feature_data[name].get("hover_data")]
+        api_series = self.extract_all_features_from_api(missing)
+        filled = 0
+        for idx, feature_name in enumerate(missing):
+            logger.debug("  [%s/%s] Extracting data for: %s", idx + 1, len(missing), feature_name)
+            api_data = api_series.get(feature_name, [])
             
             if api_data and len(api_data) > 0:
-                print(f"    ✓ Found {len(api_data)} data points for {feature_name}")
-                all_feature_data[feature_name] = {
+                logger.debug("    ✓ Found %s data points for %s", len(api_data), feature_name)
+                feature_data[feature_name] = {
                     "hover_data": api_data,
                     "js_data": {},
                     "api_data": api_data,
                     "data_source": "api"
                 }
+                filled += 1
             else:
-                print(f"    ⚠ No data found for {feature_name} in API responses")
-                all_feature_data[feature_name] = {
-                    "hover_data": [],
-                    "js_data": {},
-                    "api_data": [],
-                    "data_source": "none"
-                }
-        
-        # 체크박스 변경을 통한 차트 인스턴스 데이터 추출 (props.data에서 직접 추출)
-        # 중요: 모든 체크박스를 해제하면 차트가 사라지므로, 현재 체크된 상태에서 props.data를 먼저 추출
-        print("\n[Secondary] Extracting data from chart instances...")
+                logger.debug("    ⚠ No data found for %s in API responses", feature_name)
+        return filled
+    
+    async def fill_features_from_initial_props(self, page: Page, feature_data: dict) -> int:
+        """
+        초기 상태(여러 피쳐가 체크된 상태)의 차트 props.data에서 데이터가 없는 피쳐 채우기
+        중요: 모든 체크박스를 해제하면 차트가 사라지므로, 현재 체크된 상태에서 추출
         
-        # 먼저 초기 상태(여러 피쳐가 체크된 상태)에서 props.data 추출
-        print("  [Initial] Extracting props.data from initial state (multiple features checked)...")
+        Returns:
+            int: 새로 채운 피쳐 수
+        """
+        logger.info("\n[Initial] Extracting props.data from initial state (multiple features checked)...")
         initial_js_data = await self.extract_props_data_simple(page)
         initial_time_based_data = initial_js_data.get("time_based_data", [])
         
-        if initial_time_based_data:
-            print(f"  ✓ Initial extraction: {len(initial_time_based_data)} data points")
-            # 초기 데이터에서 각 피쳐별 데이터 분리
-            for feature_name in all_feature_data.keys():
-                filtered_data = [
-                    item for item in initial_time_based_data
-                    if item.get('feature_name') == feature_name or item.get('dataset_label') == feature_name
-                ]
-                if filtered_data:
-                    existing_data = all_feature_data[feature_name].get("hover_data", [])
-                    if not existing_data or len(filtered_data) > len(existing_data):
-                        all_feature_data[feature_name]["hover_data"] = filtered_data
-                        all_feature_data[feature_name]["js_data"] = initial_js_data
-                        all_feature_data[feature_name]["data_source"] = "js_initial"
-                        print(f"    ✓ {feature_name}: {len(filtered_data)} points from initial extraction")
-        else:
-            print("  ⚠ Initial extraction failed, trying individual checkbox method...")
+        if not initial_time_based_data:
+            logger.warning("  ⚠ Initial extraction failed")
+            return 0
+        
+        logger.info(f"  ✓ Initial extraction: {len(initial_time_based_data)} data points")
+        filled = 0
+        # 초기 데이터에서 각 피쳐별 데이터 분리
+        for feature_name, feat_data in feature_data.items():
+            if feat_data.get("hover_data"):
+                continue
+            filtered_data = [
+                item for item in initial_time_based_data
+                if item.get('feature_name') == feature_name or item.get('dataset_label') == feature_name
+            ]
+            if filtered_data:
+                feat_data["hover_data"] = filtered_data
+                feat_data["js_data"] = initial_js_data
+                feat_data["data_source"] = "js_initial"
+                filled += 1
+                logger.info(f"    ✓ {feature_name}: {len(filtered_data)} points from initial extraction")
+        return filled
+    
+    async def fill_features_from_checkboxes(self, page: Page, features: list, feature_data: dict) -> int:
+        """
+        데이터가 없는 피쳐마다 체크박스를 켜고 차트 props.data에서 추출
         
-        # API/초기 추출에서 데이터를 못 찾은 피쳐만 개별 처리
-        print("\n[Individual] Processing features without data...")
+        Returns:
+            int: 새로 채운 피쳐 수
+        """
+        logger.info("\n[Individual] Processing features without data...")
+        filled = 0
         for idx, feature_info in enumerate(features):
             feature_name = feature_info.get('feature', f'feature_{idx}')
             
-            existing_data = all_feature_data[feature_name].get("hover_data", [])
+            existing_data = feature_data[feature_name].get("hover_data", [])
             if existing_data and len(existing_data) >= 1:
-                print(f"  [{idx + 1}/{len(features)}] {feature_name}: 데이터 있음 ({len(existing_data)} points), 스킵")
+                logger.debug("  [%s/%s] %s: 데이터 있음 (%s points), 스킵", idx + 1, len(features), feature_name, len(existing_data))
                 continue
             
-            print(f"\n[Feature {idx + 1}/{len(features)}] Processing: {feature_name} (no data found)")
+            logger.info(f"\n[Feature {idx + 1}/{len(features)}] Processing: {feature_name} (no data found)")
             
             # 모든 체크박스 해제하지 않고, 현재 피쳐만 체크 (다른 피쳐도 유지)
-            # 체크박스 상태 변경: 현재 피쳐만 체크
-            print(f"  [Check] Ensuring checkbox for {feature_name} is checked...")
+            # 체크박스 상태 변경: 현재 피쳐만 체크 (클릭 시 props.data 업데이트 Promise까지 대기)
+            logger.info(f"  [Check] Ensuring checkbox for {feature_name} is checked...")
             checkbox_checked = await self.ensure_checkbox_checked(page, idx)
             if not checkbox_checked:
-                print(f"  ⚠ Failed to check checkbox, skipping {feature_name}")
+                logger.warning(f"  ⚠ Failed to check checkbox, skipping {feature_name}")
                 continue
             
-            # props.data가 업데이트될 때까지 대기
-            print(f"  [Wait] Waiting for props.data update...")
-            await asyncio.sleep(2)  # 초기 대기
-            
-            # props.data 업데이트 확인 (최대 5초)
-            chart_updated = False
-            for attempt in range(10):
-                await asyncio.sleep(0.5)
-                
-                props_data_check = await page.evaluate(
-                    """
-                    () => {
-                        const canvas = document.querySelector('[class*="chart-wrap"] canvas') ||
-                                      document.querySelector('.panel-body canvas') ||
-                                      document.querySelector('canvas');
-                        if (!canvas) return { found: false, error: 'canvas not found' };
-                        
-                        const fiberKey = Object.keys(canvas).find(k => k.startsWith('__reactFiber'));
-                        if (!fiberKey) return { found: false, error: 'fiber not found' };
-                        
-                        let fiber = canvas[fiberKey];
-                        let depth = 0;
-                        
-                        while (fiber && depth < 30) {
-                            if (fiber.memoizedProps && fiber.memoizedProps.data && Array.isArray(fiber.memoizedProps.data)) {
-                                const data = fiber.memoizedProps.data;
-                                if (data.length > 0 && Array.isArray(data[0]) && typeof data[0][0] === 'string') {
-                                    return {
-                                        found: true,
-                                        seriesCount: data.length,
-                                        firstSeriesFeature: data[0][0],
-                                        firstSeriesLength: data[0].length,
-                                        labelsLength: fiber.memoizedProps.label?.length || 0
-                                    };
-                                }
-                            }
-                            fiber = fiber.return;
-                            depth++;
-                        }
-                        return { found: false, depth: depth };
-                    }
-                    """
-                )
-                
-                if props_data_check.get('found'):
-                    chart_updated = True
-                    print(f"    ✓ props.data 업데이트 확인 (시리즈: {props_data_check.get('seriesCount')}, 첫 피쳐: {props_data_check.get('firstSeriesFeature')})")
-                    break
-            
-            if not chart_updated:
-                print(f"    ⚠ props.data 업데이트를 확인하지 못했지만 계속 진행...")
-            
             # 간단한 props.data 추출 방식 사용 (복잡한 JS 방식 대신)
-            print(f"  [Method] Extracting data from props.data (simple)...")
+            logger.info(f"  [Method] Extracting data from props.data (simple)...")
             js_data = await self.extract_props_data_simple(page)
             time_based_data = js_data.get("time_based_data", [])
             
@@ -2221,79 +2130,187 @@ class BookingTrendChartScraper(BaseScraper):
                 ]
                 
                 if filtered_data:
-                    print(f"  ✓ Found {len(filtered_data)} data points for {feature_name} via JS extraction")
+                    logger.info(f"  ✓ Found {len(filtered_data)} data points for {feature_name} via JS extraction")
                     # 기존 데이터가 없거나 더 많은 데이터를 찾은 경우 업데이트
-                    existing_data = all_feature_data[feature_name].get("hover_data", [])
+                    existing_data = feature_data[feature_name].get("hover_data", [])
                     if not existing_data or len(filtered_data) > len(existing_data):
-                        all_feature_data[feature_name]["hover_data"] = filtered_data
-                        all_feature_data[feature_name]["js_data"] = js_data
-                        all_feature_data[feature_name]["data_source"] = "js"
+                        feature_data[feature_name]["hover_data"] = filtered_data
+                        feature_data[feature_name]["js_data"] = js_data
+                        feature_data[feature_name]["data_source"] = "js"
+                        filled += 1
                     else:
-                        print(f"    (기존 API 데이터 유지: {len(existing_data)} points)")
+                        logger.info(f"    (기존 API 데이터 유지: {len(existing_data)} points)")
                 elif time_based_data:
                     # 필터링 결과가 없으면 모든 데이터 사용 (현재 활성화된 피쳐의 데이터)
-                    print(f"  ✓ Found {len(time_based_data)} data points (using all data) for {feature_name}")
-                    existing_data = all_feature_data[feature_name].get("hover_data", [])
+                    logger.info(f"  ✓ Found {len(time_based_data)} data points (using all data) for {feature_name}")
+                    existing_data = feature_data[feature_name].get("hover_data", [])
                     if not existing_data or len(time_based_data) > len(existing_data):
-                        all_feature_data[feature_name]["hover_data"] = time_based_data
-                        all_feature_data[feature_name]["js_data"] = js_data
-                        all_feature_data[feature_name]["data_source"] = "js"
+                        feature_data[feature_name]["hover_data"] = time_based_data
+                        feature_data[feature_name]["js_data"] = js_data
+                        feature_data[feature_name]["data_source"] = "js"
+                        filled += 1
                     else:
-                        print(f"    (기존 API 데이터 유지: {len(existing_data)} points)")
+                        logger.info(f"    (기존 API 데이터 유지: {len(existing_data)} points)")
                 else:
-                    print(f"  ⚠ No matching data found for {feature_name}")
+                    logger.warning(f"  ⚠ No matching data found for {feature_name}")
             else:
-                print(f"  ⚠ JS extraction failed for {feature_name}")
+                logger.warning(f"  ⚠ JS extraction failed for {feature_name}")
+        return filled
+    
+    async def empty_data(self, page: Page) -> dict:
+        """빈 기간: 요청 구간의 모든 날짜를 피쳐별 0으로 채움"""
+        features = await self.get_checkbox_features(page)
+        all_feature_data = {
+            f.get('feature', f'feature_{idx}'): {
+                "hover_data": [],
+                "js_data": {},
+                "api_data": [],
+                "data_source": "empty_period"
+            }
+            for idx, f in enumerate(features)
+        }
+        combined_data = self.build_combined_data(all_feature_data, self.output_format)
+        return {
+            "features": [f.get('feature') for f in features],
+            "feature_data": all_feature_data,
+            "combined_data": combined_data,
+            "combined_format": self.output_format,
+            "hover_data": combined_data,  # CSV 저장을 위해
+        }
+    
+    async def scrape(self, page: Page) -> dict:
+        """통계 페이지에서 데이터 스크래핑
         
-        # 날짜 범위 계산
-        start_dt = datetime.strptime(self.start_date, "%Y-%m-%d")
+        효율화: JS 방식으로 차트 데이터를 직접 추출 (place_hourly_inflow_graph.py 참조)
+        JS 추출 실패 시에만 hover 방식을 fallback으로 사용
+        """
+        logger.info("\n[Scraping] Starting booking trend chart scraping...")
         
-        # 모든 피쳐 데이터에서 최대 데이터 포인트 수 확인
-        max_points = max(
-            len(feat_data.get("hover_data", [])) 
-            for feat_data in all_feature_data.values()
-        ) if all_feature_data else 0
+        await self.open_stats_page(page)
+        
+        await page.evaluate("window.scrollTo(0, 500)")
+        await asyncio.sleep(2)
         
-        # 데이터가 없으면 기본값 설정
-        if max_points == 0:
-            max_points = 15  # 기본 15일 데이터
-            print(f"  ⚠ No data found for any feature, using default {max_points} points")
+        if not await self.wait_for_chart_load(page):
+            # 차트가 뜨지 않았을 때만 빈 기간 확인 (빈 기간이면 추출 전략 생략)
+            empty_result = await self.check_empty_period(page)
+            if empty_result is not None:
+                return empty_result
+            logger.warning("  ⚠ Chart may not be fully loaded, continuing anyway...")
         
-        print(f"\n[Data Summary]")
-        print(f"  Total features: {len(all_feature_data)}")
-        print(f"  Max data points: {max_points}")
-        for feature_name, feat_data in all_feature_data.items():
-            hover_data = feat_data.get("hover_data", [])
-            data_source = feat_data.get("data_source", "unknown")
-            print(f"    - {feature_name}: {len(hover_data)} points ({data_source})")
+        # 모든 API 응답이 로드될 때까지 충분히 대기
+        logger.info("\n[Wait] Waiting for all API responses to be captured...")
+        await asyncio.sleep(5)  # 추가 대기 시간
         
-        # 날짜별로 데이터 결합
-        combined_data = []
-        for point_idx in range(max_points):
-            # 날짜 계산: 최신 날짜(start_date)에서 역순으로
-            date_offset = max_points - 1 - point_idx  # 역순 인덱스
-            row_date = start_dt - timedelta(days=date_offset)
-            date_str = row_date.strftime("%Y-%m-%d")
+        # 캡처된 API 응답 수 확인
+        reports_responses_count = len([
+            r for r in self.network_responses 
+            if '/reports' in r.get('url', '')
+        ])
+        logger.info(f"  ✓ Captured {reports_responses_count} reports API responses")
+        
+        if reports_responses_count == 0:
+            logger.warning("  ⚠ Warning: No reports API responses captured. Data extraction may fail.")
+        else:
+            # 각 응답의 bucket 정보 출력 (색인 구성)
+            buckets_found = list(self.get_response_index().by_bucket.keys())
+            logger.info(f"  ✓ Found buckets: {', '.join(buckets_found) if buckets_found else 'unknown'}")
+        
+        # 체크박스 피쳐 목록 가져오기
+        features = await self.get_checkbox_features(page)
+        
+        if not features:
+            logger.warning("  ⚠ No checkbox features found, extracting default chart data...")
             
-            row_data = {
-                "date": date_str,
-            }
+            async def via_api():
+                return await self.extract_chart_data_from_api(None, 0)
             
-            for feature_name, feat_data in all_feature_data.items():
-                hover_data = feat_data.get("hover_data", [])
-                if point_idx < len(hover_data):
-                    point_data = hover_data[point_idx]
-                    # 피쳐명을 컬럼명으로 사용
-                    row_data[f"{feature_name}_value"] = point_data.get("value")
-                    row_data[f"{feature_name}_label"] = point_data.get("label")
-                    row_data[f"{feature_name}_tooltip"] = point_data.get("tooltip_text")
-                else:
-                    # 데이터가 없는 경우 0으로 채우기 (None 대신)
-                    row_data[f"{feature_name}_value"] = 0
-                    row_data[f"{feature_name}_label"] = date_str
-                    row_data[f"{feature_name}_tooltip"] = f"{feature_name}: 0"
+            async def via_js():
+                return await self.extract_chart_data_via_js(page)
+            
+            def has_points(data):
+                if isinstance(data, dict):
+                    return bool(data.get("time_based_data"))
+                return bool(data)
+            
+            # API → JS (과거 통계상 더 빠르게 성공한 방식 우선)
+            strategy, data = await self.run_strategies(
+                [("api", via_api), ("js", via_js)],
+                is_success=has_points,
+                stats_key=f"{self.get_module_name()}:default",
+            )
+            js_data = data if strategy == "js" else {}
+            hover_data = []
+            
+            if strategy == "api":
+                hover_data = data
+                logger.info(f"  ✓ Using data from API extraction ({len(hover_data)} points)")
+            elif strategy == "js":
+                hover_data = js_data.get("time_based_data", [])
+                logger.info(f"  ✓ Using data from JS extraction ({len(hover_data)} points)")
+            else:
+                logger.error("  ✗ Both API and JS extraction failed. No data collected.")
             
-            combined_data.append(row_data)
+            result = {
+                "url": self.stats_url,
+                "scraped_at": datetime.now().isoformat(),
+                "hover_data": hover_data,
+                "js_data": js_data,
+                "page_title": await page.title(),
+            }
+            return result
+        
+        # 피쳐별 데이터 수집: API 응답 → 초기 props.data → 체크박스별 props.data
+        # 과거 통계상 더 빠르게 성공한 방식부터 시도하고, 아직 데이터가 없는 피쳐만 다음 방식으로 채움
+        feature_names = [f.get('feature', f'feature_{idx}') for idx, f in enumerate(features)]
+        all_feature_data = {
+            feature_name: {
+                "hover_data": [],
+                "js_data": {},
+                "api_data": [],
+                "data_source": "none"
+            }
+            for feature_name in feature_names
+        }
+        
+        strategies = {
+            "api": lambda: self.fill_features_from_api(all_feature_data, feature_names),
+            "js_initial": lambda: self.fill_features_from_initial_props(page, all_feature_data),
+            "js_checkbox": lambda: self.fill_features_from_checkboxes(page, features, all_feature_data),
+        }
+        stats = get_strategy_stats()
+        module_name = self.get_module_name()
+        order = stats.order(module_name, list(strategies))
+        if order != list(strategies):
+            logger.info(f"  ℹ [Strategy] Learned order for {module_name}: {' → '.join(order)}")
+        
+        for name in order:
+            missing = [n for n, feat_data in all_feature_data.items() if not feat_data.get("hover_data")]
+            if not missing:
+                logger.info(f"  ✓ [Strategy] All features have data, skipping {name}")
+                continue
+            started = time.monotonic()
+            try:
+                filled = await strategies[name]()
+            except Exception as e:
+                logger.warning(f"  ⚠ [Strategy] {name} raised: {e}")
+                filled = 0
+            elapsed = time.monotonic() - started
+            stats.record(module_name, name, filled > 0, elapsed)
+            logger.info(f"  ℹ [Strategy] {name}: filled {filled}/{len(missing)} features ({elapsed:.1f}s)")
+        
+        logger.info(f"\n[Data Summary]")
+        logger.info(f"  Total features: {len(all_feature_data)}")
+        for feature_name, feat_data in all_feature_data.items():
+            hover_data = feat_data.get("hover_data", [])
+            data_source = feat_data.get("data_source", "unknown")
+            logger.info(f"    - {feature_name}: {len(hover_data)} points ({data_source})")
+        if not any(feat_data.get("hover_data") for feat_data in all_feature_data.values()):
+            logger.warning(f"  ⚠ No data found for any feature, filling requested date range with 0")
+        
+        # 실제 날짜 라벨 기준으로 피쳐별 시리즈 결합
+        combined_data = self.build_combined_data(all_feature_data, self.output_format)
+        logger.info(f"  ✓ Combined data: {len(combined_data)} rows ({self.output_format})")
         
         result = {
             "url": self.stats_url,
@@ -2301,6 +2318,7 @@ class BookingTrendChartScraper(BaseScraper):
             "features": [f.get('feature') for f in features],
             "feature_data": all_feature_data,
             "combined_data": combined_data,
+            "combined_format": self.output_format,
             "hover_data": combined_data,  # CSV 저장을 위해
             "network_responses": [{"url": r["url"], "status": r["status"]} for r in self.network_responses],
             "page_title": await page.title(),
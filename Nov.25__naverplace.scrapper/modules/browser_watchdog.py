@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+브라우저 재생성 워치독
+장시간 실행 시 탭/컨텍스트를 주기적으로 새로 만들어 메모리 사용량을 일정하게 유지
+
+- 작업자마다 전용 슬롯(컨텍스트 + 탭, 파이프라인 실행 시 탭 여러 개)을 사용
+- 탭: N개 작업마다 또는 JS 힙이 임계값을 넘으면 같은 컨텍스트에서 새 탭으로 교체
+- 컨텍스트: M개 작업마다 로그인 세션(storage state)을 옮겨 담은 새 컨텍스트로 교체
+"""
+
+from dataclasses import dataclass
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RecycleConfig:
+    """재생성 기준"""
+    max_tasks_per_page: int = 25
+    max_tasks_per_context: int = 100
+    max_js_heap_mb: float = 400.0  # 탭의 JS 힙 사용량 임계값 (MB)
+
+
+class BrowserSlot:
+    """작업자 하나가 쓰는 컨텍스트와 탭"""
+
+    def __init__(self, slot_id: int, context, page, config: RecycleConfig = None, on_new_page=None):
+        """
+        Args:
+            slot_id: 작업자 번호 (로그 출력용)
+            context: 로그인된 BrowserContext
+            page: context 안의 탭
+            config: 재생성 기준
+            on_new_page: 새 탭이 만들어질 때마다 호출 (page) - 리스너 재등록용
+        """
+        self.slot_id = slot_id
+        self.context = context
+        self.pages = [page]  # 파이프라인 실행 시 탭 여러 개 (ensure_pages)
+        self.config = config or RecycleConfig()
+        self.on_new_page = on_new_page
+        self.page_tasks = 0
+        self.context_tasks = 0
+        self.page_recycles = 0
+        self.context_recycles = 0
+        self.peak_heap_mb = 0.0
+
+    async def ensure_pages(self, count: int):
+        """슬롯의 탭을 count개로 맞춤 (같은 컨텍스트)"""
+        while len(self.pages) < count:
+            self.pages.append(await self._open_page())
+
+    async def js_heap_mb(self) -> float:
+        """슬롯 탭들 중 가장 큰 JS 힙 사용량 (MB, Chromium 전용 performance.memory)"""
+        heap_mb = 0.0
+        for page in self.pages:
+            try:
+                used = await page.evaluate(
+                    "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+                )
+                heap_mb = max(heap_mb, (used or 0) / (1024 * 1024))
+            except Exception:
+                pass
+        return heap_mb
+
+    async def check(self):
+        """
+        작업 하나가 끝날 때마다 호출: 카운터 증가 후 재생성 필요 여부 판단
+
+        Returns:
+            tuple: ("context" | "page" | None, 사유)
+        """
+        self.page_tasks += 1
+        self.context_tasks += 1
+
+        if self.context_tasks >= self.config.max_tasks_per_context:
+            return "context", f"{self.context_tasks} tasks on context"
+
+        heap_mb = await self.js_heap_mb()
+        self.peak_heap_mb = max(self.peak_heap_mb, heap_mb)
+        if heap_mb >= self.config.max_js_heap_mb:
+            return "page", f"JS heap {heap_mb:.0f}MB"
+        if self.page_tasks >= self.config.max_tasks_per_page:
+            return "page", f"{self.page_tasks} tasks on page"
+        return None, None
+
+    async def recycle(self, kind: str, reason: str):
+        if kind == "context":
+            await self.recycle_context(reason)
+        elif kind == "page":
+            await self.recycle_page(reason)
+
+    async def _open_page(self):
+        page = await self.context.new_page()
+        if self.on_new_page is not None:
+            self.on_new_page(page)
+        return page
+
+    async def _replace_pages(self):
+        count = len(self.pages)
+        old_pages = self.pages
+        self.pages = [await self._open_page() for _ in range(count)]
+        return old_pages
+
+    async def recycle_page(self, reason: str):
+        """같은 컨텍스트(같은 쿠키)에서 새 탭으로 교체"""
+        logger.info(f"  ℹ [Watchdog] Slot {self.slot_id}: recycling page ({reason})")
+        for old_page in await self._replace_pages():
+            try:
+                await old_page.close()
+            except Exception:
+                pass
+        self.page_tasks = 0
+        self.page_recycles += 1
+
+    async def recycle_context(self, reason: str):
+        """현재 세션(storage state)을 옮겨 담은 새 컨텍스트와 탭으로 교체"""
+        logger.info(f"  ℹ [Watchdog] Slot {self.slot_id}: recycling context ({reason})")
+        old_context = self.context
+        storage_state = await old_context.storage_state()
+        self.context = await old_context.browser.new_context(storage_state=storage_state)
+        await self._replace_pages()
+        try:
+            await old_context.close()
+        except Exception:
+            pass
+        self.page_tasks = 0
+        self.context_tasks = 0
+        self.context_recycles += 1
+
+    def summary(self) -> str:
+        return (f"Slot {self.slot_id}: {self.page_recycles} page / {self.context_recycles} context recycles, "
+                f"peak JS heap {self.peak_heap_mb:.0f}MB")
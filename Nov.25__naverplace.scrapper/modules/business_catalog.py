@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+사업장 카탈로그
+사업장별 플레이스/예약/스마트콜/SMLOG 식별자를 파일에서 로드
+"""
+
+import json
+import os
+from dataclasses import dataclass, asdict
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BusinessProfile:
+    """사업장 하나의 식별자 묶음"""
+    key: str  # 출력 폴더 파티션 이름 (예: "centum")
+    name: str
+    place_id: str
+    booking_business_id: str
+    smartcall_id: str
+    smlog_svid: str = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# 카탈로그 파일이 없을 때 사용하는 기본 사업장
+DEFAULT_BUSINESS = BusinessProfile(
+    key="centum",
+    name="센텀",
+    place_id="5921383",
+    booking_business_id="603738",
+    smartcall_id="1191881927",
+    smlog_svid="33138",
+)
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "business_catalog.json"
+)
+
+
+def load_business_catalog(path: str = None) -> list:
+    """
+    사업장 카탈로그 로드
+
+    JSON 형식: {"businesses": [{"key": ..., "name": ..., "place_id": ..., "booking_business_id": ...,
+                              "smartcall_id": ..., "smlog_svid": ...}, ...]}
+
+    Args:
+        path: 카탈로그 파일 경로 (기본: ../../data/business_catalog.json)
+
+    Returns:
+        list: BusinessProfile 리스트 (파일이 없으면 [DEFAULT_BUSINESS])
+    """
+    catalog_path = path or DEFAULT_CATALOG_PATH
+    if not os.path.exists(catalog_path):
+        logger.info(f"  ℹ Business catalog not found ({catalog_path}), using default business")
+        return [DEFAULT_BUSINESS]
+
+    with open(catalog_path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    entries = raw.get("businesses", []) if isinstance(raw, dict) else raw
+    businesses = []
+    for entry in entries:
+        if entry.get("enabled", True) is False:
+            continue
+        businesses.append(BusinessProfile(
+            key=str(entry["key"]),
+            name=str(entry.get("name", entry["key"])),
+            place_id=str(entry["place_id"]),
+            booking_business_id=str(entry["booking_business_id"]),
+            smartcall_id=str(entry["smartcall_id"]),
+            smlog_svid=str(entry["smlog_svid"]) if entry.get("smlog_svid") else None,
+        ))
+
+    keys = [b.key for b in businesses]
+    if len(keys) != len(set(keys)):
+        raise ValueError(f"Duplicate business keys in catalog: {catalog_path}")
+
+    logger.info(f"✓ Business catalog loaded from {catalog_path} ({len(businesses)} businesses)")
+    return businesses
+
+
+def business_output_dir(output_base_dir: str, business: BusinessProfile) -> str:
+    """사업장별 출력 파티션 경로 (예: data/naverplace/centum)"""
+    return os.path.join(output_base_dir, business.key)
@@ -15,6 +15,18 @@ from dataclasses import dataclass
 import pandas as pd
 from playwright.async_api import async_playwright, Page
 
+from .business_catalog import BusinessProfile, DEFAULT_BUSINESS
+from .rate_limiter import get_rate_limiter
+from .selector_resolver import get_selector_resolver, CACHE_RELATIVE_PATH
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 셀렉터 캐시 구분용 페이지 종류
+LOGIN_PAGE_TYPE = "naver_login"
+
 
 @dataclass
 class LoginSelectors:
@@ -32,11 +44,10 @@ class LoginSelectors:
     )
     ip_toggle_label: str = "#login_keep_wrap > div.ip_check > span > label"
     login_button: str = "#log\\.login"
+    # IP 보안 체크박스만 (로그인 상태 유지 #keep_login 등은 다른 컨트롤이므로 후보에 넣지 않음)
     ip_checkbox_candidates: tuple = (
         "#ip_on",
-        "#keep_login",
-        "#keep_login_chk",
-        "#login_keep_wrap input[type='checkbox']",
+        "#login_keep_wrap > div.ip_check input[type='checkbox']",
     )
     search_button_selectors: tuple = (
         "#search_btn",
@@ -47,136 +58,131 @@ class LoginSelectors:
 
 
 class NaverPlaceLogin:
-    def __init__(self, username: str, password: str):
+    def __init__(self, username: str, password: str, business: BusinessProfile = None, output_base_dir: str = "data/naverplace"):
         self.username = username
         self.password = password
+        self.business = business or DEFAULT_BUSINESS
         self.login_url = (
             "https://nid.naver.com/nidlogin.login"
             "?svctype=1&locale=ko_KR&url=https%3A%2F%2Fnew.smartplace.naver.com%2F&area=bbt"
         )
         self.base_url = (
-            "https://new.smartplace.naver.com/bizes/place/5921383"
-            "?bookingBusinessId=603738"
+            f"https://new.smartplace.naver.com/bizes/place/{self.business.place_id}"
+            f"?bookingBusinessId={self.business.booking_business_id}"
         )
         self.selectors = LoginSelectors()
+        self.resolver = get_selector_resolver(os.path.join(output_base_dir, CACHE_RELATIVE_PATH))
 
     async def fill_text_input(
         self, page: Page, selectors: tuple, value: str, field_name: str
     ) -> bool:
-        """Try multiple selectors until the text field is filled."""
-        for selector in selectors:
+        """Resolve the first existing candidate in one round trip and fill it."""
+        key = f"{field_name.lower()}_input"
+        remaining = list(selectors)
+        while remaining:
+            match = await self.resolver.resolve(page, LOGIN_PAGE_TYPE, key, remaining)
+            if match is None:
+                break
             try:
-                locator = page.locator(selector)
-                if await locator.count() == 0:
-                    continue
-                target = locator.first
+                target = match.locator(page)
                 await target.fill("")
                 await target.fill(value)
-                print(f"  ✓ {field_name} filled via selector: {selector}")
+                logger.info(f"  ✓ {field_name} filled via selector: {match.selector}")
                 return True
             except Exception as e:
-                print(f"  ⚠ Failed to fill {field_name} with {selector}: {e}")
-                continue
+                logger.warning(f"  ⚠ Failed to fill {field_name} with {match.selector}: {e}")
+                self.resolver.forget(LOGIN_PAGE_TYPE, key)
+                remaining.remove(match.selector)
 
-        print(f"  ✗ Could not fill {field_name} (selectors exhausted)")
+        logger.error(f"  ✗ Could not fill {field_name} (selectors exhausted)")
         return False
 
     async def is_login_form_visible(self, page: Page) -> bool:
         """Check if login ID input is still visible."""
-        for selector in self.selectors.id_input_candidates:
-            try:
-                if await page.is_visible(selector):
-                    return True
-            except Exception:
-                continue
-        return False
+        match = await self.resolver.resolve(
+            page, LOGIN_PAGE_TYPE, "id_input", self.selectors.id_input_candidates, visible=True
+        )
+        return match is not None
 
     async def check_ip_toggle_state(self, page: Page) -> tuple[bool, object]:
-        """IP 보안 토글 상태 확인. (is_off, checkbox_element) 반환"""
-        checkbox = None
-        for selector in self.selectors.ip_checkbox_candidates:
-            try:
-                checkbox = await page.query_selector(selector)
-                if checkbox:
-                    print(f"  Found checkbox selector: {selector}")
-                    break
-            except Exception:
-                continue
-        
-        if not checkbox:
+        """IP 보안 토글 상태 확인. (is_off, checkbox_locator) 반환 - 후보 확인과 체크 상태를 한 번에 조회"""
+        match = await self.resolver.resolve(
+            page, LOGIN_PAGE_TYPE, "ip_checkbox", self.selectors.ip_checkbox_candidates
+        )
+        if match is None:
             return None, None
         
-        try:
-            is_checked = await checkbox.is_checked()
-            return not is_checked, checkbox  # is_off = not is_checked
-        except Exception:
+        logger.info(f"  Found checkbox selector: {match.selector}")
+        checkbox = match.locator(page)
+        if match.checked is None:
             return None, checkbox
+        return not match.checked, checkbox  # is_off = not is_checked
 
     async def toggle_ip_security_off(self, page: Page) -> bool:
         """IP 보안 토글을 OFF로 설정하고 검증. 성공 시 True 반환"""
-        print("\n[Login] Checking IP security toggle state...")
+        logger.info("\n[Login] Checking IP security toggle state...")
         
         # 현재 상태 확인
         is_off, checkbox = await self.check_ip_toggle_state(page)
         
         toggle_label = await page.query_selector(self.selectors.ip_toggle_label)
         if not toggle_label:
-            print("  ⚠ IP security toggle label not found")
+            logger.warning("  ⚠ IP security toggle label not found")
             return False
         
         if checkbox is None:
-            print("  ⚠ Checkbox element not found")
+            logger.warning("  ⚠ Checkbox element not found")
             return False
         
         # 상태가 불명확한 경우
         if is_off is None:
-            print("  ℹ Checkbox state unknown, clicking label to ensure OFF")
+            logger.info("  ℹ Checkbox state unknown, clicking label to ensure OFF")
             await toggle_label.click()
             await asyncio.sleep(0.5)
             # 재확인
             is_off, _ = await self.check_ip_toggle_state(page)
             if is_off:
-                print("  ✓ IP security toggle is now OFF")
+                logger.info("  ✓ IP security toggle is now OFF")
                 return True
             else:
-                print("  ⚠ Failed to verify toggle state")
+                logger.warning("  ⚠ Failed to verify toggle state")
                 return False
         
         # 이미 OFF인 경우
         if is_off:
-            print("  ✓ IP security toggle is already OFF")
+            logger.info("  ✓ IP security toggle is already OFF")
             return True
         
         # ON인 경우 OFF로 변경
-        print("  IP security is ON → toggling OFF")
+        logger.info("  IP security is ON → toggling OFF")
         await toggle_label.click()
         await asyncio.sleep(0.5)
         
         # 변경 후 재확인
         is_off_after, _ = await self.check_ip_toggle_state(page)
         if is_off_after:
-            print("  ✓ IP security toggle successfully set to OFF")
+            logger.info("  ✓ IP security toggle successfully set to OFF")
             return True
         else:
-            print("  ⚠ Toggle still ON after click, trying again...")
+            logger.warning("  ⚠ Toggle still ON after click, trying again...")
             await toggle_label.click()
             await asyncio.sleep(0.5)
             # 최종 확인
             is_off_final, _ = await self.check_ip_toggle_state(page)
             if is_off_final:
-                print("  ✓ IP security toggle is now OFF (after retry)")
+                logger.info("  ✓ IP security toggle is now OFF (after retry)")
                 return True
             else:
-                print("  ✗ Failed to set IP security toggle to OFF")
+                logger.error("  ✗ Failed to set IP security toggle to OFF")
                 return False
 
     async def perform_login(self, page: Page) -> bool:
         """Complete the login sequence."""
-        print("\n[Login] Starting login sequence...")
-        await page.goto(self.login_url, wait_until="networkidle")
+        logger.info("\n[Login] Starting login sequence...")
+        await get_rate_limiter().goto(page, self.login_url, wait_until="networkidle")
         await asyncio.sleep(1)
 
-        print("  Filling ID/PW...")
+        logger.info("  Filling ID/PW...")
         id_filled = await self.fill_text_input(
             page, self.selectors.id_input_candidates, self.username, "ID"
         )
@@ -184,60 +190,60 @@ class NaverPlaceLogin:
             page, self.selectors.pw_input_candidates, self.password, "Password"
         )
         if not (id_filled and pw_filled):
-            print("  ✗ Unable to fill ID or Password field")
+            logger.error("  ✗ Unable to fill ID or Password field")
             return False
         await asyncio.sleep(0.5)
 
         # IP 보안 토글을 OFF로 설정하고 검증
         toggle_off_success = await self.toggle_ip_security_off(page)
         if not toggle_off_success:
-            print("  ✗ Failed to set IP security toggle to OFF. Aborting login.")
+            logger.error("  ✗ Failed to set IP security toggle to OFF. Aborting login.")
             return False
         
         # 최종 확인: toggle이 OFF 상태인지 재검증
         is_off_final, _ = await self.check_ip_toggle_state(page)
         if is_off_final is not True:
-            print("  ✗ IP security toggle verification failed. Aborting login.")
+            logger.error("  ✗ IP security toggle verification failed. Aborting login.")
             return False
         
-        print("  ✓ IP security toggle confirmed OFF. Proceeding with login...")
+        logger.info("  ✓ IP security toggle confirmed OFF. Proceeding with login...")
         await asyncio.sleep(0.3)
 
-        print("  Clicking login button...")
+        logger.info("  Clicking login button...")
         await page.click(self.selectors.login_button)
 
         try:
             await page.wait_for_load_state("networkidle", timeout=10000)
         except Exception:
-            print("  ⚠ Login page did not reach networkidle, continuing")
+            logger.warning("  ⚠ Login page did not reach networkidle, continuing")
         await asyncio.sleep(1.5)
 
         # Simple validation: check if login input still visible
         if await self.is_login_form_visible(page):
-            print("  ✗ Login might have failed (ID input still visible)")
+            logger.error("  ✗ Login might have failed (ID input still visible)")
             return False
 
-        print("  ✓ Login successful")
+        logger.info("  ✓ Login successful")
         return True
 
     async def navigate_to_base(self, page: Page) -> bool:
         """Navigate to the base SmartPlace URL after login."""
-        print("\n[Navigation] Moving to base dashboard...")
-        await page.goto(self.base_url, wait_until="domcontentloaded")
+        logger.info("\n[Navigation] Moving to base dashboard...")
+        await get_rate_limiter().goto(page, self.base_url, wait_until="domcontentloaded")
         await asyncio.sleep(2)
 
         if "smartplace.naver.com" in page.url:
-            print(f"  ✓ Arrived at {page.url}")
+            logger.info(f"  ✓ Arrived at {page.url}")
             return True
 
-        print(f"  ⚠ Unexpected URL after navigation: {page.url}")
+        logger.warning(f"  ⚠ Unexpected URL after navigation: {page.url}")
         return False
 
     async def run(self) -> bool:
         """Main execution entry."""
-        print("=" * 70)
-        print("Naver SmartPlace Login Automation")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("Naver SmartPlace Login Automation")
+        logger.info("=" * 70)
 
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
@@ -271,7 +277,7 @@ def load_credentials():
     creds = pd.read_csv(csv_path)
     username = creds.iloc[0, 0]
     password = creds.iloc[0, 1]
-    print(f"✓ Credentials loaded from {csv_path}")
+    logger.info(f"✓ Credentials loaded from {csv_path}")
     return username, password
 
 
@@ -9,17 +9,26 @@ import re
 from datetime import datetime
 from playwright.async_api import Page
 from .base_scraper import BaseScraper
+from .business_catalog import BusinessProfile
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class PlaceHourlyInflowGraphScraper(BaseScraper):
     """플레이스 시간별 유입 그래프 데이터 스크래퍼"""
     
-    def __init__(self, username: str, password: str, start_date: str = "2025-11-15", end_date: str = "2025-11-15", output_base_dir: str = "data/naverplace"):
-        super().__init__(username, password, start_date, end_date, output_base_dir)
+    empty_state_texts = ("조회 기간에 수집된 데이터가 없습니다",)
+    data_ready_selector = ".Statistics_chart__A_V_H canvas"
+    empty_state_anchor = ".Statistics_chart__A_V_H"  # 시간대별 차트 컨테이너
+    
+    def __init__(self, username: str, password: str, start_date: str = "2025-11-15", end_date: str = "2025-11-15", output_base_dir: str = "data/naverplace", business: BusinessProfile = None):
+        super().__init__(username, password, start_date, end_date, output_base_dir, business)
         # URL 동적 생성
         self.stats_url = (
-            f"https://new.smartplace.naver.com/bizes/place/5921383/statistics"
-            f"?bookingBusinessId=603738&endDate={end_date}&menu=place"
+            f"https://new.smartplace.naver.com/bizes/place/{self.business.place_id}/statistics"
+            f"?bookingBusinessId={self.business.booking_business_id}&endDate={end_date}&menu=place"
             f"&placeTab=inflow&startDate={start_date}&term=daily"
         )
     
@@ -28,41 +37,41 @@ class PlaceHourlyInflowGraphScraper(BaseScraper):
     
     async def wait_for_chart_load(self, page: Page, timeout: int = 10000) -> bool:
         """차트가 로드될 때까지 대기"""
-        print("\n[Chart] Waiting for chart to load...")
+        logger.info("\n[Chart] Waiting for chart to load...")
         try:
             await page.wait_for_selector(".Statistics_chart__A_V_H", timeout=timeout)
-            print("  ✓ Chart container found")
+            logger.info("  ✓ Chart container found")
             await page.wait_for_selector(".Statistics_chart__A_V_H canvas", timeout=5000)
-            print("  ✓ Canvas element found")
+            logger.info("  ✓ Canvas element found")
             await asyncio.sleep(2)
             return True
         except Exception as e:
-            print(f"  ⚠ Chart loading timeout or error: {e}")
+            logger.warning(f"  ⚠ Chart loading timeout or error: {e}")
             return False
     
     async def extract_chart_data_via_hover(self, page: Page) -> list:
         """그래프에 롤오버하여 시간별 데이터 추출 (예: "0시 27회")"""
-        print("\n[Data Extraction] Extracting time-based chart data via hover...")
+        logger.info("\n[Data Extraction] Extracting time-based chart data via hover...")
         
         chart_data = []
         
         try:
             chart_container = await page.query_selector(".Statistics_chart__A_V_H")
             if not chart_container:
-                print("  ✗ Chart container not found")
+                logger.error("  ✗ Chart container not found")
                 return chart_data
             
             canvas = await chart_container.query_selector("canvas")
             if not canvas:
-                print("  ✗ Canvas element not found")
+                logger.error("  ✗ Canvas element not found")
                 return chart_data
             
             canvas_box = await canvas.bounding_box()
             if not canvas_box:
-                print("  ✗ Canvas bounding box not available")
+                logger.error("  ✗ Canvas bounding box not available")
                 return chart_data
             
-            print(f"  Canvas size: {canvas_box['width']} x {canvas_box['height']}")
+            logger.info(f"  Canvas size: {canvas_box['width']} x {canvas_box['height']}")
             
             chart_start_y = canvas_box['y'] + 20
             chart_end_y = canvas_box['y'] + canvas_box['height'] - 40
@@ -171,7 +180,7 @@ class PlaceHourlyInflowGraphScraper(BaseScraper):
                         "y_coordinate": best_tooltip["y_position"],
                     }
                     chart_data.append(point_data)
-                    print(f"  ✓ {best_tooltip['hour']}시: {best_tooltip['text']}")
+                    logger.debug("  ✓ %s시: %s", best_tooltip['hour'], best_tooltip['text'])
                 else:
                     point_data = {
                         "hour": hour,
@@ -182,21 +191,19 @@ class PlaceHourlyInflowGraphScraper(BaseScraper):
                     }
                     chart_data.append(point_data)
                     if hour % 6 == 0:
-                        print(f"  ⚠ {hour}시: No data found")
+                        logger.debug("  ⚠ %s시: No data found", hour)
             
             chart_data.sort(key=lambda x: x["hour"])
-            print(f"  ✓ Extracted data from {len([d for d in chart_data if d.get('count') is not None])} time points")
+            logger.info(f"  ✓ Extracted data from {len([d for d in chart_data if d.get('count') is not None])} time points")
             return chart_data
             
         except Exception as e:
-            print(f"  ✗ Error extracting chart data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting chart data: {e}", exc_info=True)
             return chart_data
     
     async def extract_chart_data_via_js(self, page: Page) -> dict:
         """JavaScript를 사용하여 차트 데이터 직접 추출"""
-        print("\n[Data Extraction] Extracting chart data via JavaScript...")
+        logger.info("\n[Data Extraction] Extracting chart data via JavaScript...")
         
         try:
             chart_data_result = await page.evaluate(
@@ -464,28 +471,30 @@ class PlaceHourlyInflowGraphScraper(BaseScraper):
             }
             
             if chart_data_result and not chart_data_result.get('error'):
-                print(f"  ✓ Chart library: {chart_data_result.get('source')}")
+                logger.info(f"  ✓ Chart library: {chart_data_result.get('source')}")
                 time_based_data = result.get("time_based_data", [])
                 if time_based_data:
-                    print(f"  ✓ Parsed {len(time_based_data)} time-based data points")
+                    logger.info(f"  ✓ Parsed {len(time_based_data)} time-based data points")
                     for i, item in enumerate(time_based_data[:3]):
                         if item.get('count') is not None:
-                            print(f"    - {item.get('hour')}시: {item.get('count')}회")
+                            logger.debug("    - %s시: %s회", item.get('hour'), item.get('count'))
             else:
                 error_msg = chart_data_result.get('error') if chart_data_result else 'No data found'
-                print(f"  ⚠ {error_msg}")
+                logger.warning(f"  ⚠ {error_msg}")
             
             return result
             
         except Exception as e:
-            print(f"  ✗ Error extracting via JS: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting via JS: {e}", exc_info=True)
             return {}
     
+    async def prepare_page(self, page: Page):
+        """페이지 이동 전에 reports/차트 API 응답 캡처 시작"""
+        await self.setup_network_interception(page)
+    
     async def setup_network_interception(self, page: Page):
         """네트워크 요청을 가로채서 데이터 추출"""
-        print("\n[Network] Setting up network interception...")
+        logger.info("\n[Network] Setting up network interception...")
         
         async def handle_response(response):
             url = response.url
@@ -499,38 +508,62 @@ class PlaceHourlyInflowGraphScraper(BaseScraper):
                             "status": response.status,
                             "data": data,
                         })
-                        print(f"  ✓ Captured API response: {url[:80]}...")
+                        logger.debug("  ✓ Captured API response: %s...", url[:80])
                 except Exception:
                     pass
         
-        page.on("response", handle_response)
+        self.add_page_listener(page, "response", handle_response)
+    
+    async def empty_data(self, page: Page) -> dict:
+        """빈 기간: 0~23시 모두 0회"""
+        hover_data = [
+            {
+                "hour": hour,
+                "count": 0,
+                "tooltip_text": None,
+                "x_coordinate": None,
+                "y_coordinate": None,
+            }
+            for hour in range(24)
+        ]
+        return {"hover_data": hover_data, "js_data": {}, "network_responses": []}
     
     async def scrape(self, page: Page) -> dict:
         """통계 페이지에서 데이터 스크래핑"""
-        print("\n[Scraping] Starting place statistics scraping...")
-        
-        await self.setup_network_interception(page)
+        logger.info("\n[Scraping] Starting place statistics scraping...")
         
-        print(f"  Navigating to: {self.stats_url}")
-        await page.goto(self.stats_url, wait_until="networkidle")
-        await asyncio.sleep(5)
+        await self.open_stats_page(page)
         
         await page.evaluate("window.scrollTo(0, 500)")
         await asyncio.sleep(2)
         
         if not await self.wait_for_chart_load(page):
-            print("  ⚠ Chart may not be fully loaded, continuing anyway...")
+            # 차트가 뜨지 않았을 때만 빈 기간 확인 (빈 기간이면 추출 전략 생략)
+            empty_result = await self.check_empty_period(page)
+            if empty_result is not None:
+                return empty_result
+            logger.warning("  ⚠ Chart may not be fully loaded, continuing anyway...")
         
         await asyncio.sleep(3)
         
-        js_data = await self.extract_chart_data_via_js(page)
+        js_data = {}
+        
+        async def via_js():
+            nonlocal js_data
+            js_data = await self.extract_chart_data_via_js(page)
+            return js_data.get("time_based_data", [])
+        
+        async def via_hover():
+            return await self.extract_chart_data_via_hover(page)
+        
+        def has_counts(points):
+            # hover는 읽지 못한 시간대도 count=None으로 24개를 채워 반환하므로 실제 값이 있어야 성공
+            return any(p.get("count") is not None for p in points or [])
         
-        if not js_data.get("time_based_data") or len(js_data.get("time_based_data", [])) == 0:
-            print("\n  ⚠ JS extraction found no data, trying hover method...")
-            hover_data = await self.extract_chart_data_via_hover(page)
-        else:
-            hover_data = js_data.get("time_based_data", [])
-            print(f"\n  ✓ Using data from JS extraction ({len(hover_data)} points)")
+        # 기본 순서: JS → hover (과거 통계상 더 빠르게 성공한 전략 우선)
+        strategy, hover_data = await self.run_strategies([("js", via_js), ("hover", via_hover)], is_success=has_counts)
+        hover_data = hover_data or []
+        logger.info(f"\n  ✓ Using data from {strategy or 'none'} extraction ({len(hover_data)} points)")
         
         api_data = []
         for resp in self.network_responses:
@@ -10,145 +10,172 @@ import pandas as pd
 from datetime import datetime
 from playwright.async_api import Page
 from .base_scraper import BaseScraper
+from .business_catalog import BusinessProfile
+from .run_log import get_logger
+from .run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
 
 
 class PlaceInflowChannelScraper(BaseScraper):
     """플레이스 유입 채널 데이터 스크래퍼"""
     
-    def __init__(self, username: str, password: str, start_date: str = "2025-11-15", end_date: str = "2025-11-15", output_base_dir: str = "data/naverplace"):
-        super().__init__(username, password, start_date, end_date, output_base_dir)
+    empty_state_texts = ("조회 기간에 수집된 데이터가 없습니다",)
+    data_ready_selector = "li.Statistics_inflow_list_item__EjiuR"
+    empty_state_anchor = "[class*='Statistics_inflow_list']"  # 유입 채널 목록
+    
+    def __init__(self, username: str, password: str, start_date: str = "2025-11-15", end_date: str = "2025-11-15", output_base_dir: str = "data/naverplace", business: BusinessProfile = None):
+        super().__init__(username, password, start_date, end_date, output_base_dir, business)
         # URL 동적 생성 (place_hourly_inflow_graph와 동일한 페이지)
         self.stats_url = (
-            f"https://new.smartplace.naver.com/bizes/place/5921383/statistics"
-            f"?bookingBusinessId=603738&endDate={end_date}&menu=place"
+            f"https://new.smartplace.naver.com/bizes/place/{self.business.place_id}/statistics"
+            f"?bookingBusinessId={self.business.booking_business_id}&endDate={end_date}&menu=place"
             f"&placeTab=inflow&startDate={start_date}&term=daily"
         )
     
     def get_module_name(self) -> str:
         return "place_inflow_channel"
     
-    async def extract_channel_data(self, page: Page) -> list:
-        """유입 채널 데이터 추출"""
-        print("\n[Data Extraction] Extracting inflow channel data...")
-        
-        channel_data = []
-        
-        try:
-            # JavaScript로 직접 리스트 아이템 찾기 (실제 HTML 구조에 맞춤)
-            js_result = await page.evaluate(
-                """
-                () => {
-                    const result = {
-                        items_found: 0,
-                        data: []
-                    };
+    async def extract_channel_data_via_js(self, page: Page) -> list:
+        """JavaScript로 리스트 아이템에서 유입 채널 데이터 추출"""
+        # JavaScript로 직접 리스트 아이템 찾기 (실제 HTML 구조에 맞춤)
+        js_result = await page.evaluate(
+            """
+            () => {
+                const result = {
+                    items_found: 0,
+                    data: []
+                };
+                
+                // 리스트 아이템 직접 찾기 (실제 클래스명 사용)
+                const items = document.querySelectorAll('li.Statistics_inflow_list_item__EjiuR');
+                result.items_found = items.length;
+                
+                // 각 항목에서 데이터 추출
+                for (let item of items) {
+                    let channel = null;
+                    let ratio = null;
                     
-                    // 리스트 아이템 직접 찾기 (실제 클래스명 사용)
-                    const items = document.querySelectorAll('li.Statistics_inflow_list_item__EjiuR');
-                    result.items_found = items.length;
+                    // channel 추출
+                    const channelEl = item.querySelector('span.Statistics_name__M29yR');
+                    if (channelEl) {
+                        channel = channelEl.innerText || channelEl.textContent;
+                        channel = channel ? channel.trim() : null;
+                    }
                     
-                    // 각 항목에서 데이터 추출
-                    for (let item of items) {
-                        let channel = null;
-                        let ratio = null;
-                        
-                        // channel 추출
-                        const channelEl = item.querySelector('span.Statistics_name__M29yR');
-                        if (channelEl) {
-                            channel = channelEl.innerText || channelEl.textContent;
-                            channel = channel ? channel.trim() : null;
-                        }
-                        
-                        // ratio 추출
-                        const ratioEl = item.querySelector('span.Statistics_percent__5Tb06');
-                        if (ratioEl) {
-                            let ratioText = ratioEl.innerText || ratioEl.textContent;
-                            if (ratioText) {
-                                ratioText = ratioText.trim();
-                                ratio = ratioText.replace('%', '').replace('％', '').trim();
-                            }
-                        }
-                        
-                        if (channel) {
-                            result.data.push({
-                                channel: channel,
-                                ratio: ratio
-                            });
+                    // ratio 추출
+                    const ratioEl = item.querySelector('span.Statistics_percent__5Tb06');
+                    if (ratioEl) {
+                        let ratioText = ratioEl.innerText || ratioEl.textContent;
+                        if (ratioText) {
+                            ratioText = ratioText.trim();
+                            ratio = ratioText.replace('%', '').replace('％', '').trim();
                         }
                     }
                     
-                    return result;
+                    if (channel) {
+                        result.data.push({
+                            channel: channel,
+                            ratio: ratio
+                        });
+                    }
                 }
-                """
-            )
-            
-            print(f"  Found {js_result.get('items_found', 0)} list items")
-            
-            if js_result.get('data'):
-                channel_data = js_result['data']
-                print(f"  ✓ Extracted {len(channel_data)} channel items")
-                for i, item in enumerate(channel_data, 1):
-                    print(f"    {i}. {item.get('channel')} - {item.get('ratio')}%")
-            else:
-                print("  ⚠ No data extracted")
                 
-                # Playwright 방식으로 재시도
-                print("  Trying Playwright selectors...")
-                items = await page.query_selector_all("li.Statistics_inflow_list_item__EjiuR")
-                print(f"  Found {len(items)} items via Playwright")
+                return result;
+            }
+            """
+        )
+        
+        logger.info(f"  Found {js_result.get('items_found', 0)} list items")
+        
+        channel_data = js_result.get('data') or []
+        if channel_data:
+            logger.info(f"  ✓ Extracted {len(channel_data)} channel items")
+            for i, item in enumerate(channel_data, 1):
+                logger.debug("    %s. %s - %s%%", i, item.get('channel'), item.get('ratio'))
+        return channel_data
+    
+    async def extract_channel_data_via_elements(self, page: Page) -> list:
+        """Playwright 셀렉터로 항목별 유입 채널 데이터 추출"""
+        channel_data = []
+        logger.info("  Trying Playwright selectors...")
+        items = await page.query_selector_all("li.Statistics_inflow_list_item__EjiuR")
+        logger.info(f"  Found {len(items)} items via Playwright")
+        
+        for i, item in enumerate(items, 1):
+            try:
+                # channel 추출
+                channel_element = await item.query_selector("span.Statistics_name__M29yR")
+                channel = None
+                if channel_element:
+                    channel = await channel_element.inner_text()
+                    channel = channel.strip() if channel else None
+                
+                # ratio 추출
+                ratio_element = await item.query_selector("span.Statistics_percent__5Tb06")
+                ratio = None
+                if ratio_element:
+                    ratio_text = await ratio_element.inner_text()
+                    ratio_text = ratio_text.strip() if ratio_text else None
+                    if ratio_text:
+                        ratio = ratio_text.replace("%", "").replace("％", "").strip()
                 
-                for i, item in enumerate(items, 1):
-                    try:
-                        # channel 추출
-                        channel_element = await item.query_selector("span.Statistics_name__M29yR")
-                        channel = None
-                        if channel_element:
-                            channel = await channel_element.inner_text()
-                            channel = channel.strip() if channel else None
-                        
-                        # ratio 추출
-                        ratio_element = await item.query_selector("span.Statistics_percent__5Tb06")
-                        ratio = None
-                        if ratio_element:
-                            ratio_text = await ratio_element.inner_text()
-                            ratio_text = ratio_text.strip() if ratio_text else None
-                            if ratio_text:
-                                ratio = ratio_text.replace("%", "").replace("％", "").strip()
-                        
-                        if channel:
-                            channel_data.append({
-                                "channel": channel,
-                                "ratio": ratio,
-                            })
-                            print(f"  ✓ Item {i}: {channel} - {ratio}%")
-                        else:
-                            print(f"  ⚠ Item {i}: Channel not found")
-                            
-                    except Exception as e:
-                        print(f"  ⚠ Error extracting item {i}: {e}")
-                        continue
+                if channel:
+                    channel_data.append({
+                        "channel": channel,
+                        "ratio": ratio,
+                    })
+                    logger.debug("  ✓ Item %s: %s - %s%%", i, channel, ratio)
+                else:
+                    logger.debug("  ⚠ Item %s: Channel not found", i)
+                    
+            except Exception as e:
+                logger.warning(f"  ⚠ Error extracting item {i}: {e}")
+                continue
+    
+        return channel_data
+    
+    async def extract_channel_data(self, page: Page) -> list:
+        """유입 채널 데이터 추출 (JS → Playwright 셀렉터, 과거 통계상 더 빠르게 성공한 전략 우선)"""
+        logger.info("\n[Data Extraction] Extracting inflow channel data...")
+        
+        channel_data = []
+        
+        try:
+            _, channel_data = await self.run_strategies([
+                ("js", lambda: self.extract_channel_data_via_js(page)),
+                ("elements", lambda: self.extract_channel_data_via_elements(page)),
+            ])
+            channel_data = channel_data or []
             
-            print(f"  ✓ Total extracted: {len(channel_data)} channel items")
+            logger.info(f"  ✓ Total extracted: {len(channel_data)} channel items")
             return channel_data
             
         except Exception as e:
-            print(f"  ✗ Error extracting channel data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting channel data: {e}", exc_info=True)
             return channel_data
     
+    async def empty_data(self, page: Page) -> dict:
+        """빈 기간: 채널/키워드 모두 빈 목록"""
+        return {"channel_data": [], "keyword_data": []}
+    
     async def scrape(self, page: Page) -> dict:
         """통계 페이지에서 유입 채널 데이터 스크래핑"""
-        print("\n[Scraping] Starting place inflow channel scraping...")
+        logger.info("\n[Scraping] Starting place inflow channel scraping...")
         
-        print(f"  Navigating to: {self.stats_url}")
-        await page.goto(self.stats_url, wait_until="networkidle")
-        await asyncio.sleep(5)  # 페이지 로딩 대기
+        await self.open_stats_page(page)
         
         # 스크롤하여 데이터가 보이도록 함
         await page.evaluate("window.scrollTo(0, 800)")
         await asyncio.sleep(2)
         
+        # 데이터가 뜨지 않았을 때만 빈 기간 확인 (빈 기간이면 추출 전략 생략)
+        if not await self.wait_for_data_ready(page):
+            empty_result = await self.check_empty_period(page)
+            if empty_result is not None:
+                return empty_result
+        
         # 유입 채널 데이터 추출
         all_channel_data = await self.extract_channel_data(page)
         
@@ -156,7 +183,7 @@ class PlaceInflowChannelScraper(BaseScraper):
         top_5_data = all_channel_data[:5] if len(all_channel_data) >= 5 else all_channel_data
         bottom_5_data = all_channel_data[5:10] if len(all_channel_data) >= 10 else all_channel_data[5:]
         
-        print(f"\n  Data split: Top 5 rows = {len(top_5_data)}, Bottom 5 rows = {len(bottom_5_data)}")
+        logger.info(f"\n  Data split: Top 5 rows = {len(top_5_data)}, Bottom 5 rows = {len(bottom_5_data)}")
         
         result = {
             "url": self.stats_url,
@@ -180,6 +207,17 @@ class PlaceInflowChannelScraper(BaseScraper):
             date_suffix = f"__{start_str}_{end_str}"
         
         target_date = self.start_date if self.start_date else self.end_date
+        metrics = get_metrics()
+        
+        # 빈 기간: 데이터 없이 수집 완료 기록(JSON)만 남김
+        if data.get("empty_period"):
+            output_dir = self.get_output_dir()
+            json_path = os.path.join(output_dir, f"{module_name}{date_suffix}.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            metrics.record_output(module_name, json_path, rows=0)
+            logger.info(f"\n✓ Empty-period JSON saved: {json_path}")
+            return
         
         # 1. 상위 5행을 현재 폴더(place_inflow_channel)에 저장
         channel_data = data.get("channel_data", [])
@@ -194,7 +232,8 @@ class PlaceInflowChannelScraper(BaseScraper):
             csv_filename = f"{module_name}{date_suffix}.csv"
             csv_path = os.path.join(output_dir, csv_filename)
             df_channel.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"\n✓ Channel CSV saved: {csv_path} ({len(channel_data)} rows)")
+            metrics.record_output(module_name, csv_path, rows=len(df_channel))
+            logger.info(f"\n✓ Channel CSV saved: {csv_path} ({len(channel_data)} rows)")
             
             # JSON도 저장
             json_filename = f"{module_name}{date_suffix}.json"
@@ -207,7 +246,8 @@ class PlaceInflowChannelScraper(BaseScraper):
             }
             with open(json_path, "w", encoding="utf-8") as f:
                 json.dump(channel_result, f, ensure_ascii=False, indent=2)
-            print(f"✓ Channel JSON saved: {json_path}")
+            metrics.record_output(module_name, json_path)
+            logger.info(f"✓ Channel JSON saved: {json_path}")
         
         # 2. 하위 5행을 place_inflow_keyword 폴더에 저장 (channel -> keyword로 변경)
         keyword_data = data.get("keyword_data", [])
@@ -231,7 +271,8 @@ class PlaceInflowChannelScraper(BaseScraper):
             keyword_csv_filename = f"place_inflow_keyword{date_suffix}.csv"
             keyword_csv_path = os.path.join(keyword_output_dir, keyword_csv_filename)
             df_keyword.to_csv(keyword_csv_path, index=False, encoding="utf-8-sig")
-            print(f"✓ Keyword CSV saved: {keyword_csv_path} ({len(keyword_data_renamed)} rows)")
+            metrics.record_output("place_inflow_keyword", keyword_csv_path, rows=len(df_keyword))
+            logger.info(f"✓ Keyword CSV saved: {keyword_csv_path} ({len(keyword_data_renamed)} rows)")
             
             # JSON도 저장
             keyword_json_filename = f"place_inflow_keyword{date_suffix}.json"
@@ -244,5 +285,6 @@ class PlaceInflowChannelScraper(BaseScraper):
             }
             with open(keyword_json_path, "w", encoding="utf-8") as f:
                 json.dump(keyword_result, f, ensure_ascii=False, indent=2)
-            print(f"✓ Keyword JSON saved: {keyword_json_path}")
+            metrics.record_output("place_inflow_keyword", keyword_json_path)
+            logger.info(f"✓ Keyword JSON saved: {keyword_json_path}")
 
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+호스트별 적응형 레이트 리미터
+모든 페이지 이동(page.goto)과 API 호출(context.request)이 이 리미터를 거침
+
+- 호스트마다 토큰 버킷 하나 (new.smartplace, smartcall.smartplace, partner.booking, smlog.co.kr)
+- 빠른 응답이 이어지면 속도를 조금씩 올리고 (additive increase)
+- 429/5xx/느린 응답이면 속도를 크게 낮춤 (multiplicative decrease)
+- 같은 이벤트 루프의 여러 작업자(탭, API 동시 요청)가 같은 버킷을 공유
+"""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+from .run_log import get_logger
+from .run_metrics import get_metrics, content_length
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HostLimitConfig:
+    """호스트 하나의 토큰 버킷 설정"""
+    rate: float = 1.0           # 시작 속도 (초당 요청 수)
+    min_rate: float = 0.2
+    max_rate: float = 4.0
+    burst: float = 2.0          # 버킷 용량 (한 번에 몰아서 보낼 수 있는 요청 수)
+    slow_latency: float = 5.0   # 이 시간(초)을 넘는 응답은 느린 응답으로 간주
+    increase: float = 0.1       # 정상 응답마다 rate += increase
+    decrease: float = 0.5       # 429/5xx마다 rate *= decrease
+    max_cooldown: float = 60.0  # 연속 실패 시 최대 일시 정지 시간 (초)
+
+
+# 호스트별 기본 설정 (페이지 이동은 무겁고, SMLOG API 재생은 가벼움)
+DEFAULT_HOST_CONFIGS = {
+    "new.smartplace.naver.com": HostLimitConfig(rate=1.0, max_rate=3.0),
+    "smartcall.smartplace.naver.com": HostLimitConfig(rate=1.0, max_rate=3.0),
+    "partner.booking.naver.com": HostLimitConfig(rate=1.0, max_rate=3.0),
+    "smlog.co.kr": HostLimitConfig(rate=2.0, max_rate=6.0, burst=4.0),
+}
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def scaled_config(config: HostLimitConfig, share: float) -> HostLimitConfig:
+    """버킷 설정 하나의 속도/버스트를 share 비율로 축소"""
+    return replace(config, rate=config.rate * share, min_rate=config.min_rate * share, max_rate=config.max_rate * share,
+                   burst=max(1.0, config.burst * share))
+
+
+def scaled_host_configs(share: float, host_configs: dict = None) -> dict:
+    """
+    호스트 설정의 속도를 share 비율로 축소 (여러 프로세스가 전체 예산을 나눠 쓸 때)
+    목록에 없는 호스트용 default_config도 scaled_config로 함께 축소해야 함
+
+    Args:
+        share: 이 프로세스 몫 (예: 작업 프로세스 4개면 0.25)
+    """
+    configs = DEFAULT_HOST_CONFIGS if host_configs is None else host_configs
+    return {host: scaled_config(cfg, share) for host, cfg in configs.items()}
+
+
+def host_of(url_or_host: str) -> str:
+    """URL 또는 호스트 문자열에서 호스트만 추출"""
+    if "://" in url_or_host:
+        return urlparse(url_or_host).hostname or url_or_host
+    return url_or_host
+
+
+class HostBucket:
+    """호스트 하나의 토큰 버킷 (속도는 응답에 따라 조정)"""
+
+    def __init__(self, host: str, config: HostLimitConfig):
+        self.host = host
+        self.config = config
+        self.rate = config.rate
+        self.tokens = config.burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.backoffs = 0
+        self._locks = weakref.WeakKeyDictionary()  # 이벤트 루프 -> asyncio.Lock (Lock은 생성된 루프에서만 사용 가능)
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.config.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (대기자는 도착 순서대로 처리)"""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        started = time.monotonic()
+        async with lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    get_metrics().sleep_seconds.inc(now - started, reason="rate_limit")
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def record(self, latency: float = None, status: int = None, error: bool = False, retry_after: float = None):
+        """응답 결과를 반영해 속도 조정"""
+        cfg = self.config
+        if error or (status is not None and status in RETRYABLE_STATUSES):
+            self.consecutive_failures += 1
+            self.backoffs += 1
+            self.rate = max(cfg.min_rate, self.rate * cfg.decrease)
+            self.tokens = 0
+            cooldown = retry_after if retry_after else min(cfg.max_cooldown, 2 ** (self.consecutive_failures - 1))
+            self.blocked_until = max(self.blocked_until, time.monotonic() + cooldown)
+            logger.warning(f"  ⚠ [RateLimit] {self.host} backoff (status={status}, error={error}) → {self.rate:.2f} req/s, pause {cooldown:.1f}s")
+            return
+
+        self.consecutive_failures = 0
+        if latency is not None and latency > cfg.slow_latency:
+            self.rate = max(cfg.min_rate, self.rate * 0.8)
+        else:
+            self.rate = min(cfg.max_rate, self.rate + cfg.increase)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음"""
+
+    def __init__(self, host_configs: dict = None, default_config: HostLimitConfig = None):
+        self.host_configs = dict(DEFAULT_HOST_CONFIGS if host_configs is None else host_configs)
+        self.default_config = default_config or HostLimitConfig()
+        self.buckets = {}
+
+    def bucket(self, url_or_host: str) -> HostBucket:
+        host = host_of(url_or_host)
+        if host not in self.buckets:
+            config = self.host_configs.get(host)
+            if config is None:
+                # 서브도메인 매칭 (예: www.smlog.co.kr → smlog.co.kr)
+                config = next(
+                    (cfg for name, cfg in self.host_configs.items() if host.endswith("." + name)),
+                    self.default_config
+                )
+            self.buckets[host] = HostBucket(host, config)
+        return self.buckets[host]
+
+    async def acquire(self, url_or_host: str):
+        await self.bucket(url_or_host).acquire()
+
+    def record(self, url_or_host: str, latency: float = None, status: int = None, error: bool = False, retry_after: float = None):
+        self.bucket(url_or_host).record(latency, status, error, retry_after)
+
+    async def goto(self, page, url: str, **kwargs):
+        """리미터를 거쳐 page.goto 실행"""
+        await self.acquire(url)
+        started = time.monotonic()
+        try:
+            response = await page.goto(url, **kwargs)
+        except Exception:
+            self.record(url, time.monotonic() - started, error=True)
+            raise
+        latency = time.monotonic() - started
+        status = response.status if response else None
+        self.record(url, latency, status, retry_after=_retry_after(response))
+        metrics = get_metrics()
+        metrics.page_load_seconds.observe(latency, host=host_of(url))
+        metrics.bytes_downloaded.inc(content_length(response), host=host_of(url))
+        return response
+
+    async def fetch(self, request_context, url: str, **kwargs):
+        """리미터를 거쳐 APIRequestContext.fetch 실행"""
+        await self.acquire(url)
+        started = time.monotonic()
+        try:
+            response = await request_context.fetch(url, **kwargs)
+        except Exception:
+            self.record(url, time.monotonic() - started, error=True)
+            raise
+        latency = time.monotonic() - started
+        self.record(url, latency, response.status, retry_after=_retry_after(response))
+        metrics = get_metrics()
+        metrics.api_request_seconds.observe(latency, host=host_of(url))
+        metrics.bytes_downloaded.inc(content_length(response), host=host_of(url))
+        return response
+
+    def observe(self, page):
+        """
+        페이지 안에서 발생한 XHR/fetch 응답 중 429/5xx/느린 응답을 감속 신호로 반영
+        (정상 응답은 반영하지 않음 - 페이지 하나에 XHR이 많아 속도가 과하게 오르는 것 방지)
+        """
+        def handle_response(response):
+            request = response.request
+            if request.resource_type not in ("xhr", "fetch"):
+                return
+            host = host_of(response.url)
+            if host not in self.buckets and not any(host == h or host.endswith("." + h) for h in self.host_configs):
+                return
+            bucket = self.bucket(host)
+            get_metrics().bytes_downloaded.inc(content_length(response), host=host)
+            if response.status in RETRYABLE_STATUSES:
+                bucket.record(status=response.status, retry_after=_retry_after(response))
+                return
+            timing = request.timing or {}
+            if timing.get("requestStart", -1) >= 0 and timing.get("responseEnd", -1) >= 0:
+                latency = (timing["responseEnd"] - timing["requestStart"]) / 1000
+                if latency > bucket.config.slow_latency:
+                    bucket.record(latency=latency)
+
+        page.on("response", handle_response)
+
+    def snapshot(self) -> dict:
+        """호스트별 현재 상태 (요약 출력용)"""
+        return {
+            host: {"rate": round(b.rate, 2), "requests": b.requests, "backoffs": b.backoffs}
+            for host, b in self.buckets.items()
+        }
+
+    def print_summary(self):
+        if not self.buckets:
+            return
+        logger.info("\n[RateLimit] Per-host summary:")
+        for host, stats in self.snapshot().items():
+            logger.info(f"  {host}: {stats['requests']} requests, {stats['backoffs']} backoffs, final rate {stats['rate']} req/s")
+
+
+def _retry_after(response):
+    """Retry-After 헤더(초) 파싱"""
+    if response is None:
+        return None
+    try:
+        value = response.headers.get("retry-after")
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+_default_limiter = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """프로세스 공용 리미터 (모든 스크래퍼가 같은 버킷을 공유)"""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = HostRateLimiter()
+    return _default_limiter
+
+
+def set_rate_limiter(limiter: HostRateLimiter):
+    """프로세스 공용 리미터 교체 (예: 백필 작업 프로세스마다 축소된 예산 적용)"""
+    global _default_limiter
+    _default_limiter = limiter
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+구조화 로깅
+print 대신 레벨이 있는 로거 사용: 콘솔에는 기존과 같은 형식, 파일에는 JSON lines
+
+- 작업 컨텍스트(사업장, 모듈, 날짜)는 contextvars로 보관 → 동시에 실행되는 작업자별로 자동 구분
+- 반복문 안의 상세 메시지(hover 포인트, 항목/행별 출력)는 DEBUG
+  기본 레벨(INFO)에서는 포맷팅 없이 건너뜀 (logger.debug("...%s", value) 형태로 지연 포맷팅)
+- 레벨: configure_logging(level) 또는 환경 변수 NAVERPLACE_LOG_LEVEL (기본 INFO)
+"""
+
+import contextvars
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+
+LOGGER_ROOT = "scraper"
+LOG_LEVEL_ENV = "NAVERPLACE_LOG_LEVEL"
+DEFAULT_LOG_PATH = os.path.join("data", "naverplace", "_logs", "run.jsonl")
+CONTEXT_FIELDS = ("business", "module", "date")
+
+_task_context = contextvars.ContextVar("task_context", default={})
+
+
+# ----------------------------------------------------------------------
+# 작업 컨텍스트
+# ----------------------------------------------------------------------
+@contextmanager
+def task_context(**fields):
+    """
+    이 블록(같은 asyncio 작업) 안의 모든 로그에 컨텍스트 필드 추가
+
+    예: with task_context(business="centum", module="place_inflow_channel", date="2025-11-15"):
+    """
+    merged = dict(_task_context.get())
+    merged.update({key: value for key, value in fields.items() if value is not None})
+    token = _task_context.set(merged)
+    try:
+        yield
+    finally:
+        _task_context.reset(token)
+
+
+def current_context() -> dict:
+    return dict(_task_context.get())
+
+
+class ContextFilter(logging.Filter):
+    """레코드에 현재 작업 컨텍스트 첨부"""
+
+    def filter(self, record):
+        record.context = current_context()
+        return True
+
+
+# ----------------------------------------------------------------------
+# 포맷터
+# ----------------------------------------------------------------------
+class ConsoleFormatter(logging.Formatter):
+    """기존 print 출력과 같은 형식 + 작업 컨텍스트 태그 ([사업장/모듈/날짜])"""
+
+    def format(self, record):
+        message = record.getMessage()
+        context = getattr(record, "context", None) or {}
+        tag = "/".join(str(context[key]) for key in CONTEXT_FIELDS if key in context)
+        if tag:
+            # 앞쪽 줄바꿈은 유지하고 그 뒤에 태그 삽입
+            body = message.lstrip("\n")
+            message = message[:len(message) - len(body)] + f"[{tag}] " + body
+        if record.exc_info:
+            message += "\n" + self.formatException(record.exc_info)
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """한 줄에 JSON 하나 (ts, level, logger, message, 컨텍스트 필드, exc_info)"""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage().strip(),
+        }
+        entry.update(getattr(record, "context", None) or {})
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# ----------------------------------------------------------------------
+# 설정
+# ----------------------------------------------------------------------
+def _resolve_level(level) -> int:
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, "INFO")
+    if isinstance(level, str):
+        resolved = getattr(logging, level.upper(), None)
+        return resolved if isinstance(resolved, int) else logging.INFO
+    return level
+
+
+def configure_logging(level=None, log_path: str = DEFAULT_LOG_PATH, console: bool = True, **context):
+    """
+    로거 설정 (실행 파일 시작 시 한 번 호출, 다시 호출하면 기존 핸들러 교체)
+
+    Args:
+        level: "DEBUG" / "INFO" / ... (기본: 환경 변수 또는 INFO)
+        log_path: JSON lines 로그 파일 경로 (None이면 파일 기록 안 함)
+        console: 콘솔(stdout) 출력 여부
+        **context: 프로세스 전체에 붙일 컨텍스트 (예: shard=0)
+    """
+    root = logging.getLogger(LOGGER_ROOT)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(_resolve_level(level))
+    root.propagate = False
+
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(ConsoleFormatter())
+        console_handler.addFilter(ContextFilter())
+        root.addHandler(console_handler)
+
+    if log_path:
+        os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+        file_handler.addFilter(ContextFilter())
+        root.addHandler(file_handler)
+
+    if context:
+        _task_context.set({**_task_context.get(), **context})
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈별 로거 (예: logger = get_logger(__name__))
+    configure_logging 전에 사용하면 콘솔 출력만 하는 기본 설정 적용
+    """
+    root = logging.getLogger(LOGGER_ROOT)
+    if not root.handlers:
+        configure_logging(log_path=None)
+    return logging.getLogger(f"{LOGGER_ROOT}.{name.rsplit('.', 1)[-1]}")
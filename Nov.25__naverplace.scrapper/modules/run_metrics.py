@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+수집 실행 지표 (Prometheus 텍스트 형식)
+작업 상태, 추출 행 수, 추출 전략, 재시도, 페이지 로딩 시간, 대기 시간, 다운로드/저장 바이트를 집계
+
+- 실행 중 작업이 끝날 때마다 .prom 파일로 저장 (node_exporter textfile collector로 수집 가능)
+- 선택: 로컬 HTTP 엔드포인트 (http://127.0.0.1:<port>/metrics)
+- 외부 라이브러리 없이 카운터/히스토그램만 구현 (프로세스마다 별도 레지스트리)
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+METRICS_NAMESPACE = "scraper"
+DEFAULT_METRICS_PATH = os.path.join("data", "naverplace", "_metrics", "collector.prom")
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 180.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """단조 증가 카운터 (라벨 조합별 값)"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = (), lock=None):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values = {}
+        self._lock = lock or threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def render(self) -> list:
+        lines = []
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(dict(zip(self.label_names, key)))} {_format_value(value)}")
+        return lines
+
+
+class Histogram(Counter):
+    """누적 버킷 히스토그램 (_bucket, _sum, _count)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = (), buckets: tuple = DEFAULT_BUCKETS, lock=None):
+        super().__init__(name, help_text, label_names, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self.values.setdefault(key, {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][i] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def render(self) -> list:
+        lines = []
+        for key, state in sorted(self.values.items()):
+            labels = dict(zip(self.label_names, key))
+            for bound, count in zip(self.buckets, state["buckets"]):
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {state['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 모음 + 텍스트 형식 출력/파일 저장/HTTP 노출"""
+
+    def __init__(self, namespace: str = METRICS_NAMESPACE):
+        self.namespace = namespace
+        self.metrics = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def counter(self, name: str, help_text: str, label_names: tuple = ()) -> Counter:
+        full_name = f"{self.namespace}_{name}"
+        if full_name not in self.metrics:
+            self.metrics[full_name] = Counter(full_name, help_text, label_names, self._lock)
+        return self.metrics[full_name]
+
+    def histogram(self, name: str, help_text: str, label_names: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        full_name = f"{self.namespace}_{name}"
+        if full_name not in self.metrics:
+            self.metrics[full_name] = Histogram(full_name, help_text, label_names, buckets, self._lock)
+        return self.metrics[full_name]
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        with self._lock:
+            for metric in self.metrics.values():
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """임시 파일에 쓰고 교체 (수집기가 쓰다 만 파일을 읽지 않도록)"""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"  ⚠ [Metrics] Could not write {path}: {e}")
+
+    def start_http_server(self, port: int, host: str = "127.0.0.1"):
+        """/metrics 엔드포인트를 백그라운드 스레드로 실행 (읽기 전용)"""
+        if self._server is not None:
+            return self._server
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 콘솔에 찍지 않음
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            # 포트 사용 중 등: 수집은 계속하고 엔드포인트만 생략 (지표 파일은 그대로 기록)
+            logger.warning(f"  ⚠ [Metrics] Could not serve http://{host}:{port}/metrics ({e}), continuing without the endpoint")
+            return None
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"  ✓ [Metrics] Serving http://{host}:{port}/metrics")
+        return self._server
+
+    def stop_http_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class CollectionMetrics(MetricsRegistry):
+    """수집기/SMLOG 실행에서 공통으로 쓰는 지표"""
+
+    def __init__(self, namespace: str = METRICS_NAMESPACE):
+        super().__init__(namespace)
+        self.tasks = self.counter("tasks_total", "Finished collection tasks by status (done, retry, dead, empty, failed)", ("module", "status"))
+        self.task_retries = self.counter("task_retries_total", "Task attempts scheduled for retry", ("module",))
+        self.task_seconds = self.histogram("task_seconds", "Wall time per task attempt", ("module",))
+        self.rows_extracted = self.counter("rows_extracted_total", "Rows extracted and saved", ("module",))
+        self.strategy_runs = self.counter("strategy_runs_total", "Extraction strategy attempts by result", ("module", "strategy", "result"))
+        self.page_load_seconds = self.histogram("page_load_seconds", "page.goto latency", ("host",))
+        self.api_request_seconds = self.histogram("api_request_seconds", "Replayed API request latency", ("host",))
+        self.sleep_seconds = self.counter("sleep_seconds_total", "Time spent waiting (rate_limit, settle)", ("reason",))
+        self.bytes_downloaded = self.counter("bytes_downloaded_total", "Response bytes (Content-Length) received", ("host",))
+        self.bytes_written = self.counter("bytes_written_total", "Bytes written to output files", ("module",))
+
+    def record_output(self, module: str, path: str, rows: int = None):
+        """저장한 파일 크기(및 행 수) 반영"""
+        if rows is not None:
+            self.rows_extracted.inc(rows, module=module)
+        try:
+            self.bytes_written.inc(os.path.getsize(path), module=module)
+        except OSError:
+            pass
+
+
+def content_length(response) -> int:
+    """응답의 Content-Length 헤더 (없으면 0)"""
+    if response is None:
+        return 0
+    try:
+        return int(response.headers.get("content-length") or 0)
+    except (TypeError, ValueError, AttributeError):
+        return 0
+
+
+_default_metrics = None
+
+
+def get_metrics() -> CollectionMetrics:
+    """프로세스 공용 지표 레지스트리"""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = CollectionMetrics()
+    return _default_metrics
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+셀렉터 후보 일괄 확인
+후보 셀렉터를 하나씩 count()/query_selector()/is_visible()로 확인하는 대신
+page.evaluate 한 번으로 모두 확인하고 첫 번째로 일치한 셀렉터를 반환
+
+- 페이지 종류(예: naver_login, smlog_statistics)별로 이긴 셀렉터를 파일에 저장
+- 다음 실행에서는 저장된 셀렉터를 맨 앞에 두고 확인 (보통 첫 후보에서 바로 일치)
+- 후보는 CSS 셀렉터만 사용 (document.querySelectorAll로 확인, locator(...).nth(index)와 같은 순서)
+- 캐시된 셀렉터가 맨 앞으로 오므로 한 후보 목록에는 같은 요소를 가리키는 셀렉터만 넣을 것
+- 캐시 파일은 수집기 출력 경로 아래 (_cache/selectors.json), 저장은 같은 폴더의 고유 임시 파일을 거쳐 교체
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+CACHE_RELATIVE_PATH = os.path.join("_cache", "selectors.json")
+DEFAULT_CACHE_PATH = os.path.join("data", "naverplace", CACHE_RELATIVE_PATH)
+
+RESOLVE_SCRIPT = """
+({selectors, text, exact, visible}) => {
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;  // 잘못된 셀렉터는 건너뜀
+        }
+        for (let i = 0; i < elements.length; i++) {
+            const el = elements[i];
+            if (visible && !isVisible(el)) continue;
+            const elText = (el.innerText || el.textContent || '').trim();
+            if (text !== null && !(exact ? elText === text : elText.includes(text))) continue;
+            return {
+                selector: selector,
+                index: i,
+                text: elText.slice(0, 200),
+                checked: typeof el.checked === 'boolean' ? el.checked : null,
+            };
+        }
+    }
+    return null;
+}
+"""
+
+
+@dataclass
+class SelectorMatch:
+    """일치한 요소 정보"""
+    selector: str
+    index: int
+    text: str = ""
+    checked: bool = None  # 체크박스/라디오인 경우 체크 상태
+
+    def locator(self, page):
+        """일치한 요소의 Locator (추가 왕복 없이 생성)"""
+        return page.locator(self.selector).nth(self.index)
+
+
+class SelectorResolver:
+    """후보 셀렉터 일괄 확인 + 페이지 종류별 이긴 셀렉터 캐시"""
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH):
+        self.cache_path = cache_path
+        self.cache = {}
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠ [Selector] Could not read cache file {cache_path}: {e}")
+
+    def save(self):
+        """캐시 파일 저장 (여러 프로세스가 같은 파일을 써도 겹치지 않도록 고유 임시 파일 사용, 실패는 로그만)"""
+        directory = os.path.dirname(self.cache_path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.cache_path) + ".", suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"  ⚠ [Selector] Could not write cache file {self.cache_path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"  ⚠ [Selector] Could not write cache file {self.cache_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def cached(self, page_type: str, key: str) -> str:
+        return self.cache.get(page_type, {}).get(key)
+
+    def remember(self, page_type: str, key: str, selector: str):
+        if self.cached(page_type, key) == selector:
+            return
+        self.cache.setdefault(page_type, {})[key] = selector
+        self.save()
+
+    def forget(self, page_type: str, key: str):
+        """캐시된 셀렉터가 더 이상 동작하지 않을 때 제거"""
+        if self.cache.get(page_type, {}).pop(key, None) is not None:
+            self.save()
+
+    def ordered(self, page_type: str, key: str, candidates) -> list:
+        """캐시된 셀렉터를 맨 앞으로 (후보 목록에 있을 때만)"""
+        candidates = list(candidates)
+        winner = self.cached(page_type, key)
+        if winner in candidates:
+            candidates.remove(winner)
+            candidates.insert(0, winner)
+        return candidates
+
+    async def resolve(self, page, page_type: str, key: str, candidates, text: str = None,
+                      exact: bool = False, visible: bool = False) -> SelectorMatch:
+        """
+        후보 셀렉터를 한 번의 evaluate로 확인
+
+        Args:
+            page: Playwright Page
+            page_type: 캐시 구분용 페이지 종류
+            key: 페이지 안에서 찾는 대상 이름 (예: "id_input")
+            candidates: CSS 셀렉터 후보 (우선순위 순)
+            text: 요소 텍스트 조건 (None이면 조건 없음)
+            exact: True면 텍스트 완전 일치, False면 포함
+            visible: True면 화면에 보이는 요소만
+
+        Returns:
+            SelectorMatch 또는 None
+        """
+        selectors = self.ordered(page_type, key, candidates)
+        try:
+            found = await page.evaluate(
+                RESOLVE_SCRIPT,
+                {"selectors": selectors, "text": text, "exact": exact, "visible": visible},
+            )
+        except Exception as e:
+            logger.warning(f"  ⚠ [Selector] Resolution failed for {page_type}/{key}: {e}")
+            return None
+        if not found:
+            return None
+        self.remember(page_type, key, found["selector"])
+        return SelectorMatch(found["selector"], found["index"], found.get("text") or "", found.get("checked"))
+
+
+_resolvers = {}
+
+
+def get_selector_resolver(cache_path: str = DEFAULT_CACHE_PATH) -> SelectorResolver:
+    """캐시 파일별 프로세스 공용 리졸버"""
+    if cache_path not in _resolvers:
+        _resolvers[cache_path] = SelectorResolver(cache_path)
+    return _resolvers[cache_path]
@@ -8,17 +8,22 @@ from datetime import datetime
 from bs4 import BeautifulSoup
 from playwright.async_api import Page
 from .base_scraper import BaseScraper
+from .business_catalog import BusinessProfile
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class SmartcallCallStatisticsScraper(BaseScraper):
     """스마트콜 통화 통계 데이터 스크래퍼"""
     
-    def __init__(self, username: str, password: str, start_date: str = "2025-12-09", end_date: str = "2025-12-15", output_base_dir: str = "data/naverplace"):
-        super().__init__(username, password, start_date, end_date, output_base_dir)
+    def __init__(self, username: str, password: str, start_date: str = "2025-12-09", end_date: str = "2025-12-15", output_base_dir: str = "data/naverplace", business: BusinessProfile = None):
+        super().__init__(username, password, start_date, end_date, output_base_dir, business)
         # URL 동적 생성
         self.stats_url = (
-            f"https://smartcall.smartplace.naver.com/statistics/1191881927"
-            f"?startDate={start_date}&endDate={end_date}&bookingBusinessId=603738"
+            f"https://smartcall.smartplace.naver.com/statistics/{self.business.smartcall_id}"
+            f"?startDate={start_date}&endDate={end_date}&bookingBusinessId={self.business.booking_business_id}"
         )
     
     def get_module_name(self) -> str:
@@ -26,7 +31,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
     
     async def click_daily_tab(self, page: Page) -> bool:
         """일별 통화 탭 클릭"""
-        print("\n[Tab] Clicking daily call tab...")
+        logger.info("\n[Tab] Clicking daily call tab...")
         try:
             # 일별 통화 탭 선택자
             daily_tab_selector = "#__next > div > div:nth-child(3) > div > div.call_section > div.styles_call_info__qa5Bn > div.styles_info_tab__E4QqY > ul > li:nth-child(2) > a"
@@ -39,10 +44,10 @@ class SmartcallCallStatisticsScraper(BaseScraper):
             await page.click(daily_tab_selector)
             await asyncio.sleep(2)  # 탭 전환 대기
             
-            print("  ✓ Daily call tab clicked")
+            logger.info("  ✓ Daily call tab clicked")
             return True
         except Exception as e:
-            print(f"  ⚠ Error clicking daily tab: {e}")
+            logger.warning(f"  ⚠ Error clicking daily tab: {e}")
             # 대체 선택자 시도
             try:
                 # 더 간단한 선택자로 시도
@@ -50,7 +55,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                 if len(tabs) >= 2:
                     await tabs[1].click()
                     await asyncio.sleep(2)
-                    print("  ✓ Daily call tab clicked (alternative method)")
+                    logger.info("  ✓ Daily call tab clicked (alternative method)")
                     return True
             except Exception:
                 pass
@@ -58,7 +63,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
     
     async def extract_table_data(self, page: Page) -> list:
         """통화 통계 테이블 데이터 추출"""
-        print("\n[Data Extraction] Extracting call statistics table data...")
+        logger.info("\n[Data Extraction] Extracting call statistics table data...")
         
         table_data = []
         
@@ -93,7 +98,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                 }
                 """
             )
-            print(f"  [Table Structure] {table_structure}")
+            logger.info(f"  [Table Structure] {table_structure}")
             
             # 테이블이 완전히 로드될 때까지 대기 (조건 완화)
             try:
@@ -102,7 +107,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                     timeout=5000
                 )
             except Exception as e:
-                print(f"  ⚠ wait_for_function timeout: {e}")
+                logger.warning(f"  ⚠ wait_for_function timeout: {e}")
             
             await asyncio.sleep(3)  # 추가 대기
             
@@ -130,7 +135,7 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                 }
                 """
             )
-            print(f"  [Table Structure] {table_structure}")
+            logger.info(f"  [Table Structure] {table_structure}")
             
             # JavaScript로 테이블 데이터 추출 (인덱스 열 + 데이터 열 합치기)
             js_result = await page.evaluate(
@@ -344,60 +349,60 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                 """
             )
             
-            print(f"  JavaScript result: headers={len(js_result.get('headers', []))}, rows={len(js_result.get('rows', []))}")
-            print(f"    Index rows: {len(js_result.get('indexRows', []))}, Data rows: {len(js_result.get('dataRows', []))}")
+            logger.info(f"  JavaScript result: headers={len(js_result.get('headers', []))}, rows={len(js_result.get('rows', []))}")
+            logger.info(f"    Index rows: {len(js_result.get('indexRows', []))}, Data rows: {len(js_result.get('dataRows', []))}")
             if js_result.get('debug'):
                 debug_info = js_result.get('debug', {})
-                print(f"  Debug info:")
-                print(f"    Fixed table found: {debug_info.get('fixedTableFound', 'N/A')}")
-                print(f"    Fixed table element found: {debug_info.get('fixedTableElFound', 'N/A')}")
-                print(f"    Fixed thead found: {debug_info.get('fixedTheadFound', 'N/A')}")
-                print(f"    Fixed TRs count: {debug_info.get('fixedTrsCount', 'N/A')}")
-                print(f"    Headers extracted: {debug_info.get('headersExtracted', 'N/A')}")
-                print(f"    Header row count: {debug_info.get('headerRowCount', 'N/A')}")
-                print(f"    Index rows extracted: {debug_info.get('indexRowsExtracted', 'N/A')}")
-                print(f"    Scroll tbody found: {debug_info.get('scrollTbodyFound', 'N/A')}")
-                print(f"    Scroll thead found: {debug_info.get('scrollTheadFound', 'N/A')}")
-                print(f"    Scroll thead TRs count: {debug_info.get('scrollTheadTrsCount', 'N/A')}")
-                print(f"    Scroll header row count: {debug_info.get('scrollHeaderRowCount', 'N/A')}")
-                print(f"    Data rows extracted: {debug_info.get('dataRowsExtracted', 'N/A')}")
+                logger.info(f"  Debug info:")
+                logger.info(f"    Fixed table found: {debug_info.get('fixedTableFound', 'N/A')}")
+                logger.info(f"    Fixed table element found: {debug_info.get('fixedTableElFound', 'N/A')}")
+                logger.info(f"    Fixed thead found: {debug_info.get('fixedTheadFound', 'N/A')}")
+                logger.info(f"    Fixed TRs count: {debug_info.get('fixedTrsCount', 'N/A')}")
+                logger.info(f"    Headers extracted: {debug_info.get('headersExtracted', 'N/A')}")
+                logger.info(f"    Header row count: {debug_info.get('headerRowCount', 'N/A')}")
+                logger.info(f"    Index rows extracted: {debug_info.get('indexRowsExtracted', 'N/A')}")
+                logger.info(f"    Scroll tbody found: {debug_info.get('scrollTbodyFound', 'N/A')}")
+                logger.info(f"    Scroll thead found: {debug_info.get('scrollTheadFound', 'N/A')}")
+                logger.info(f"    Scroll thead TRs count: {debug_info.get('scrollTheadTrsCount', 'N/A')}")
+                logger.info(f"    Scroll header row count: {debug_info.get('scrollHeaderRowCount', 'N/A')}")
+                logger.info(f"    Data rows extracted: {debug_info.get('dataRowsExtracted', 'N/A')}")
                 
                 # 각 tr의 구조 확인
                 for i in range(8):
                     td_key = f'tr{i}_tds'
                     th_key = f'tr{i}_ths'
                     if td_key in debug_info or th_key in debug_info:
-                        print(f"    TR[{i}]: TDs={debug_info.get(td_key, 0)}, THs={debug_info.get(th_key, 0)}")
+                        logger.debug("    TR[%s]: TDs=%s, THs=%s", i, debug_info.get(td_key, 0), debug_info.get(th_key, 0))
                 
                 # 인덱스 행 샘플
                 for i in range(2, 8):
                     row_key = f'indexRow{i}'
                     empty_key = f'indexRow{i}_empty'
                     if row_key in debug_info:
-                        print(f"    Index row[{i}]: {debug_info[row_key]}")
+                        logger.debug("    Index row[%s]: %s", i, debug_info[row_key])
                     elif empty_key in debug_info:
-                        print(f"    Index row[{i}]: EMPTY")
+                        logger.debug("    Index row[%s]: EMPTY", i)
                 
                 # 데이터 행 샘플
                 for i in range(2, 8):
                     row_key = f'dataRow{i}'
                     if row_key in debug_info:
-                        print(f"    Data row[{i}]: {debug_info[row_key]}")
+                        logger.debug("    Data row[%s]: %s", i, debug_info[row_key])
             
             # 인덱스 행 샘플 출력
             if js_result.get('indexRows'):
-                print(f"    Index rows sample (first 3):")
+                logger.info(f"    Index rows sample (first 3):")
                 for i, idx_row in enumerate(js_result.get('indexRows', [])[:3], 1):
-                    print(f"      {i}. {idx_row}")
+                    logger.debug("      %s. %s", i, idx_row)
             else:
-                print(f"    ⚠ No index rows extracted!")
+                logger.warning(f"    ⚠ No index rows extracted!")
             
             if js_result.get('headers') and js_result.get('rows'):
                 headers = js_result['headers']
                 rows = js_result['rows']
                 
-                print(f"  ✓ Found table with {len(headers)} columns and {len(rows)} rows")
-                print(f"    Headers: {headers}")
+                logger.info(f"  ✓ Found table with {len(headers)} columns and {len(rows)} rows")
+                logger.info(f"    Headers: {headers}")
                 
                 # 딕셔너리 형태로 변환
                 for row in rows:
@@ -407,18 +412,18 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                             row_dict[header] = row[i]
                     table_data.append(row_dict)
                 
-                print(f"  ✓ Extracted {len(table_data)} rows")
+                logger.info(f"  ✓ Extracted {len(table_data)} rows")
                 if len(table_data) > 0:
-                    print(f"    Sample row: {table_data[0]}")
+                    logger.info(f"    Sample row: {table_data[0]}")
                     for i, item in enumerate(table_data[:3], 1):
-                        print(f"    {i}. {item}")
+                        logger.debug("    %s. %s", i, item)
                 else:
-                    print(f"    ⚠ Warning: table_data is empty after conversion")
+                    logger.warning(f"    ⚠ Warning: table_data is empty after conversion")
             else:
-                print("  ⚠ No table data found via JavaScript")
+                logger.warning("  ⚠ No table data found via JavaScript")
                 
                 # BeautifulSoup으로 재시도 (인덱스 열 + 데이터 열 합치기)
-                print("  Trying BeautifulSoup...")
+                logger.info("  Trying BeautifulSoup...")
                 soup = BeautifulSoup(await page.content(), 'html.parser')
                 
                 # 1. 인덱스 열 추출
@@ -497,23 +502,19 @@ class SmartcallCallStatisticsScraper(BaseScraper):
                                 row_dict[header] = combined_row[j]
                         table_data.append(row_dict)
                 
-                print(f"  ✓ Extracted {len(table_data)} rows via BeautifulSoup (combined {len(index_rows)} index rows + {len(data_rows)} data rows)")
+                logger.info(f"  ✓ Extracted {len(table_data)} rows via BeautifulSoup (combined {len(index_rows)} index rows + {len(data_rows)} data rows)")
             
             return table_data
             
         except Exception as e:
-            print(f"  ✗ Error extracting table data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting table data: {e}", exc_info=True)
             return table_data
     
     async def scrape(self, page: Page) -> dict:
         """통계 페이지에서 통화 통계 데이터 스크래핑"""
-        print("\n[Scraping] Starting smartcall call statistics scraping...")
+        logger.info("\n[Scraping] Starting smartcall call statistics scraping...")
         
-        print(f"  Navigating to: {self.stats_url}")
-        await page.goto(self.stats_url, wait_until="networkidle")
-        await asyncio.sleep(5)  # 페이지 로딩 대기
+        await self.open_stats_page(page)
         
         # 일별 통화 탭 클릭
         await self.click_daily_tab(page)
@@ -521,9 +522,9 @@ class SmartcallCallStatisticsScraper(BaseScraper):
         # 테이블 데이터 추출
         table_data = await self.extract_table_data(page)
         
-        print(f"\n[Scrape Result] table_data type: {type(table_data)}, length: {len(table_data) if isinstance(table_data, list) else 'N/A'}")
+        logger.info(f"\n[Scrape Result] table_data type: {type(table_data)}, length: {len(table_data) if isinstance(table_data, list) else 'N/A'}")
         if isinstance(table_data, list) and len(table_data) > 0:
-            print(f"  First row: {table_data[0]}")
+            logger.info(f"  First row: {table_data[0]}")
         
         result = {
             "url": self.stats_url,
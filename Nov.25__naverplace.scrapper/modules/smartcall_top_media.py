@@ -7,17 +7,22 @@ import asyncio
 from datetime import datetime
 from playwright.async_api import Page
 from .base_scraper import BaseScraper
+from .business_catalog import BusinessProfile
+from .run_log import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class SmartcallTopMediaScraper(BaseScraper):
     """스마트콜 전화가 많이 오는 매체 데이터 스크래퍼"""
     
-    def __init__(self, username: str, password: str, start_date: str = "2025-12-09", end_date: str = "2025-12-15", output_base_dir: str = "data/naverplace"):
-        super().__init__(username, password, start_date, end_date, output_base_dir)
+    def __init__(self, username: str, password: str, start_date: str = "2025-12-09", end_date: str = "2025-12-15", output_base_dir: str = "data/naverplace", business: BusinessProfile = None):
+        super().__init__(username, password, start_date, end_date, output_base_dir, business)
         # URL 동적 생성
         self.stats_url = (
-            f"https://smartcall.smartplace.naver.com/statistics/1191881927"
-            f"?startDate={start_date}&endDate={end_date}&bookingBusinessId=603738"
+            f"https://smartcall.smartplace.naver.com/statistics/{self.business.smartcall_id}"
+            f"?startDate={start_date}&endDate={end_date}&bookingBusinessId={self.business.booking_business_id}"
         )
     
     def get_module_name(self) -> str:
@@ -25,7 +30,7 @@ class SmartcallTopMediaScraper(BaseScraper):
     
     async def extract_top_media_data(self, page: Page) -> list:
         """전화가 많이 오는 매체 데이터 추출"""
-        print("\n[Data Extraction] Extracting top media data...")
+        logger.info("\n[Data Extraction] Extracting top media data...")
         
         media_data = []
         
@@ -112,31 +117,27 @@ class SmartcallTopMediaScraper(BaseScraper):
                 """
             )
             
-            print(f"  Found {js_result.get('items_found', 0)} items")
+            logger.info(f"  Found {js_result.get('items_found', 0)} items")
             
             if js_result.get('data'):
                 media_data = js_result['data']
-                print(f"  ✓ Extracted {len(media_data)} media items")
+                logger.info(f"  ✓ Extracted {len(media_data)} media items")
                 for i, item in enumerate(media_data[:5], 1):
-                    print(f"    {i}. Rank: {item.get('rank')}, Media: {item.get('media')}, Count: {item.get('count')}")
+                    logger.debug("    %s. Rank: %s, Media: %s, Count: %s", i, item.get('rank'), item.get('media'), item.get('count'))
             else:
-                print("  ⚠ No data extracted")
+                logger.warning("  ⚠ No data extracted")
             
             return media_data
             
         except Exception as e:
-            print(f"  ✗ Error extracting media data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting media data: {e}", exc_info=True)
             return media_data
     
     async def scrape(self, page: Page) -> dict:
         """통계 페이지에서 전화가 많이 오는 매체 데이터 스크래핑"""
-        print("\n[Scraping] Starting smartcall top media scraping...")
+        logger.info("\n[Scraping] Starting smartcall top media scraping...")
         
-        print(f"  Navigating to: {self.stats_url}")
-        await page.goto(self.stats_url, wait_until="networkidle")
-        await asyncio.sleep(5)  # 페이지 로딩 대기
+        await self.open_stats_page(page)
         
         # 스크롤하여 데이터가 보이도록 함
         await page.evaluate("window.scrollTo(0, 800)")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+추출 전략 통계
+모듈별 추출 전략(JS, hover, API, props 등)의 성공 여부와 소요 시간을 파일에 기록하고,
+다음 실행에서 과거에 가장 빠르게 성공한 전략부터 시도하도록 순서를 정함
+
+- 통계 파일은 수집기 출력 경로 아래 (_stats/extraction_strategies.json, set_strategy_stats로 지정)
+- 프로세스마다 자기 파일에만 기록 (백필 샤드: extraction_strategies.shard_N.json)하고,
+  순서를 정할 때는 같은 폴더의 다른 통계 파일을 합쳐서 봄 (마지막 저장이 다른 프로세스 기록을 덮어쓰지 않음)
+- 기록은 save_interval마다 모아서 저장 (종료 시 flush), 저장은 같은 폴더의 고유 임시 파일을 거쳐 교체
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from .run_log import get_logger
+from .run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
+
+
+STATS_FILE_STEM = "extraction_strategies"
+STATS_RELATIVE_PATH = os.path.join("_stats", f"{STATS_FILE_STEM}.json")
+DEFAULT_STATS_PATH = os.path.join("data", "naverplace", STATS_RELATIVE_PATH)
+
+
+def stats_path(output_base_dir: str, shard: int = None) -> str:
+    """출력 경로 아래 통계 파일 경로 (shard를 지정하면 샤드 전용 파일)"""
+    if shard is None:
+        return os.path.join(output_base_dir, STATS_RELATIVE_PATH)
+    return os.path.join(output_base_dir, "_stats", f"{STATS_FILE_STEM}.shard_{shard}.json")
+
+
+def merge_entries(entries: list) -> dict:
+    """여러 통계 파일의 같은 (모듈, 전략) 기록 합산 (평균 소요 시간은 성공 횟수 가중 평균)"""
+    entries = [e for e in entries if isinstance(e, dict)]
+    attempts = sum(e.get("attempts", 0) for e in entries)
+    successes = sum(e.get("successes", 0) for e in entries)
+    timed = [e for e in entries if e.get("successes") and e.get("avg_latency") is not None]
+    weight = sum(e["successes"] for e in timed)
+    avg_latency = sum(e["avg_latency"] * e["successes"] for e in timed) / weight if weight else None
+    return {"attempts": attempts, "successes": successes, "avg_latency": avg_latency}
+
+
+class StrategyStats:
+    """모듈별 전략 성공률/평균 소요 시간 (성공한 시도 기준 지수 이동 평균)"""
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH, alpha: float = 0.3, save_interval: float = 10.0):
+        self.path = path
+        self.alpha = alpha  # 최근 소요 시간 반영 비율
+        self.save_interval = save_interval  # 기록마다 파일을 다시 쓰지 않도록 이 간격(초)마다 저장
+        self.stats = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self.others = []  # 같은 폴더의 다른 프로세스/샤드 통계 (읽기 전용, 순서 결정에만 사용)
+        directory = os.path.dirname(path) or "."
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                other_path = os.path.join(directory, name)
+                if not (name.startswith(STATS_FILE_STEM) and name.endswith(".json")):
+                    continue
+                loaded = self._read(other_path)
+                if os.path.abspath(other_path) == os.path.abspath(path):
+                    self.stats = loaded
+                else:
+                    self.others.append(loaded)
+
+    @staticmethod
+    def _read(path: str) -> dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"  ⚠ [Strategy] Could not read stats file {path}: {e}")
+            return {}
+
+    def save(self):
+        """통계 파일 저장 (여러 프로세스가 같은 파일을 써도 겹치지 않도록 고유 임시 파일 사용)"""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self):
+        """저장되지 않은 기록이 있으면 저장 (실패해도 수집은 계속)"""
+        if not self._dirty:
+            return
+        try:
+            self.save()
+        except OSError as e:
+            logger.warning(f"  ⚠ [Strategy] Could not write stats file {self.path}: {e}")
+
+    def record(self, module_name: str, strategy: str, success: bool, latency: float):
+        """전략 시도 결과 기록 (통계는 순서 힌트일 뿐이므로 오류는 로그만 남김)"""
+        try:
+            entry = self.stats.setdefault(module_name, {}).setdefault(strategy, {
+                "attempts": 0,
+                "successes": 0,
+                "avg_latency": None,
+            })
+            entry["attempts"] += 1
+            if success:
+                entry["successes"] += 1
+                if entry["avg_latency"] is None:
+                    entry["avg_latency"] = latency
+                else:
+                    entry["avg_latency"] = (1 - self.alpha) * entry["avg_latency"] + self.alpha * latency
+            entry["last_result"] = "success" if success else "failure"
+            entry["last_used"] = datetime.now().isoformat()
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= self.save_interval:
+                self.save()
+            get_metrics().strategy_runs.inc(module=module_name, strategy=strategy, result=entry["last_result"])
+        except Exception as e:
+            logger.warning(f"  ⚠ [Strategy] Could not record {module_name}/{strategy}: {e}")
+
+    def order(self, module_name: str, strategies: list) -> list:
+        """
+        시도 순서 결정
+        성공 기록이 있는 전략: 평균 소요 시간이 짧은 순 (성공률이 절반 미만이면 뒤로)
+        기록이 없거나 성공한 적 없는 전략: 기본 순서 유지하며 그 뒤
+        """
+        sources = [self.stats] + self.others
+        module_stats = {
+            name: merge_entries([source[module_name][name] for source in sources
+                                 if name in source.get(module_name, {})])
+            for name in strategies
+            if any(name in source.get(module_name, {}) for source in sources)
+        }
+
+        def sort_key(item):
+            index, name = item
+            entry = module_stats.get(name)
+            if not entry or not entry.get("successes"):
+                return (2, index, 0.0)
+            success_rate = entry["successes"] / max(1, entry["attempts"])
+            tier = 0 if success_rate >= 0.5 else 1
+            return (tier, entry["avg_latency"], index)
+
+        return [name for _, name in sorted(enumerate(strategies), key=sort_key)]
+
+
+_default_stats = None
+
+
+def get_strategy_stats() -> StrategyStats:
+    """프로세스 공용 전략 통계"""
+    global _default_stats
+    if _default_stats is None:
+        _default_stats = StrategyStats()
+    return _default_stats
+
+
+def set_strategy_stats(stats: StrategyStats):
+    """프로세스 공용 전략 통계 교체 (예: 수집기 출력 경로 아래 통계 파일 사용)"""
+    global _default_stats
+    _default_stats = stats
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+수집 작업 큐
+(사업장, 모듈, 날짜) 단위 작업을 파일에 저장하고 재시도/백오프/시간 제한/데드레터를 관리
+
+- 작업마다 시도 횟수 기록, 실패 시 지수 백오프 + 지터 후 재시도
+- 작업별 시간 제한 초과 시 취소 후 실패로 처리
+- max_attempts번 실패한 작업은 데드레터 파일(JSON lines)로 이동, 나중에 재실행 가능
+- 실행 중 프로세스가 죽으면 큐 파일이 남아 다음 실행에서 남은 작업부터 이어서 처리
+- 상태 변경은 flush_interval마다 모아서 저장 (종료 시 flush); 죽으면 마지막 저장 이후 변경만 다시 실행
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from .run_log import get_logger
+from .run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+DEAD = "dead"
+
+
+@dataclass
+class CollectionTask:
+    """수집 작업 하나"""
+    business_key: str
+    module_name: str
+    target_date: str  # YYYY-MM-DD
+    status: str = PENDING
+    attempts: int = 0
+    next_run_at: float = 0.0  # time.time() 기준, 이 시각 이후에 실행 가능
+    last_error: str = None
+    updated_at: str = None
+
+    @property
+    def task_id(self) -> str:
+        return f"{self.business_key}:{self.module_name}:{self.target_date}"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class TaskQueue:
+    """파일 기반 수집 작업 큐"""
+
+    def __init__(self, queue_dir: str = "data/naverplace/_queue", max_attempts: int = 3,
+                 base_delay: float = 2.0, max_delay: float = 60.0, task_timeout: float = 180.0,
+                 flush_interval: float = 5.0):
+        self.queue_dir = queue_dir
+        self.queue_path = os.path.join(queue_dir, "tasks.json")
+        self.dead_letter_path = os.path.join(queue_dir, "dead_letter.jsonl")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.task_timeout = task_timeout
+        self.flush_interval = flush_interval
+        self.tasks = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        os.makedirs(queue_dir, exist_ok=True)
+        self.load()
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+    def load(self):
+        """큐 파일 로드 (중단된 실행의 running 작업은 pending으로 되돌림)"""
+        if not os.path.exists(self.queue_path):
+            return
+        with open(self.queue_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        for entry in raw.get("tasks", []):
+            task = CollectionTask(**entry)
+            if task.status == RUNNING:
+                task.status = PENDING
+            self.tasks[task.task_id] = task
+        remaining = sum(1 for t in self.tasks.values() if t.status == PENDING)
+        if remaining:
+            logger.info(f"  ℹ [Queue] Resuming {remaining} pending tasks from {self.queue_path}")
+
+    def save(self):
+        """큐 파일 저장 (임시 파일에 쓰고 교체)"""
+        tmp_path = self.queue_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"tasks": [t.to_dict() for t in self.tasks.values()]}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.queue_path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self):
+        """저장되지 않은 상태 변경이 있으면 저장 (실행 종료 시 호출)"""
+        if self._dirty:
+            self.save()
+
+    def _touch(self, task: CollectionTask):
+        """상태 변경 기록 (작업마다 전체 파일을 다시 쓰지 않도록 flush_interval마다 저장)"""
+        task.updated_at = datetime.now().isoformat()
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= self.flush_interval:
+            self.save()
+
+    # ------------------------------------------------------------------
+    # 작업 등록/조회
+    # ------------------------------------------------------------------
+    def add(self, task: CollectionTask) -> bool:
+        """작업 등록 (같은 작업이 이미 있으면 기존 상태 유지)"""
+        if task.task_id in self.tasks:
+            return False
+        self.tasks[task.task_id] = task
+        return True
+
+    def add_many(self, tasks: list) -> int:
+        added = sum(1 for task in tasks if self.add(task))
+        self.save()
+        return added
+
+    def requeue(self, tasks: list, reasons: dict = None) -> int:
+        """
+        완료/데드레터 작업도 시도 횟수 초기화 후 다시 pending으로 (검증 실패 날짜 재수집 등)
+
+        Args:
+            tasks: 다시 실행할 작업
+            reasons: task_id → 사유 (last_error에 기록)
+        """
+        requeued = 0
+        for task in tasks:
+            existing = self.tasks.get(task.task_id)
+            if existing is not None and existing.status in (PENDING, RUNNING):
+                continue
+            task.status = PENDING
+            task.attempts = 0
+            task.next_run_at = 0.0
+            task.last_error = (reasons or {}).get(task.task_id)
+            task.updated_at = datetime.now().isoformat()
+            self.tasks[task.task_id] = task
+            requeued += 1
+        self.save()
+        return requeued
+
+    def _ready_task(self):
+        now = time.time()
+        ready = [t for t in self.tasks.values() if t.status == PENDING and t.next_run_at <= now]
+        return min(ready, key=lambda t: t.next_run_at) if ready else None
+
+    def get_ready(self):
+        """지금 바로 실행 가능한 작업이 있으면 반환, 없으면 None (대기하지 않음)"""
+        task = self._ready_task()
+        if task is not None:
+            task.status = RUNNING
+            self._touch(task)
+        return task
+
+    async def get(self):
+        """
+        실행 가능한 다음 작업 반환 (백오프 중인 작업만 남았으면 대기)
+
+        Returns:
+            CollectionTask 또는 None (남은 작업 없음)
+        """
+        while True:
+            task = self.get_ready()
+            if task is not None:
+                return task
+
+            pending = [t for t in self.tasks.values() if t.status == PENDING]
+            running = any(t.status == RUNNING for t in self.tasks.values())
+            if not pending and not running:
+                return None
+
+            # 백오프 대기 중이거나 다른 작업자의 작업이 재시도로 돌아올 수 있음
+            wait = min((t.next_run_at for t in pending), default=time.time() + 0.5) - time.time()
+            await asyncio.sleep(min(max(wait, 0.05), 0.5))
+
+    # ------------------------------------------------------------------
+    # 실행/결과 처리
+    # ------------------------------------------------------------------
+    def backoff_delay(self, attempts: int) -> float:
+        """지수 백오프 + 지터 (절반은 고정, 절반은 랜덤)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempts - 1)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def mark_done(self, task: CollectionTask):
+        task.status = DONE
+        task.last_error = None
+        self._touch(task)
+        get_metrics().tasks.inc(module=task.module_name, status=DONE)
+
+    def mark_failed(self, task: CollectionTask, error: str):
+        """실패 처리 (재시도 예약 또는 데드레터 이동)"""
+        task.attempts += 1
+        task.last_error = error
+        if task.attempts >= self.max_attempts:
+            task.status = DEAD
+            self._write_dead_letter(task)
+            logger.error(f"  ✗ [Queue] {task.task_id} moved to dead letter after {task.attempts} attempts: {error}")
+            get_metrics().tasks.inc(module=task.module_name, status=DEAD)
+        else:
+            delay = self.backoff_delay(task.attempts)
+            task.status = PENDING
+            task.next_run_at = time.time() + delay
+            logger.warning(f"  ⚠ [Queue] {task.task_id} failed (attempt {task.attempts}/{self.max_attempts}), retry in {delay:.1f}s: {error}")
+            metrics = get_metrics()
+            metrics.tasks.inc(module=task.module_name, status="retry")
+            metrics.task_retries.inc(module=task.module_name)
+            metrics.sleep_seconds.inc(delay, reason="retry_backoff")
+        self._touch(task)
+
+    async def run(self, task: CollectionTask, work) -> bool:
+        """
+        작업 실행 (시간 제한 초과 시 취소)
+
+        Args:
+            task: 실행할 작업
+            work: 인자 없는 코루틴 함수. 예외 없이 끝나면 성공
+
+        Returns:
+            bool: 성공 여부
+        """
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(work(), timeout=self.task_timeout)
+        except asyncio.TimeoutError:
+            self.mark_failed(task, f"Timed out after {self.task_timeout:g}s")
+            return False
+        except Exception as e:
+            self.mark_failed(task, f"{type(e).__name__}: {e}")
+            return False
+        finally:
+            get_metrics().task_seconds.observe(time.monotonic() - started, module=task.module_name)
+        self.mark_done(task)
+        return True
+
+    # ------------------------------------------------------------------
+    # 데드레터
+    # ------------------------------------------------------------------
+    def _write_dead_letter(self, task: CollectionTask):
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(task.to_dict(), ensure_ascii=False) + "\n")
+
+    def replay_dead_letters(self) -> int:
+        """데드레터 작업을 시도 횟수 초기화 후 다시 큐에 넣고 데드레터 파일 비움"""
+        if not os.path.exists(self.dead_letter_path):
+            return 0
+        replayed = 0
+        with open(self.dead_letter_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                task = CollectionTask(entry["business_key"], entry["module_name"], entry["target_date"])
+                self.tasks[task.task_id] = task
+                replayed += 1
+        self.save()
+        os.remove(self.dead_letter_path)
+        logger.info(f"✓ [Queue] Replaying {replayed} dead-letter tasks")
+        return replayed
+
+    # ------------------------------------------------------------------
+    # 요약/정리
+    # ------------------------------------------------------------------
+    def is_finished(self) -> bool:
+        return all(t.status in (DONE, DEAD) for t in self.tasks.values())
+
+    def summary(self) -> dict:
+        """(사업장, 모듈)별 {done, dead, total} 집계"""
+        result = {}
+        for task in self.tasks.values():
+            counts = result.setdefault((task.business_key, task.module_name), {"done": 0, "dead": 0, "total": 0})
+            counts["total"] += 1
+            if task.status in (DONE, DEAD):
+                counts[task.status] += 1
+        return result
+
+    def clear(self):
+        """모든 작업이 끝난 큐 파일 삭제 (다음 실행은 새로 시작)"""
+        self.tasks = {}
+        self._dirty = False
+        if os.path.exists(self.queue_path):
+            os.remove(self.queue_path)
@@ -0,0 +1,23 @@
+"""
+수집 결과 후처리 파이프라인
+모듈 결과 CSV(data/naverplace/...)를 읽어 집계/분석용 테이블을 유지
+"""
+
+from .sources import ModuleSpec, MODULE_SPECS, OutputFile, discover_outputs
+from .rollups import RollupStore, period_start
+from .fact_table import DailyFactBuilder
+from .validate import OutputValidator, VALIDATION_RULES
+from .query_service import QueryService
+
+__all__ = [
+    'ModuleSpec',
+    'MODULE_SPECS',
+    'OutputFile',
+    'discover_outputs',
+    'RollupStore',
+    'period_start',
+    'DailyFactBuilder',
+    'OutputValidator',
+    'VALIDATION_RULES',
+    'QueryService',
+]
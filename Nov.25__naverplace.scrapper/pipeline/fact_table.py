@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+일별 통합 팩트 테이블 (사업장 × 날짜 1행)
+플레이스 유입(시간별/채널/키워드), 스마트콜 통화 통계, 예약 추이, SMLOG 전환을
+(business, event_dt) 기준으로 한 행에 모음
+
+- 하루씩 처리: 그 날짜를 담은 파티션만 읽어 한 행으로 줄인 뒤 월 파일에 기록
+- 메모리에는 현재 월의 행(최대 31개)과 최근 읽은 원본 파일 몇 개만 유지
+- 증분: 원본 파일 서명이 바뀐 날짜만 다시 계산하고 해당 월 파일만 다시 씀
+- 출력: data/naverplace/_facts/daily/{business}/{YYYY-MM}.csv
+"""
+
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import pandas as pd
+
+from modules.business_catalog import DEFAULT_BUSINESS
+from modules.run_log import get_logger
+from .sources import discover_outputs, file_signature, OutputFile
+from .rollups import to_number
+
+
+logger = get_logger(__name__)
+
+
+SMLOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Nov.25__smartlog.scrapper")
+DEFAULT_SMLOG_DATA_DIR = os.path.join(SMLOG_DIR, "smlog_data")
+SMLOG_FACT_VAR = "미디어"  # 매체별 표 → 날짜 합계가 그날 SMLOG 전체 값
+SMLOG_FILE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.+)\.csv$")
+
+FACT_MODULES = (
+    "place_hourly_inflow_graph",
+    "place_inflow_channel",
+    "place_inflow_keyword",
+    "smartcall_call_statistics",
+    "booking_trend_chart",
+)
+# 행마다 실제 날짜가 있는 모듈 (여러 날짜를 담은 파일도 날짜별로 나눠 사용)
+DATED_ROW_MODULES = {"booking_trend_chart": "date"}
+SOURCE_CACHE_SIZE = 4
+
+
+# ----------------------------------------------------------------------
+# 소스별 하루 → 컬럼 묶음
+# ----------------------------------------------------------------------
+def reduce_hourly(df: pd.DataFrame) -> dict:
+    counts = to_number(df["count"]) if "count" in df.columns else pd.Series(dtype=float)
+    if counts.notna().sum() == 0:
+        return {}
+    hours = to_number(df["hour"]) if "hour" in df.columns else pd.Series(dtype=float)
+    return {
+        "inflow_total": counts.sum(),
+        "inflow_peak_hour": hours[counts.idxmax()] if len(hours) else None,
+    }
+
+
+def reduce_ratios(prefix: str, name_column: str):
+    def reduce(df: pd.DataFrame) -> dict:
+        if name_column not in df.columns or "ratio" not in df.columns:
+            return {}
+        ratios = to_number(df["ratio"])
+        return {f"{prefix}__{name}": ratio for name, ratio in zip(df[name_column], ratios) if pd.notna(name)}
+    return reduce
+
+
+def reduce_numeric(prefix: str, exclude=("event_dt", "date")):
+    def reduce(df: pd.DataFrame) -> dict:
+        values = df.drop(columns=[c for c in exclude if c in df.columns]).apply(to_number)
+        values = values.loc[:, values.notna().any()]
+        return {f"{prefix}__{column}": total for column, total in values.sum().items()}
+    return reduce
+
+
+def reduce_booking(df: pd.DataFrame) -> dict:
+    values = df[[c for c in df.columns if c.endswith("_value")]].apply(to_number)
+    return {f"booking__{column[:-len('_value')]}": total for column, total in values.sum(min_count=1).items()}
+
+
+def reduce_smlog(df: pd.DataFrame) -> dict:
+    from smlog_schema import normalize, SCHEMAS, COUNT, MONEY
+    typed = normalize(df, SMLOG_FACT_VAR)
+    measures = [name for name, kind in SCHEMAS[SMLOG_FACT_VAR] if kind in (COUNT, MONEY)]
+    return {f"smlog_{column}": typed[column].sum() for column in measures}
+
+
+REDUCERS = {
+    "place_hourly_inflow_graph": reduce_hourly,
+    "place_inflow_channel": reduce_ratios("channel", "channel"),
+    "place_inflow_keyword": reduce_ratios("keyword", "keyword"),
+    "smartcall_call_statistics": reduce_numeric("call"),
+    "booking_trend_chart": reduce_booking,
+    f"smlog_{SMLOG_FACT_VAR}": reduce_smlog,
+}
+
+
+def _days(start: str, end: str) -> list:
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def discover_smlog(smlog_data_dir: str, var: str = SMLOG_FACT_VAR) -> list:
+    """smlog_data/{var}/{date}_{var}.csv (사업장 1개) 또는 smlog_data/{business}/{var}/... 목록"""
+    if not os.path.isdir(smlog_data_dir):
+        return []
+    roots = [(DEFAULT_BUSINESS.key, smlog_data_dir)]
+    for entry in sorted(os.listdir(smlog_data_dir)):
+        path = os.path.join(smlog_data_dir, entry)
+        if not entry.startswith("_") and os.path.isdir(os.path.join(path, var)):
+            roots.append((entry, path))
+    files = []
+    for business, root in roots:
+        var_dir = os.path.join(root, var)
+        if not os.path.isdir(var_dir):
+            continue
+        for fname in sorted(os.listdir(var_dir)):
+            m = SMLOG_FILE_PATTERN.match(fname)
+            if m and m.group(2) == var:
+                path = os.path.join(var_dir, fname)
+                files.append(OutputFile(path, business, f"smlog_{var}", m.group(1), m.group(1),
+                                        rel_path="smlog:" + os.path.relpath(path, smlog_data_dir)))
+    return files
+
+
+class DailyFactBuilder:
+    """(business, event_dt) 일별 팩트 테이블을 하루 단위로 증분 갱신"""
+
+    def __init__(self, output_base_dir: str = "data/naverplace", smlog_data_dir: str = DEFAULT_SMLOG_DATA_DIR,
+                 fact_dir: str = None):
+        self.output_base_dir = output_base_dir
+        self.smlog_data_dir = smlog_data_dir
+        self.fact_dir = fact_dir or os.path.join(output_base_dir, "_facts", "daily")
+        self.state_path = os.path.join(self.fact_dir, "_state.json")
+        self.state = {"files": {}}  # rel_path -> {"signature", "business", "days"}
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠ [Facts] Could not read {self.state_path}, rebuilding: {e}")
+        self._cache = OrderedDict()  # 최근 읽은 원본 파일 (날짜 순 처리라 연속 날짜가 같은 파일을 재사용)
+        if SMLOG_DIR not in sys.path:
+            sys.path.insert(0, SMLOG_DIR)
+
+    # ------------------------------------------------------------------
+    # 소스
+    # ------------------------------------------------------------------
+    def sources(self) -> list:
+        outputs = discover_outputs(self.output_base_dir, list(FACT_MODULES)) + discover_smlog(self.smlog_data_dir)
+        # 날짜별 행이 없는 모듈은 하루짜리 파일만 사용 (여러 날을 합친 값은 날짜에 나눠 넣을 수 없음)
+        return [o for o in outputs if o.module in DATED_ROW_MODULES or o.start_date == o.end_date]
+
+    def read_source(self, output: OutputFile) -> pd.DataFrame:
+        if output.path in self._cache:
+            self._cache.move_to_end(output.path)
+            return self._cache[output.path]
+        df = pd.read_csv(output.path, dtype=str, encoding="utf-8-sig")
+        self._cache[output.path] = df
+        if len(self._cache) > SOURCE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return df
+
+    def day_partition(self, output: OutputFile, day: str) -> pd.DataFrame:
+        df = self.read_source(output)
+        date_column = DATED_ROW_MODULES.get(output.module)
+        if date_column and date_column in df.columns:
+            return df[pd.to_datetime(df[date_column], errors="coerce").dt.strftime("%Y-%m-%d") == day]
+        return df
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def build_row(self, business: str, day: str, outputs: list) -> dict:
+        """하루치 파티션들을 한 행으로 (같은 모듈 파일이 여러 개면 최근 파일 우선)"""
+        row = {"business": business, "event_dt": day}
+        latest = {}
+        for output in outputs:
+            current = latest.get(output.module)
+            if current is None or os.path.getmtime(output.path) > os.path.getmtime(current.path):
+                latest[output.module] = output
+        for module, output in sorted(latest.items()):
+            partition = self.day_partition(output, day)
+            if len(partition) == 0:
+                continue
+            try:
+                row.update(REDUCERS[module](partition))
+            except Exception as e:
+                logger.warning(f"  ⚠ [Facts] {output.rel_path} ({day}): {e}")
+        return row
+
+    def refresh(self) -> int:
+        """
+        바뀐 파티션이 있는 날짜만 다시 계산
+
+        Returns:
+            int: 다시 계산한 (사업장, 날짜) 수
+        """
+        outputs = self.sources()
+        known = self.state["files"]
+        current = {o.rel_path: o for o in outputs}
+
+        affected = set()
+        for rel_path, output in current.items():
+            entry = known.get(rel_path)
+            signature = file_signature(output.path)
+            if entry is None or entry["signature"] != signature:
+                days = _days(output.start_date, output.end_date)
+                affected.update((output.business, d) for d in days + (entry["days"] if entry else []))
+                known[rel_path] = {"signature": signature, "business": output.business, "days": days}
+        for rel_path in [rel for rel in known if rel not in current]:
+            entry = known.pop(rel_path)
+            affected.update((entry["business"], d) for d in entry["days"])
+        if not affected:
+            logger.info("  ✓ [Facts] Up to date")
+            return 0
+
+        # (사업장, 날짜) → 그 날짜를 담은 파티션
+        covering = {}
+        for output in outputs:
+            for day in known[output.rel_path]["days"]:
+                if (output.business, day) in affected:
+                    covering.setdefault((output.business, day), []).append(output)
+
+        # 월 파일 단위로 기록 (메모리: 한 달치 행)
+        by_month = {}
+        for business, day in sorted(affected):
+            by_month.setdefault((business, day[:7]), []).append(day)
+        for (business, month), days in sorted(by_month.items()):
+            rows = self.read_month(business, month)
+            for day in days:
+                outputs_for_day = covering.get((business, day), [])
+                if outputs_for_day:
+                    rows[day] = self.build_row(business, day, outputs_for_day)
+                else:
+                    rows.pop(day, None)
+            self.write_month(business, month, rows)
+
+        self.save_state()
+        logger.info(f"  ✓ [Facts] {len(affected)} (business, day) rows rebuilt in {len(by_month)} month files")
+        return len(affected)
+
+    # ------------------------------------------------------------------
+    # 저장/조회
+    # ------------------------------------------------------------------
+    def month_path(self, business: str, month: str) -> str:
+        return os.path.join(self.fact_dir, business, f"{month}.csv")
+
+    def read_month(self, business: str, month: str) -> dict:
+        path = self.month_path(business, month)
+        if not os.path.exists(path):
+            return {}
+        df = pd.read_csv(path, encoding="utf-8-sig", dtype={"business": str, "event_dt": str})
+        return {r["event_dt"]: {k: v for k, v in r.items() if pd.notna(v)} for r in df.to_dict("records")}
+
+    def write_month(self, business: str, month: str, rows: dict):
+        path = self.month_path(business, month)
+        if not rows:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        df = pd.DataFrame([rows[day] for day in sorted(rows)])
+        columns = ["business", "event_dt"] + sorted(c for c in df.columns if c not in ("business", "event_dt"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df[columns].to_csv(path + ".tmp", index=False, encoding="utf-8-sig")
+        os.replace(path + ".tmp", path)
+
+    def save_state(self):
+        os.makedirs(self.fact_dir, exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def iter_months(self, business: str = None, start: str = None, end: str = None):
+        """월 파일을 하나씩 DataFrame으로 (전체를 한 번에 읽지 않음)"""
+        if not os.path.isdir(self.fact_dir):
+            return
+        businesses = [business] if business else sorted(
+            d for d in os.listdir(self.fact_dir) if os.path.isdir(os.path.join(self.fact_dir, d)))
+        for key in businesses:
+            business_dir = os.path.join(self.fact_dir, key)
+            if not os.path.isdir(business_dir):
+                continue
+            for fname in sorted(os.listdir(business_dir)):
+                month = fname[:-4]
+                if not fname.endswith(".csv") or (start and month < start[:7]) or (end and month > end[:7]):
+                    continue
+                df = pd.read_csv(os.path.join(business_dir, fname), encoding="utf-8-sig", dtype={"business": str, "event_dt": str})
+                if start:
+                    df = df[df["event_dt"] >= start]
+                if end:
+                    df = df[df["event_dt"] <= end]
+                yield df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from modules.run_log import configure_logging
+
+    parser = argparse.ArgumentParser(description="일별 통합 팩트 테이블 증분 갱신")
+    parser.add_argument("--output-dir", default="data/naverplace", help="수집기 출력 루트")
+    parser.add_argument("--smlog-dir", default=DEFAULT_SMLOG_DATA_DIR, help="SMLOG smlog_data 경로")
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.output_dir, "_logs", "facts.jsonl"))
+    DailyFactBuilder(args.output_dir, args.smlog_dir).refresh()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+수집 데이터 조회 서비스 (로컬, 읽기 전용 HTTP)
+노트북에서 CSV를 다시 읽지 않고 자주 묻는 질문(어제 채널별 유입, 매체별 통화, 키워드 전환당 비용)을 바로 조회
+
+- GET 전용, 기본 127.0.0.1 바인딩
+- 엔드포인트: /rollups, /modules/{module}, /facts, /cost-per-conv, /validation (파라미터는 쿼리 문자열)
+- 응답: NDJSON(기본) 또는 CSV(format=csv), 큰 결과는 chunked 전송으로 나눠 보냄
+- 결과 캐시: (경로, 파라미터) LRU, 새 결과 파일이 들어오면 집계/팩트 테이블을 증분 갱신하고 캐시 비움
+  (파일 목록 확인은 refresh_interval초에 한 번)
+
+사용 예:
+    python -m pipeline.query_service --port 8765
+    curl "http://127.0.0.1:8765/rollups?grain=daily&module=place_inflow_channel&start=2025-11-17&end=2025-11-17"
+    curl "http://127.0.0.1:8765/cost-per-conv?by=keyword&start=2025-11-01&format=csv"
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+from modules.run_log import get_logger
+from .sources import discover_outputs, file_signature, MODULE_SPECS
+from .rollups import RollupStore, GRAINS, read_long
+from .fact_table import DailyFactBuilder, DEFAULT_SMLOG_DATA_DIR
+
+
+logger = get_logger(__name__)
+
+
+KWD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Nov.25__kwd.analysis")
+DEFAULT_PORT = 8765
+CACHE_SIZE = 128
+MAX_CACHED_BYTES = 8 * 1024 * 1024  # 이보다 큰 결과는 스트리밍만 하고 캐시하지 않음
+REFRESH_INTERVAL = 5.0
+
+
+class QueryError(Exception):
+    """잘못된 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _dates(params: dict) -> tuple:
+    try:
+        return tuple(pd.Timestamp(params[k]).strftime("%Y-%m-%d") if params.get(k) else None for k in ("start", "end"))
+    except ValueError as e:
+        raise QueryError(400, f"Invalid date: {e}")
+
+
+def _list(value: str) -> list:
+    return [v.strip() for v in value.split(",") if v.strip()] if value else None
+
+
+class QueryService:
+    """조회 핸들러 + 결과 캐시 + 새 파티션 감지"""
+
+    def __init__(self, output_base_dir: str = "data/naverplace", smlog_data_dir: str = DEFAULT_SMLOG_DATA_DIR,
+                 cache_size: int = CACHE_SIZE, max_cached_bytes: int = MAX_CACHED_BYTES, refresh_interval: float = REFRESH_INTERVAL):
+        self.output_base_dir = output_base_dir
+        self.smlog_data_dir = smlog_data_dir
+        self.cache_size = cache_size
+        self.max_cached_bytes = max_cached_bytes
+        self.refresh_interval = refresh_interval
+        self.rollups = RollupStore(output_base_dir)
+        self.facts = DailyFactBuilder(output_base_dir, smlog_data_dir)
+        self._attribution = None
+        self.cache = OrderedDict()  # (path, format, params) -> 응답 본문 bytes
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+        self.endpoints = {
+            "/rollups": self.query_rollups,
+            "/modules": self.query_module,
+            "/facts": self.query_facts,
+            "/cost-per-conv": self.query_cost_per_conv,
+            "/validation": self.query_validation,
+        }
+
+    # ------------------------------------------------------------------
+    # 새 파티션 감지 / 캐시
+    # ------------------------------------------------------------------
+    def current_generation(self) -> str:
+        """결과 파일 + SMLOG 원본 + 검증 보고서 + 비용 시트의 (경로, 서명) 해시"""
+        digest = hashlib.blake2b(digest_size=8)
+        for output in discover_outputs(self.output_base_dir):
+            digest.update(f"{output.rel_path}:{file_signature(output.path)}".encode("utf-8"))
+        for root, dirs, files in os.walk(self.smlog_data_dir):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("_"))  # _merged, _logs 등 제외
+            for fname in sorted(files):
+                if fname.endswith(".csv"):
+                    path = os.path.join(root, fname)
+                    digest.update(f"{path}:{file_signature(path)}".encode("utf-8"))
+        # 단독 실행한 python -m pipeline.validate 결과도 반영
+        report_path = os.path.join(self.output_base_dir, "_validation", "report.csv")
+        if os.path.exists(report_path):
+            digest.update(f"validation:{file_signature(report_path)}".encode("utf-8"))
+        if self._attribution is not None and os.path.exists(self._attribution.cost_path):
+            digest.update(str(file_signature(self._attribution.cost_path)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def check_generation(self):
+        """refresh_interval마다 파일 목록 확인, 바뀌었으면 테이블 증분 갱신 + 캐시 비움"""
+        with self._lock:
+            now = time.monotonic()
+            if self.generation is not None and now - self._checked_at < self.refresh_interval:
+                return
+            self._checked_at = now
+            generation = self.current_generation()
+            if generation == self.generation:
+                return
+            first = self.generation is None
+            self.generation = generation
+            self.cache.clear()
+            for name, refresh in (("rollups", self.rollups.refresh), ("facts", self.facts.refresh)):
+                try:
+                    refresh()
+                except Exception as e:
+                    logger.warning(f"  ⚠ [Query] {name} refresh failed: {e}")
+            if self._attribution is not None:
+                self._refresh_attribution()
+            if not first:
+                logger.info(f"  ℹ [Query] New partitions detected, tables refreshed and cache cleared ({generation})")
+
+    def cached(self, key):
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def store(self, key, entry, generation: str):
+        with self._lock:
+            if generation != self.generation:
+                return  # 응답 도중 새 파티션이 들어옴
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # 엔드포인트 (DataFrame 이터레이터 반환)
+    # ------------------------------------------------------------------
+    def resolve(self, path: str):
+        """/modules/{module} → (handler, module), 나머지는 (handler, None)"""
+        parts = path.rstrip("/").split("/")
+        handler = self.endpoints.get("/".join(parts[:2]))
+        if handler is None or (len(parts) > 2 and parts[1] != "modules") or len(parts) > 3:
+            raise QueryError(404, f"Unknown endpoint: {path}")
+        return handler, parts[2] if len(parts) == 3 else None
+
+    def query_rollups(self, params: dict, _=None):
+        grain = params.get("grain", "daily")
+        if grain not in GRAINS:
+            raise QueryError(400, f"grain must be one of {', '.join(GRAINS)}")
+        start, end = _dates(params)
+        with self._lock:
+            result = self.rollups.query(grain, params.get("business"), params.get("module"), params.get("measure"),
+                                        params.get("dimension"), start, end)
+        yield result
+
+    def query_module(self, params: dict, module: str = None):
+        """모듈 결과 롱 포맷 (같은 날짜 파일이 여러 개면 가장 최근 파일), 파일 하나씩 스트리밍"""
+        if module not in MODULE_SPECS:
+            raise QueryError(404, f"Unknown module: {module} (available: {', '.join(MODULE_SPECS)})")
+        start, end = _dates(params)
+        latest = {}
+        for output in discover_outputs(self.output_base_dir, [module]):
+            if params.get("business") and output.business != params["business"]:
+                continue
+            if (start and output.end_date < start) or (end and output.start_date > end):
+                continue
+            key = (output.business, output.start_date, output.end_date)
+            if key not in latest or os.path.getmtime(output.path) > os.path.getmtime(latest[key].path):
+                latest[key] = output
+        for key in sorted(latest):
+            df = read_long(latest[key])
+            if start:
+                df = df[df["date"] >= pd.Timestamp(start)]
+            if end:
+                df = df[df["date"] <= pd.Timestamp(end)]
+            for column in ("measure", "dimension"):
+                if params.get(column) is not None:
+                    df = df[df[column] == params[column]]
+            yield df
+
+    def query_facts(self, params: dict, _=None):
+        start, end = _dates(params)
+        months = self.facts.iter_months(params.get("business"), start, end)
+        while True:
+            # 월 파일 하나씩 잠금 안에서 읽음 (다른 스레드의 facts.refresh()와 겹치지 않게), 전송은 잠금 밖에서
+            with self._lock:
+                frame = next(months, None)
+            if frame is None:
+                return
+            yield frame
+
+    def _refresh_attribution(self):
+        try:
+            self._attribution.refresh()
+        except Exception as e:
+            logger.warning(f"  ⚠ [Query] Attribution refresh failed: {e}")
+
+    @property
+    def attribution(self):
+        """키워드 비용/전환 조인 (Nov.25__kwd.analysis, 처음 요청 시 로드)"""
+        with self._lock:
+            if self._attribution is None:
+                if KWD_DIR not in sys.path:
+                    sys.path.insert(0, KWD_DIR)
+                try:
+                    from kwd_attribution import KeywordAttribution
+                except ImportError as e:
+                    raise QueryError(503, f"Keyword attribution unavailable: {e}")
+                self._attribution = KeywordAttribution(smlog_data_dir=self.smlog_data_dir)
+                self._refresh_attribution()
+            return self._attribution
+
+    def query_cost_per_conv(self, params: dict, _=None):
+        start, end = _dates(params)
+        by = tuple(_list(params.get("by")) or ["keyword"])
+        if not set(by) <= {"keyword", "media", "date"}:
+            raise QueryError(400, "by must be keyword, media and/or date")
+        attribution = self.attribution
+        with self._lock:
+            result = attribution.cost_per_conv(by, start, end, _list(params.get("keyword")), _list(params.get("media")))
+        yield result
+
+    def query_validation(self, params: dict, _=None):
+        report_path = os.path.join(self.output_base_dir, "_validation", "report.csv")
+        if not os.path.exists(report_path):
+            return
+        df = pd.read_csv(report_path, dtype=str, encoding="utf-8-sig")
+        for column in ("business", "module", "rule", "severity"):
+            if params.get(column):
+                df = df[df[column] == params[column]]
+        yield df
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    @staticmethod
+    def serialize(frames, fmt: str):
+        """DataFrame 이터레이터 → bytes 조각 (CSV는 첫 조각에만 헤더)"""
+        header = True
+        for df in frames:
+            if len(df) == 0:
+                continue
+            if fmt == "csv":
+                text = df.to_csv(index=False, header=header, date_format="%Y-%m-%d")
+                header = False
+            else:
+                text = df.to_json(orient="records", lines=True, force_ascii=False, date_format="iso")
+                if not text.endswith("\n"):
+                    text += "\n"
+            yield text.encode("utf-8")
+
+    def start(self, port: int = DEFAULT_PORT, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        service = self
+
+        class QueryHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # chunked 전송
+
+            def send_body(self, status: int, content_type: str, body: bytes, cache: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-Cache", cache)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def send_json(self, status: int, payload: dict):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_body(status, "application/json; charset=utf-8", body, "BYPASS")
+
+            def do_GET(self):
+                started = time.monotonic()
+                url = urlparse(self.path)
+                params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                if url.path in ("", "/"):
+                    self.send_json(200, {
+                        "endpoints": sorted(service.endpoints) + [f"/modules/{m}" for m in MODULE_SPECS],
+                        "generation": service.generation,
+                        "cache": {"entries": len(service.cache), "hits": service.hits, "misses": service.misses},
+                    })
+                    return
+
+                fmt = params.pop("format", "ndjson")
+                if fmt not in ("ndjson", "csv"):
+                    self.send_json(400, {"error": "format must be ndjson or csv"})
+                    return
+                content_type = "text/csv; charset=utf-8" if fmt == "csv" else "application/x-ndjson; charset=utf-8"
+                service.check_generation()
+                key = (url.path.rstrip("/"), fmt, tuple(sorted(params.items())))
+                entry = service.cached(key)
+                if entry is not None:
+                    self.send_body(200, content_type, entry, "HIT")
+                    return
+
+                generation = service.generation
+                try:
+                    handler, module = service.resolve(url.path)
+                    chunks = service.serialize(handler(params, module), fmt)
+                    first = next(chunks, b"")  # 잘못된 파라미터는 헤더를 보내기 전에 오류로 응답
+                except QueryError as e:
+                    self.send_json(e.status, {"error": str(e)})
+                    return
+                except Exception as e:
+                    logger.warning(f"  ⚠ [Query] {self.path} failed: {type(e).__name__}: {e}")
+                    self.send_json(500, {"error": f"{type(e).__name__}: {e}"})
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.send_header("X-Cache", "MISS")
+                self.end_headers()
+                buffered, size = [], 0
+                try:
+                    if first:
+                        self.write_chunk(first)
+                        buffered.append(first)
+                        size += len(first)
+                    for chunk in chunks:
+                        self.write_chunk(chunk)
+                        if buffered is not None:
+                            buffered.append(chunk)
+                            size += len(chunk)
+                            if size > service.max_cached_bytes:
+                                buffered = None
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                except Exception as e:
+                    # 헤더를 이미 보냈으므로 연결을 끊어 불완전한 응답임을 알림
+                    logger.warning(f"  ⚠ [Query] {self.path} failed while streaming: {type(e).__name__}: {e}")
+                    self.close_connection = True
+                    return
+                if buffered is not None:
+                    service.store(key, b"".join(buffered), generation)
+                logger.debug("  [Query] %s %d bytes in %.1f ms", self.path, size, (time.monotonic() - started) * 1000)
+
+            def write_chunk(self, chunk: bytes):
+                self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+
+            def do_POST(self):
+                self.send_json(405, {"error": "Read-only service"})
+
+            do_PUT = do_DELETE = do_PATCH = do_POST
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 콘솔에 찍지 않음
+
+        service.check_generation()
+        server = ThreadingHTTPServer((host, port), QueryHandler)
+        logger.info(f"  ✓ [Query] Serving http://{host}:{port}/ ({len(self.endpoints)} endpoints)")
+        return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from modules.run_log import configure_logging
+
+    parser = argparse.ArgumentParser(description="수집 데이터 로컬 조회 서비스 (읽기 전용)")
+    parser.add_argument("--output-dir", default="data/naverplace", help="수집기 출력 루트")
+    parser.add_argument("--smlog-dir", default=DEFAULT_SMLOG_DATA_DIR, help="SMLOG smlog_data 경로")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE, help="캐시할 결과 수")
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.output_dir, "_logs", "query.jsonl"))
+    server = QueryService(args.output_dir, args.smlog_dir, cache_size=args.cache_size).start(args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
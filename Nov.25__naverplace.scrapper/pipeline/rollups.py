@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+일/주/월 집계 테이블 (증분 유지)
+모듈 결과 CSV를 (사업장, 모듈, 차원, 측정값) 기준 롱 포맷으로 집계해 _rollups/에 저장하고,
+새 event_dt 파티션이 들어오면 영향받는 날짜/주/월만 다시 계산
+
+- daily: 같은 날짜를 담은 파일이 여러 개면 가장 최근에 저장된 파일만 사용 (재수집 우선)
+- weekly(월요일 시작)/monthly: daily 테이블에서 계산 (원본 CSV를 다시 읽지 않음)
+- 건수 모듈은 합계, 비율 모듈(유입 채널/키워드/세그먼트)은 일별 값의 평균
+- 조회는 작은 집계 테이블만 읽음: RollupStore.query("weekly", module="place_hourly_inflow_graph")
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from modules.run_log import get_logger
+from .sources import discover_outputs, file_signature, OutputFile, MODULE_SPECS, ModuleSpec
+
+
+logger = get_logger(__name__)
+
+
+DEFAULT_ROLLUP_DIR = os.path.join("data", "naverplace", "_rollups")
+GRAINS = ("daily", "weekly", "monthly")
+KEY_COLUMNS = ["business", "module", "period", "dimension", "measure"]
+DIMENSION_SEPARATOR = " / "
+LONG_COLUMNS = ["business", "module", "date", "dimension", "measure", "value"]
+
+
+def empty_long() -> pd.DataFrame:
+    frame = pd.DataFrame(columns=LONG_COLUMNS)
+    return frame.astype({"date": "datetime64[ns]", "value": "float64"})
+
+
+def empty_table() -> pd.DataFrame:
+    """빈 집계 테이블 (period/value/days 타입을 채워진 테이블과 맞춰 merge·필터·저장이 그대로 동작)"""
+    frame = pd.DataFrame(columns=KEY_COLUMNS + ["value", "days"])
+    return frame.astype({"period": "datetime64[ns]", "value": "float64", "days": "int64"})
+
+
+def period_start(dates: pd.Series, grain: str) -> pd.Series:
+    """날짜 → 기간 시작일 (daily: 그대로, weekly: 그 주 월요일, monthly: 1일)"""
+    dates = pd.to_datetime(dates).dt.normalize()
+    if grain == "weekly":
+        return dates - pd.to_timedelta(dates.dt.weekday, unit="D")
+    if grain == "monthly":
+        return dates.dt.to_period("M").dt.to_timestamp()
+    return dates
+
+
+def to_number(series: pd.Series) -> pd.Series:
+    """'1,234' / '35%' / '35.2' → 숫자 (변환 불가면 NaN)"""
+    cleaned = series.astype("string").str.replace(r"[,%％\s]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+def read_long(output: OutputFile) -> pd.DataFrame:
+    """
+    결과 CSV 하나 → 롱 포맷 (business, module, date, dimension, measure, value)
+    """
+    spec = output.spec
+    df = pd.read_csv(output.path, dtype=str, encoding="utf-8-sig")
+    if len(df) == 0:
+        return empty_long()
+
+    if spec.date_column in df.columns:
+        dates = pd.to_datetime(df[spec.date_column], errors="coerce")
+    else:
+        dates = pd.Series(pd.Timestamp(output.start_date), index=df.index)
+
+    dimensions = [d for d in spec.dimensions if d in df.columns]
+    if dimensions:
+        dimension = df[dimensions].fillna("").astype(str).agg(DIMENSION_SEPARATOR.join, axis=1)
+    else:
+        dimension = pd.Series("", index=df.index)
+
+    if spec.measures is not None:
+        measures = [m for m in spec.measures if m in df.columns]
+    else:
+        excluded = set(dimensions) | {spec.date_column, "event_dt", "date"}
+        measures = [c for c in df.columns if c not in excluded]
+        if spec.measure_suffix:
+            measures = [c for c in measures if c.endswith(spec.measure_suffix)]
+
+    values = df[measures].apply(to_number)
+    # 숫자가 하나도 없는 컬럼(라벨, 툴팁 등)은 측정값에서 제외
+    values = values.loc[:, values.notna().any()]
+
+    wide = values.assign(date=dates.dt.normalize(), dimension=dimension)
+    long = wide.melt(id_vars=["date", "dimension"], var_name="measure", value_name="value")
+    long = long.dropna(subset=["date", "value"])
+    long.insert(0, "module", output.module)
+    long.insert(0, "business", output.business)
+    return long
+
+
+class RollupStore:
+    """일/주/월 집계 테이블 + 원본 파일 워터마크"""
+
+    def __init__(self, output_base_dir: str = "data/naverplace", rollup_dir: str = None):
+        self.output_base_dir = output_base_dir
+        self.rollup_dir = rollup_dir or os.path.join(output_base_dir, "_rollups")
+        self.state_path = os.path.join(self.rollup_dir, "_state.json")
+        self.state = {"files": {}}  # rel_path -> {"signature", "business", "module", "dates", "mtime"}
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠ [Rollup] Could not read {self.state_path}, rebuilding: {e}")
+        self.tables = {grain: self._read_table(grain) for grain in GRAINS}
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def _table_path(self, grain: str) -> str:
+        return os.path.join(self.rollup_dir, f"{grain}.csv")
+
+    def _read_table(self, grain: str) -> pd.DataFrame:
+        path = self._table_path(grain)
+        if not os.path.exists(path) or not self.state["files"]:
+            return empty_table()
+        df = pd.read_csv(path, dtype={"business": str, "module": str, "dimension": str, "measure": str}, keep_default_na=False)
+        df["period"] = pd.to_datetime(df["period"])
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        df["days"] = pd.to_numeric(df["days"], errors="coerce")
+        return df
+
+    def save(self):
+        os.makedirs(self.rollup_dir, exist_ok=True)
+        for grain, table in self.tables.items():
+            path = self._table_path(grain)
+            out = table.assign(period=table["period"].dt.strftime("%Y-%m-%d"))
+            out.to_csv(path + ".tmp", index=False, encoding="utf-8-sig")
+            os.replace(path + ".tmp", path)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def refresh(self, modules: list = None) -> int:
+        """
+        새/변경/삭제된 결과 파일만 반영
+
+        Returns:
+            int: 다시 계산한 (사업장, 모듈, 날짜) 수
+        """
+        outputs = discover_outputs(self.output_base_dir, modules)
+        known = self.state["files"]
+        changed = [
+            o for o in outputs
+            if o.rel_path not in known or known[o.rel_path]["signature"] != file_signature(o.path)
+        ]
+        removed = [rel for rel, entry in known.items()
+                   if rel not in {o.rel_path for o in outputs} and (not modules or entry["module"] in modules)]
+        if not changed and not removed:
+            logger.info("  ✓ [Rollup] Up to date")
+            return 0
+
+        # 1. 바뀐 파일을 읽어 실제 날짜 파악 (이전 날짜 + 새 날짜 모두 다시 계산 대상)
+        fresh = {o.rel_path: read_long(o) for o in changed}
+        affected = {}
+        for o in changed:
+            new_dates = set(fresh[o.rel_path]["date"].dt.strftime("%Y-%m-%d"))
+            old_dates = set(known.get(o.rel_path, {}).get("dates", []))
+            affected.setdefault((o.business, o.module), set()).update(new_dates | old_dates)
+            known[o.rel_path] = {
+                "signature": file_signature(o.path),
+                "business": o.business,
+                "module": o.module,
+                "dates": sorted(new_dates),
+                "mtime": os.path.getmtime(o.path),
+            }
+        for rel in removed:
+            entry = known.pop(rel)
+            affected.setdefault((entry["business"], entry["module"]), set()).update(entry["dates"])
+
+        # 2. 영향받는 날짜를 담은 다른 파일도 읽어서 날짜별로 최신 파일만 사용
+        by_rel = {o.rel_path: o for o in outputs}
+        frames = []
+        for (business, module), dates in affected.items():
+            sources = [
+                rel for rel, entry in known.items()
+                if entry["business"] == business and entry["module"] == module and dates & set(entry["dates"])
+            ]
+            for rel in sources:
+                long = fresh.get(rel)
+                if long is None:
+                    long = read_long(by_rel[rel])
+                long = long[long["date"].dt.strftime("%Y-%m-%d").isin(dates)]
+                if len(long):
+                    frames.append(long.assign(_mtime=known[rel]["mtime"]))
+        rows = pd.concat(frames, ignore_index=True) if frames else empty_long().assign(_mtime=0.0)
+        if len(rows):
+            latest = rows.groupby(["business", "module", "date"])["_mtime"].transform("max")
+            rows = rows[rows["_mtime"] == latest]
+
+        # 3. daily → weekly/monthly 순서로 영향받는 기간만 교체
+        affected_frame = pd.DataFrame(
+            [(b, m, d) for (b, m), dates in affected.items() for d in dates],
+            columns=["business", "module", "date"],
+        )
+        affected_frame["date"] = pd.to_datetime(affected_frame["date"])
+        daily = self._aggregate_daily(rows)
+        self.tables["daily"] = self._replace(self.tables["daily"], daily, affected_frame.rename(columns={"date": "period"}))
+        for grain in ("weekly", "monthly"):
+            periods = affected_frame.assign(period=period_start(affected_frame["date"], grain))[["business", "module", "period"]].drop_duplicates()
+            source = self.tables["daily"].merge(periods.rename(columns={"period": "_p"}), on=["business", "module"])
+            source = source[period_start(source["period"], grain) == source["_p"]].drop(columns=["_p"])
+            self.tables[grain] = self._replace(self.tables[grain], self._aggregate_period(source, grain), periods)
+
+        self.save()
+        logger.info(f"  ✓ [Rollup] {len(changed)} new/changed files, {len(removed)} removed, {len(affected_frame)} (business, module, date) recomputed")
+        return len(affected_frame)
+
+    @staticmethod
+    def _agg_method(module: str) -> str:
+        return MODULE_SPECS.get(module, ModuleSpec()).agg
+
+    def _aggregate_daily(self, rows: pd.DataFrame) -> pd.DataFrame:
+        if len(rows) == 0:
+            return empty_table()
+        rows = rows.rename(columns={"date": "period"})
+        frames = []
+        for module, group in rows.groupby("module"):
+            method = self._agg_method(module)
+            frames.append(group.groupby(KEY_COLUMNS, as_index=False)["value"].agg(method))
+        daily = pd.concat(frames, ignore_index=True)
+        daily["days"] = 1
+        return daily
+
+    def _aggregate_period(self, daily: pd.DataFrame, grain: str) -> pd.DataFrame:
+        if len(daily) == 0:
+            return empty_table()
+        daily = daily.assign(period=period_start(daily["period"], grain))
+        frames = []
+        for module, group in daily.groupby("module"):
+            method = self._agg_method(module)
+            frames.append(group.groupby(KEY_COLUMNS, as_index=False).agg(value=("value", method), days=("days", "sum")))
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _replace(table: pd.DataFrame, new_rows: pd.DataFrame, periods: pd.DataFrame) -> pd.DataFrame:
+        """table에서 (business, module, period)가 periods에 있는 행을 new_rows로 교체"""
+        marker = periods[["business", "module", "period"]].drop_duplicates().assign(_drop=True)
+        kept = table.merge(marker, on=["business", "module", "period"], how="left")
+        kept = kept[kept["_drop"].isna()].drop(columns=["_drop"])
+        # 빈 프레임과의 concat은 dtype 추론이 바뀌므로 (FutureWarning) 비어 있지 않은 쪽만 합침
+        parts = [frame for frame in (kept, new_rows) if len(frame)]
+        merged = pd.concat(parts, ignore_index=True) if len(parts) > 1 else (parts[0] if parts else kept)
+        return merged.sort_values(KEY_COLUMNS, kind="stable").reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def query(self, grain: str = "weekly", business: str = None, module: str = None, measure: str = None,
+              dimension: str = None, start: str = None, end: str = None) -> pd.DataFrame:
+        """집계 테이블 조회 (start/end: 기간 시작일 기준, 포함)"""
+        df = self.tables[grain]
+        mask = pd.Series(True, index=df.index)
+        for column, value in (("business", business), ("module", module), ("measure", measure), ("dimension", dimension)):
+            if value is not None:
+                mask &= df[column] == value
+        if start is not None:
+            mask &= df["period"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= df["period"] <= pd.Timestamp(end)
+        return df[mask].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from modules.run_log import configure_logging
+
+    parser = argparse.ArgumentParser(description="일/주/월 집계 테이블 증분 갱신")
+    parser.add_argument("--output-dir", default="data/naverplace", help="수집기 출력 루트")
+    parser.add_argument("--module", action="append", help="이 모듈만 갱신 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.output_dir, "_logs", "rollups.jsonl"))
+    RollupStore(args.output_dir).refresh(args.module)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+수집 결과 파일 탐색 + 모듈별 출력 스키마
+data/naverplace/{module}/{module}__YYYYMMDD_YYYYMMDD.csv (사업장 1개)
+data/naverplace/{business}/{module}/... (사업장 여러 개) 를 한 목록으로 정리
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+
+from modules.business_catalog import DEFAULT_BUSINESS
+
+
+OUTPUT_FILE_PATTERN = re.compile(r"^(?P<module>[a-z_]+)__(?P<start>\d{8})_(?P<end>\d{8})\.csv$")
+
+
+@dataclass
+class ModuleSpec:
+    """모듈 출력의 차원/측정값 정의"""
+    dimensions: tuple = ()
+    measures: tuple = None  # None이면 차원/날짜 외 숫자 컬럼 전체
+    agg: str = "sum"  # 기간 합산 방법: sum (건수) / mean (비율)
+    date_column: str = "event_dt"  # 행의 날짜 컬럼
+    measure_suffix: str = None  # measures=None일 때 이 접미사로 끝나는 컬럼만 측정값으로 사용
+
+
+MODULE_SPECS = {
+    "place_hourly_inflow_graph": ModuleSpec(("hour",), ("count",)),
+    "place_inflow_channel": ModuleSpec(("channel",), ("ratio",), agg="mean"),
+    "place_inflow_keyword": ModuleSpec(("keyword",), ("ratio",), agg="mean"),
+    "place_inflow_segment": ModuleSpec(("gender", "age"), ("ratio",), agg="mean"),
+    "smartcall_call_statistics": ModuleSpec(),
+    "smartcall_top_media": ModuleSpec(("media",), ("count",)),
+    "smartcall_top_keyword": ModuleSpec(("keyword",), ("count",)),
+    # 예약 추이는 요청 구간 전체가 한 파일 → 행마다 실제 날짜(date) 사용
+    "booking_trend_chart": ModuleSpec(date_column="date", measure_suffix="_value"),
+}
+
+
+# 다른 스크래퍼가 함께 저장하는 결과 모듈 → 실제로 수집하는 스크래퍼 모듈 (재수집 작업 등록용)
+SCRAPER_MODULES = {
+    "place_inflow_keyword": "place_inflow_channel",
+}
+
+
+def scraper_module(module: str) -> str:
+    """결과 모듈 이름 → 그 결과를 저장하는 스크래퍼의 모듈 이름"""
+    return SCRAPER_MODULES.get(module, module)
+
+
+def output_modules(scraper_modules: list) -> list:
+    """스크래퍼 모듈들이 저장하는 결과 모듈 전체 (place_inflow_channel → + place_inflow_keyword)"""
+    derived = [output for output, scraper in SCRAPER_MODULES.items() if scraper in scraper_modules]
+    return list(scraper_modules) + derived
+
+
+@dataclass
+class OutputFile:
+    """모듈 결과 CSV 하나"""
+    path: str
+    business: str
+    module: str
+    start_date: str  # YYYY-MM-DD
+    end_date: str
+    rel_path: str = field(default=None)
+
+    @property
+    def spec(self) -> ModuleSpec:
+        return MODULE_SPECS.get(self.module, ModuleSpec())
+
+
+def _iso(yyyymmdd: str) -> str:
+    return f"{yyyymmdd[:4]}-{yyyymmdd[4:6]}-{yyyymmdd[6:]}"
+
+
+def _module_files(module_dir: str, base_dir: str, business: str) -> list:
+    files = []
+    for fname in sorted(os.listdir(module_dir)):
+        m = OUTPUT_FILE_PATTERN.match(fname)
+        if not m or m.group("module") != os.path.basename(module_dir):
+            continue
+        path = os.path.join(module_dir, fname)
+        files.append(OutputFile(
+            path=path,
+            business=business,
+            module=m.group("module"),
+            start_date=_iso(m.group("start")),
+            end_date=_iso(m.group("end")),
+            rel_path=os.path.relpath(path, base_dir),
+        ))
+    return files
+
+
+def discover_outputs(output_base_dir: str = "data/naverplace", modules: list = None) -> list:
+    """
+    수집 결과 CSV 목록 (밑줄로 시작하는 폴더: _queue, _logs, _rollups 등은 제외)
+
+    Args:
+        output_base_dir: 수집기 출력 루트
+        modules: 지정하면 이 모듈만
+
+    Returns:
+        list: OutputFile 리스트
+    """
+    if not os.path.isdir(output_base_dir):
+        return []
+    files = []
+    for entry in sorted(os.listdir(output_base_dir)):
+        path = os.path.join(output_base_dir, entry)
+        if entry.startswith("_") or entry.startswith(".") or not os.path.isdir(path):
+            continue
+        if entry in MODULE_SPECS:
+            # 사업장 1개: 모듈 폴더가 바로 아래
+            files.extend(_module_files(path, output_base_dir, DEFAULT_BUSINESS.key))
+            continue
+        # 사업장별 파티션
+        for module in sorted(os.listdir(path)):
+            module_dir = os.path.join(path, module)
+            if module in MODULE_SPECS and os.path.isdir(module_dir):
+                files.extend(_module_files(module_dir, output_base_dir, entry))
+    if modules:
+        files = [f for f in files if f.module in modules]
+    return files
+
+
+def file_signature(path: str) -> list:
+    """변경 감지용 (mtime_ns, size)"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
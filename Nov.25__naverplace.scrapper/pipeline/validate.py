@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+수집 결과 품질 검증 (수집 후 실행)
+모듈별 선언형 규칙으로 결과 CSV를 모듈 단위로 한 번에 검사하고, 실패한 (사업장, 모듈, 날짜)를 재수집 대상으로 등록
+
+- 규칙은 행 단위 반복 없이 컬럼 연산 + groupby로 (파일, 날짜) 그룹마다 판정
+- 새로 저장되거나 바뀐 파일만 검사 (_validation/_state.json에 파일 서명)
+- 보고서: _validation/report.csv (실패 그룹당 1행), 로그에는 모듈/규칙별 건수만
+- severity="error" 실패는 작업 큐(_queue/tasks.json)에 다시 넣고 백필 매니페스트 항목은 invalid로 변경
+  (같은 작업은 MAX_RESCRAPES번까지만 재수집, 그 뒤로는 보고서에만 남김)
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+
+from modules.run_log import get_logger
+from modules.task_queue import TaskQueue, CollectionTask
+from .sources import discover_outputs, file_signature, scraper_module
+from .rollups import to_number
+
+
+logger = get_logger(__name__)
+
+
+GROUP_KEYS = ["file", "business", "module", "date"]
+REPORT_COLUMNS = GROUP_KEYS + ["rule", "severity", "failed_rows", "rows", "detail"]
+MAX_RESCRAPES = 2
+INVALID = "invalid"  # 백필 매니페스트 상태 (is_done이 아니므로 다음 백필에서 다시 수집)
+
+
+# ----------------------------------------------------------------------
+# 규칙
+# ----------------------------------------------------------------------
+@dataclass
+class Rule:
+    """(파일, 날짜) 그룹 단위 검사"""
+    severity: str = "error"
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    def evaluate(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns:
+            DataFrame: 그룹 키 + failed_rows, detail (실패 그룹만)
+        """
+        raise NotImplementedError
+
+    def _bad_rows(self, frame: pd.DataFrame, bad: pd.Series, describe) -> pd.DataFrame:
+        failed = bad.groupby([frame[k] for k in GROUP_KEYS]).sum()
+        failed = failed[failed > 0].rename("failed_rows").reset_index()
+        failed["detail"] = describe
+        return failed
+
+
+@dataclass
+class Numeric(Rule):
+    """값이 있고 숫자로 읽혀야 함 (None/빈 값/깨진 문자열)"""
+    column: str = None
+
+    def evaluate(self, frame):
+        if self.column not in frame.columns:
+            bad = pd.Series(True, index=frame.index)
+        else:
+            bad = to_number(frame[self.column]).isna()
+        return self._bad_rows(frame, bad, f"{self.column} missing or not numeric")
+
+
+@dataclass
+class Between(Rule):
+    """숫자 값이 [low, high] 범위 안"""
+    column: str = None
+    low: float = None
+    high: float = None
+
+    def evaluate(self, frame):
+        if self.column not in frame.columns:
+            return self._bad_rows(frame, pd.Series(False, index=frame.index), "")
+        values = to_number(frame[self.column])
+        bad = values.notna() & ~values.between(self.low, self.high)
+        return self._bad_rows(frame, bad, f"{self.column} outside [{self.low:g}, {self.high:g}]")
+
+
+@dataclass
+class GroupTotal(Rule):
+    """그룹 합계가 target ± tolerance (예: 채널 비율 합 ≈ 100)"""
+    column: str = None
+    target: float = 100.0
+    tolerance: float = 2.0
+
+    def evaluate(self, frame):
+        values = to_number(frame[self.column]) if self.column in frame.columns else pd.Series(float("nan"), index=frame.index)
+        totals = values.groupby([frame[k] for k in GROUP_KEYS]).sum(min_count=1)
+        off = totals.isna() | ((totals - self.target).abs() > self.tolerance)
+        failed = totals[off].rename("total").reset_index()
+        failed["failed_rows"] = 0
+        failed["detail"] = self.column + " sums to " + failed["total"].round(2).astype(str) + f" (expected {self.target:g}±{self.tolerance:g})"
+        return failed.drop(columns="total")
+
+
+@dataclass
+class RowCount(Rule):
+    """그룹 행 수 (예: 시간별 그래프 24행)"""
+    expected: int = 24
+
+    def evaluate(self, frame):
+        counts = frame.groupby(GROUP_KEYS).size()
+        failed = counts[counts != self.expected].rename("failed_rows").reset_index()
+        failed["detail"] = failed["failed_rows"].astype(str) + f" rows (expected {self.expected})"
+        return failed
+
+
+@dataclass
+class NotAllZero(Rule):
+    """
+    측정값 컬럼(suffix)이 전부 0인 행
+    빈 기간 채우기 행(라벨 = 날짜, 툴팁 = "{피쳐}: 0", BookingTrendChartScraper.build_combined_data)은 제외
+    """
+    suffix: str = "_value"
+
+    def evaluate(self, frame):
+        columns = [c for c in frame.columns if c.endswith(self.suffix)]
+        if not columns:
+            return self._bad_rows(frame, pd.Series(False, index=frame.index), "")
+        values = frame[columns].apply(to_number).fillna(0)
+        filler = pd.Series(True, index=frame.index)
+        for column in columns:
+            feature = column[:-len(self.suffix)]
+            label, tooltip = frame.get(f"{feature}_label"), frame.get(f"{feature}_tooltip")
+            if label is None or tooltip is None:
+                filler &= False
+                continue
+            filler &= (label == frame["date"]) & (tooltip == f"{feature}: 0")
+        bad = (values == 0).all(axis=1) & ~filler
+        return self._bad_rows(frame, bad, f"all {len(columns)} *{self.suffix} columns are 0")
+
+
+VALIDATION_RULES = {
+    "place_hourly_inflow_graph": [RowCount(expected=24), Numeric(column="count"), Between(column="count", low=0, high=float("inf"))],
+    "place_inflow_channel": [Numeric(column="ratio"), Between(column="ratio", low=0, high=100), GroupTotal(column="ratio", target=100, tolerance=2)],
+    "place_inflow_keyword": [Numeric(column="ratio"), Between(column="ratio", low=0, high=100)],
+    # 세그먼트 비율은 성별 비율 × 나이대 비율 (0~1)
+    "place_inflow_segment": [Numeric(column="ratio"), Between(column="ratio", low=0, high=1)],
+    "smartcall_top_media": [Numeric(column="count", severity="warning")],
+    "smartcall_top_keyword": [Numeric(column="count", severity="warning")],
+    # 예약이 실제로 없는 날도 있으므로 경고만 (재수집 안 함)
+    "booking_trend_chart": [NotAllZero(suffix="_value", severity="warning")],
+}
+
+
+# ----------------------------------------------------------------------
+# 검증 실행
+# ----------------------------------------------------------------------
+class OutputValidator:
+    """바뀐 결과 파일만 모듈 단위로 모아 규칙 적용 → 보고서 + 재수집 등록"""
+
+    def __init__(self, output_base_dir: str = "data/naverplace", rules: dict = None, task_queue: TaskQueue = None):
+        self.output_base_dir = output_base_dir
+        self.rules = rules or VALIDATION_RULES
+        self.task_queue = task_queue
+        self.validation_dir = os.path.join(output_base_dir, "_validation")
+        self.report_path = os.path.join(self.validation_dir, "report.csv")
+        self.state_path = os.path.join(self.validation_dir, "_state.json")
+        self.manifest_path = os.path.join(output_base_dir, "_backfill", "manifest.json")
+        self.state = {"files": {}, "rescrapes": {}}  # files: rel_path -> signature, rescrapes: task_id -> 횟수
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠ [Validate] Could not read {self.state_path}, re-validating all files: {e}")
+
+    def read_module(self, outputs: list) -> pd.DataFrame:
+        """한 모듈의 파일들을 하나의 프레임으로 (file/business/module/date 컬럼 추가)"""
+        frames = []
+        for output in outputs:
+            df = pd.read_csv(output.path, dtype=str, encoding="utf-8-sig")
+            date_column = output.spec.date_column
+            if date_column in df.columns:
+                dates = pd.to_datetime(df[date_column], errors="coerce").dt.strftime("%Y-%m-%d").fillna(output.start_date)
+            else:
+                dates = output.start_date
+            frames.append(df.assign(file=output.rel_path, business=output.business, module=output.module, date=dates))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=GROUP_KEYS)
+
+    def validate(self, modules: list = None) -> pd.DataFrame:
+        """
+        새/변경 파일 검증
+
+        Returns:
+            DataFrame: 이번 실행의 실패 그룹 (REPORT_COLUMNS)
+        """
+        outputs = [o for o in discover_outputs(self.output_base_dir, modules) if o.module in self.rules]
+        known = self.state["files"]
+        changed = [o for o in outputs if known.get(o.rel_path) != file_signature(o.path)]
+        if not changed:
+            logger.info("  ✓ [Validate] No new result files")
+            return pd.DataFrame(columns=REPORT_COLUMNS)
+
+        by_module = {}
+        for output in changed:
+            by_module.setdefault(output.module, []).append(output)
+
+        results = []
+        for module, module_outputs in sorted(by_module.items()):
+            frame = self.read_module(module_outputs)
+            rows = frame.groupby(GROUP_KEYS).size().rename("rows")
+            for rule in self.rules[module]:
+                failed = rule.evaluate(frame)
+                if len(failed):
+                    failed = failed.join(rows, on=GROUP_KEYS).assign(rule=rule.name, severity=rule.severity)
+                    results.append(failed)
+        failures = pd.concat(results, ignore_index=True)[REPORT_COLUMNS] if results else pd.DataFrame(columns=REPORT_COLUMNS)
+
+        self.write_report(failures, [o.rel_path for o in changed])
+        self.log_summary(failures, len(changed))
+        self.flag_rescrapes(failures[failures["severity"] == "error"])
+        for output in changed:
+            known[output.rel_path] = file_signature(output.path)
+        self.save_state()
+        return failures
+
+    # ------------------------------------------------------------------
+    # 보고서
+    # ------------------------------------------------------------------
+    def write_report(self, failures: pd.DataFrame, checked_files: list):
+        """다시 검사한 파일의 이전 결과는 교체, 없어진 파일 결과는 제거"""
+        report = pd.DataFrame(columns=REPORT_COLUMNS)
+        if os.path.exists(self.report_path):
+            report = pd.read_csv(self.report_path, dtype=str, encoding="utf-8-sig")
+            existing = {o.rel_path for o in discover_outputs(self.output_base_dir)}
+            report = report[~report["file"].isin(checked_files) & report["file"].isin(existing)]
+        report = pd.concat([report, failures.astype(str)], ignore_index=True).sort_values(["module", "business", "date", "rule"])
+        os.makedirs(self.validation_dir, exist_ok=True)
+        report.to_csv(self.report_path + ".tmp", index=False, encoding="utf-8-sig")
+        os.replace(self.report_path + ".tmp", self.report_path)
+
+    def log_summary(self, failures: pd.DataFrame, checked: int):
+        if len(failures) == 0:
+            logger.info(f"  ✓ [Validate] {checked} files passed")
+            return
+        logger.warning(f"  ⚠ [Validate] {len(failures)} failed checks in {checked} files (report: {self.report_path})")
+        counts = failures.groupby(["module", "rule", "severity"]).size()
+        for (module, rule, severity), count in counts.items():
+            logger.warning(f"    - {module} / {rule} ({severity}): {count} (business, date) groups")
+
+    # ------------------------------------------------------------------
+    # 재수집 등록
+    # ------------------------------------------------------------------
+    def flag_rescrapes(self, failures: pd.DataFrame) -> int:
+        """실패한 (사업장, 모듈, 날짜)를 작업 큐에 다시 넣고 백필 매니페스트 항목을 invalid로"""
+        if len(failures) == 0:
+            return 0
+        rescrapes = self.state.setdefault("rescrapes", {})
+        tasks, reasons = [], {}
+        # 다른 스크래퍼가 저장한 결과(place_inflow_keyword 등)는 그 스크래퍼 작업으로 재수집
+        failures = failures.assign(module=failures["module"].map(scraper_module))
+        for key, group in failures.groupby(["business", "module", "date"]):
+            task = CollectionTask(*key)
+            if rescrapes.get(task.task_id, 0) >= MAX_RESCRAPES:
+                continue
+            rescrapes[task.task_id] = rescrapes.get(task.task_id, 0) + 1
+            reasons[task.task_id] = "; ".join(f"{r}: {d}" for r, d in zip(group["rule"], group["detail"]))
+            tasks.append(task)
+        if not tasks:
+            logger.info(f"  ℹ [Validate] Failed dates already re-scraped {MAX_RESCRAPES} times, reported only")
+            return 0
+
+        task_queue = self.task_queue or TaskQueue(os.path.join(self.output_base_dir, "_queue"))
+        requeued = task_queue.requeue(tasks, reasons)
+        invalidated = self.invalidate_manifest(reasons)
+        logger.info(f"  ℹ [Validate] {requeued} tasks queued for re-scrape ({invalidated} backfill manifest entries invalidated)")
+        return requeued
+
+    def invalidate_manifest(self, reasons: dict) -> int:
+        if not os.path.exists(self.manifest_path):
+            return 0
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        entries = manifest.get("tasks", {})
+        invalidated = 0
+        for task_id, reason in reasons.items():
+            if task_id in entries:
+                entries[task_id].update(status=INVALID, last_error=f"Validation: {reason}", updated_at=pd.Timestamp.now().isoformat())
+                invalidated += 1
+        if invalidated:
+            tmp_path = self.manifest_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        return invalidated
+
+    def save_state(self):
+        os.makedirs(self.validation_dir, exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from modules.run_log import configure_logging
+
+    parser = argparse.ArgumentParser(description="수집 결과 품질 검증 + 재수집 등록")
+    parser.add_argument("--output-dir", default="data/naverplace", help="수집기 출력 루트")
+    parser.add_argument("--module", action="append", help="이 모듈만 검증 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.output_dir, "_logs", "validate.jsonl"))
+    OutputValidator(args.output_dir).validate(args.module)
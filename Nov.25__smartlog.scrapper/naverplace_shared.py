@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared Infrastructure Path
+The logger, metrics, rate limiter, selector resolver and business catalog live in the
+naverplace scraper package (Nov.25__naverplace.scrapper/modules). Call use_naverplace_modules()
+once before importing from modules.*; modules/__init__ loads the Playwright scrapers lazily,
+so only the light utility modules are imported.
+"""
+
+import os
+import sys
+
+
+NAVERPLACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Nov.25__naverplace.scrapper')
+
+
+def use_naverplace_modules():
+    """Put the naverplace scraper folder on sys.path (idempotent)"""
+    if NAVERPLACE_DIR not in sys.path:
+        sys.path.insert(0, NAVERPLACE_DIR)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SMLOG Out-of-Core Aggregation
+Group-by sums over the merged store (any history length) without concatenating it
+
+- The store is streamed in record batches (SMLogMergeStore.iter_batches)
+- Each batch is pre-aggregated, then folded into the running state:
+  group key -> integer id, measures in one float64 array per column (+ a row counter)
+- When the state outgrows memory_cap_mb it is hash-partitioned to Parquet spill files and reset;
+  the result is then built one spill partition at a time (each partition holds a disjoint key set)
+- Mean-type columns (churnRate, avgSesstionTime) are not summable: aggregate their inputs instead
+- Rows with a missing group key are skipped (pandas groupby default)
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.run_log import get_logger, configure_logging
+from smlog_merge import SMLogMergeStore, DATA_DIR, BATCH_ROWS
+
+
+logger = get_logger(__name__)
+
+MEMORY_CAP_MB = 256
+SPILL_PARTITIONS = 16
+ROWS_COLUMN = 'rows'
+SUM_COLUMNS = ['totalClick', 'validClick', 'conv_ask', 'conv_join', 'conv_order', 'conv_rev']
+# Rough per-group cost of the key dict entry + tuple (bytes); arrays are counted exactly
+KEY_OVERHEAD_BYTES = 200
+
+
+class ChunkedAggregator:
+    """Streaming group-by sum with a memory cap and hash-partitioned spilling"""
+
+    def __init__(self, by, sums, memory_cap_mb=MEMORY_CAP_MB, spill_dir=None, spill_partitions=SPILL_PARTITIONS):
+        self.by = list(by)
+        self.sums = list(sums)
+        self.memory_cap = memory_cap_mb * 1024 * 1024
+        self.spill_partitions = spill_partitions
+        self.spill_dir = spill_dir  # parent of the temporary spill directory (default: system temp)
+        self._spill_root = None
+        self.spills = 0
+        self._reset()
+
+    def _reset(self):
+        self.ids = {}
+        self.size = 0
+        self.values = np.zeros((len(self.sums) + 1, 1024), dtype=np.float64)  # last row: row counts
+
+    @property
+    def state_bytes(self):
+        return self.values.nbytes + len(self.ids) * KEY_OVERHEAD_BYTES
+
+    def _ensure_capacity(self, size):
+        capacity = self.values.shape[1]
+        if size > capacity:
+            grown = np.zeros((self.values.shape[0], max(size, capacity * 2)), dtype=np.float64)
+            grown[:, :capacity] = self.values
+            self.values = grown
+
+    def update(self, df):
+        """Fold one batch into the running state"""
+        if len(df) == 0:
+            return
+        values = df[self.sums].astype('float64').fillna(0)
+        partial = values.groupby([df[c] for c in self.by], sort=False).sum()
+        partial[ROWS_COLUMN] = df.groupby([df[c] for c in self.by], sort=False).size()
+
+        # Only the batch's distinct keys go through Python; the sums are one array add
+        keys = partial.index if len(self.by) > 1 else [(k,) for k in partial.index]
+        positions = np.fromiter((self.ids.setdefault(k, len(self.ids)) for k in keys), dtype=np.int64, count=len(partial))
+        self.size = len(self.ids)
+        self._ensure_capacity(self.size)
+        self.values[:, positions] += partial.to_numpy(dtype=np.float64).T
+
+        if self.state_bytes > self.memory_cap:
+            self.spill()
+
+    def state_frame(self):
+        keys = pd.DataFrame(list(self.ids), columns=self.by)
+        measures = pd.DataFrame(self.values[:, :self.size].T, columns=self.sums + [ROWS_COLUMN])
+        return pd.concat([keys, measures], axis=1)
+
+    def spill(self):
+        """Write the state as hash partitions and start over"""
+        if not self.ids:
+            return
+        if self._spill_root is None:
+            self._spill_root = tempfile.mkdtemp(prefix='smlog_spill_', dir=self.spill_dir)
+        frame = self.state_frame()
+        partition = pd.util.hash_pandas_object(frame[self.by], index=False).to_numpy() % self.spill_partitions
+        for p in np.unique(partition):
+            part_dir = os.path.join(self._spill_root, f"p{p:03d}")
+            os.makedirs(part_dir, exist_ok=True)
+            frame[partition == p].to_parquet(os.path.join(part_dir, f"spill-{self.spills:05d}.parquet"), index=False)
+        logger.info(f"  ℹ [Aggregate] Spilled {len(frame)} groups ({self.state_bytes / 1024 / 1024:.0f} MB) to {self._spill_root}")
+        self.spills += 1
+        self._reset()
+
+    def iter_results(self):
+        """Finished groups, one frame per spill partition (or one frame when nothing spilled)"""
+        if self.spills == 0:
+            yield self.state_frame()
+            return
+        self.spill()
+        try:
+            for part in sorted(os.listdir(self._spill_root)):
+                part_dir = os.path.join(self._spill_root, part)
+                frame = pd.concat([pd.read_parquet(os.path.join(part_dir, f)) for f in sorted(os.listdir(part_dir))], ignore_index=True)
+                yield frame.groupby(self.by, sort=False, as_index=False).sum()
+        finally:
+            shutil.rmtree(self._spill_root, ignore_errors=True)
+            self._spill_root = None
+
+    def result(self):
+        frames = list(self.iter_results())
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=self.by + self.sums + [ROWS_COLUMN])
+
+
+def aggregate_store(store, var, by, sums=None, start=None, end=None, memory_cap_mb=MEMORY_CAP_MB,
+                    batch_rows=BATCH_ROWS, output_path=None):
+    """
+    Group-by sums over one variable of the merged store in bounded memory
+
+    Args:
+        store: SMLogMergeStore
+        var: Variable (e.g. '키워드')
+        by: Group columns (e.g. ['media', 'keyword'] or ['date', 'media'])
+        sums: Summed columns (default: SUM_COLUMNS, clicks / conversions / revenue)
+        start, end: Optional inclusive date filter (YYYY-MM-DD)
+        memory_cap_mb: Aggregation state cap before spilling
+        batch_rows: Rows per streamed batch
+        output_path: Write the result here (Parquet, one row group per spill partition) and return None
+
+    Returns:
+        DataFrame: by + sums + rows (or None when output_path is given)
+    """
+    sums = list(sums or SUM_COLUMNS)
+    columns = list(dict.fromkeys(list(by) + sums + (['date'] if start or end else [])))
+    aggregator = ChunkedAggregator(by, sums, memory_cap_mb)
+    batches = 0
+    for batch in store.iter_batches(var, columns=columns, batch_rows=batch_rows):
+        if start:
+            batch = batch[batch['date'] >= pd.Timestamp(start)]
+        if end:
+            batch = batch[batch['date'] <= pd.Timestamp(end)]
+        aggregator.update(batch)
+        batches += 1
+    logger.info(f"  ✓ [{var}] Aggregated {batches} batches by {', '.join(by)} ({aggregator.spills} spills)")
+
+    if output_path is None:
+        return aggregator.result()
+
+    writer = None
+    try:
+        for frame in aggregator.iter_results():
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path + '.tmp', table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is not None:
+        os.replace(output_path + '.tmp', output_path)
+        logger.info(f"  ✓ [{var}] Wrote {output_path}")
+    return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Out-of-core group-by sums over the merged SMLOG store')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='smlog_data directory (or a per-business partition)')
+    parser.add_argument('--var', required=True, help="Variable to aggregate (e.g. '키워드')")
+    parser.add_argument('--by', nargs='+', required=True, help='Group columns')
+    parser.add_argument('--sum', nargs='+', default=None, help='Summed columns (default: clicks, conversions, revenue)')
+    parser.add_argument('--start', default=None, help='First date (YYYY-MM-DD)')
+    parser.add_argument('--end', default=None, help='Last date (YYYY-MM-DD)')
+    parser.add_argument('--memory-cap-mb', type=int, default=MEMORY_CAP_MB, help='Aggregation state cap before spilling')
+    parser.add_argument('--output', required=True, help='Output Parquet path')
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.data_dir, '_logs', 'aggregate.jsonl'))
+    aggregate_store(SMLogMergeStore(args.data_dir), args.var, args.by, args.sum, args.start, args.end,
+                    args.memory_cap_mb, output_path=args.output)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+SMLOG API Client
+Captures the XHR/fetch request that fills the statistics tables after the search
+button is clicked, turns it into a date-parameterised template, and replays it
+directly with the browser session cookies (concurrently, under a rate limit).
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from urllib.parse import quote, quote_plus
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.rate_limiter import get_rate_limiter
+from modules.run_log import get_logger
+from modules.business_catalog import load_business_catalog, DEFAULT_CATALOG_PATH
+
+
+logger = get_logger(__name__)
+
+# Winning selectors for SMLOG pages are cached next to the scraped data
+SELECTOR_CACHE_PATH = os.path.join('smlog_data', '_cache', 'selectors.json')
+
+# Prometheus text-format run metrics (one file per scraper script)
+METRICS_DIR = os.path.join('smlog_data', '_metrics')
+
+# Candidates for the page tabs (네트워크, 키워드, 전환, ...), checked in one evaluate
+PAGE_TAB_SELECTORS = ('div.page-tab', '.page-tab', "[class*='page-tab']")
+
+
+# Date formats SMLOG uses in query strings / form bodies
+DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y%m%d')
+
+# Requests that never carry table data
+IGNORED_URL_KEYWORDS = ('google', 'analytics', 'gtag', 'facebook', 'doubleclick', '.js', '.css', '.png', '.jpg', '.svg', '.woff')
+
+
+@dataclass
+class CapturedRequest:
+    method: str
+    url: str
+    post_data: str
+    headers: dict
+    status: int = None
+    content_type: str = ''
+    body: str = ''
+
+
+@dataclass
+class SMLogEndpoint:
+    """Date-parameterised request template for one (page, button) table"""
+    method: str
+    url_template: str
+    body_template: str
+    headers: dict
+    date_formats: list = field(default_factory=list)
+    response_kind: str = 'json'
+
+    @staticmethod
+    def _placeholder(index):
+        return f"__SMLOG_DATE_{index}__"
+
+    @classmethod
+    def from_capture(cls, captured, target_date):
+        """Build a template by replacing every encoding of target_date with a placeholder"""
+        url = captured.url
+        body = captured.post_data or ''
+        formats = []
+
+        for fmt in DATE_FORMATS:
+            raw = target_date.strftime(fmt)
+            variants = {raw, quote(raw, safe=''), quote_plus(raw)}
+            placeholder = cls._placeholder(len(formats))
+            found = False
+            for variant in variants:
+                if variant in url or variant in body:
+                    url = url.replace(variant, placeholder)
+                    body = body.replace(variant, placeholder)
+                    found = True
+            if found:
+                formats.append(fmt)
+
+        if not formats:
+            return None
+
+        headers = {
+            k: v for k, v in (captured.headers or {}).items()
+            if k.lower() in ('content-type', 'x-requested-with', 'accept', 'referer')
+        }
+        kind = 'json' if 'json' in (captured.content_type or '') else 'html'
+        return cls(captured.method, url, body, headers, formats, kind)
+
+    def build(self, target_date):
+        """Return (url, body) for the given date"""
+        url = self.url_template
+        body = self.body_template
+        for i, fmt in enumerate(self.date_formats):
+            placeholder = self._placeholder(i)
+            value = target_date.strftime(fmt)
+            url = url.replace(placeholder, quote(value, safe=''))
+            # form bodies were captured already encoded, JSON bodies were not
+            encoded = value if body.lstrip().startswith('{') else quote_plus(value)
+            body = body.replace(placeholder, encoded)
+        return url, body
+
+
+class SMLogNetworkCapture:
+    """Record XHR/fetch traffic on a page while the UI search runs"""
+
+    def __init__(self):
+        self.requests = []
+        self._page = None
+
+    async def _handle_response(self, response):
+        request = response.request
+        if request.resource_type not in ('xhr', 'fetch'):
+            return
+        url = request.url
+        if any(keyword in url.lower() for keyword in IGNORED_URL_KEYWORDS):
+            return
+        try:
+            body = await response.text()
+        except Exception:
+            body = ''
+        self.requests.append(CapturedRequest(
+            method=request.method,
+            url=url,
+            post_data=request.post_data or '',
+            headers=dict(request.headers),
+            status=response.status,
+            content_type=response.headers.get('content-type', ''),
+            body=body,
+        ))
+
+    def attach(self, page):
+        self._page = page
+        page.on("response", self._handle_response)
+
+    def detach(self):
+        if self._page is not None:
+            self._page.remove_listener("response", self._handle_response)
+            self._page = None
+
+    def clear(self):
+        self.requests = []
+
+    def identify_data_endpoint(self, target_date, expected_rows=None):
+        """Pick the captured request that carries the table for target_date"""
+        logger.info(f"\n[API] Identifying data endpoint among {len(self.requests)} captured requests...")
+
+        best = None
+        best_score = -1
+        for captured in self.requests:
+            if captured.status and captured.status >= 400:
+                continue
+            endpoint = SMLogEndpoint.from_capture(captured, target_date)
+            if endpoint is None:
+                continue
+            df = parse_payload(captured.body, endpoint.response_kind)
+            rows = len(df) if df is not None else 0
+            score = rows
+            if expected_rows is not None and rows == expected_rows:
+                score += 1_000_000
+            logger.debug("    %s %s → %s rows", captured.method, captured.url[:80], rows)
+            if score > best_score:
+                best_score = score
+                best = endpoint
+
+        if best is None:
+            logger.error("  ✗ No date-parameterised data request found")
+        else:
+            logger.info(f"  ✓ Data endpoint: {best.method} {best.url_template[:80]}")
+            logger.info(f"    Date formats: {best.date_formats}, response: {best.response_kind}")
+        return best
+
+
+def _largest_row_list(obj):
+    """Find the largest list of dicts/lists anywhere in a JSON document"""
+    best = None
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            if current and all(isinstance(item, (dict, list)) for item in current):
+                if best is None or len(current) > len(best):
+                    best = current
+            stack.extend(item for item in current if isinstance(item, (dict, list)))
+        elif isinstance(current, dict):
+            stack.extend(v for v in current.values() if isinstance(v, (dict, list)))
+    return best
+
+
+def _html_fragments(obj):
+    """Yield string values that look like table markup"""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            if '<tr' in current or '<table' in current:
+                yield current
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def parse_table_html(html):
+    """Parse the first data table in an HTML document/fragment (same rules as extract_table_data)"""
+    if '<table' not in html:
+        html = f"<table><tbody>{html}</tbody></table>"
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table')
+    if not table:
+        return None
+
+    headers = []
+    thead = table.find('thead')
+    if thead:
+        headers = [th.get_text(strip=True) for th in thead.find_all('th')]
+
+    rows = []
+    for tr in table.find_all('tr'):
+        if tr.find('th'):
+            continue
+        row_data = [td.get_text(strip=True) for td in tr.find_all('td')]
+        if row_data and any(cell.strip() for cell in row_data):
+            rows.append(row_data)
+
+    if not rows:
+        return None
+    max_cols = max(len(row) for row in rows)
+    if headers and len(headers) == max_cols:
+        return pd.DataFrame(rows, columns=headers)
+    column_names = (headers + [f'Column_{i}' for i in range(len(headers), max_cols)])[:max_cols]
+    return pd.DataFrame(rows, columns=column_names)
+
+
+def parse_payload(body, response_kind='json'):
+    """Turn a captured/replayed response body into a DataFrame of table rows"""
+    if not body:
+        return None
+    if response_kind == 'json':
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return parse_table_html(body)
+        rows = _largest_row_list(data)
+        if rows:
+            if isinstance(rows[0], dict):
+                return pd.DataFrame(rows)
+            return pd.DataFrame(rows, columns=[f'Column_{i}' for i in range(max(len(r) for r in rows))])
+        for fragment in _html_fragments(data):
+            df = parse_table_html(fragment)
+            if df is not None:
+                return df
+        return None
+    return parse_table_html(body)
+
+
+def _cell_key(value):
+    """Normalise a cell for comparison between API payloads and UI text ("1,234" == 1234, "" == None)"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    text = str(value).strip().replace(',', '')
+    try:
+        return repr(float(text.rstrip('%')))
+    except ValueError:
+        return text
+
+
+def column_mapping(api_df, ui_df):
+    """
+    Map API fields to UI table headers by comparing the cell values of the same date
+
+    JSON keys / Column_i never equal the Korean UI headers, so each UI column is paired with
+    the one API column whose values match it row by row. Build this once from the first date
+    (rendered through the UI) and apply it to every replayed date with align_columns.
+
+    Returns:
+        dict: {api_field: ui_header} in UI column order
+
+    Raises:
+        ValueError: widths/row counts differ, or a UI column has no (or more than one) matching API column
+    """
+    if api_df is None or ui_df is None:
+        raise ValueError("API and UI tables are both required to map columns")
+    if api_df.shape != ui_df.shape:
+        raise ValueError(f"API table shape {api_df.shape} does not match UI table shape {ui_df.shape}")
+
+    api_keys = {field: [_cell_key(v) for v in api_df[field].tolist()] for field in api_df.columns}
+    mapping = {}
+    for position, header in enumerate(ui_df.columns):
+        ui_keys = [_cell_key(v) for v in ui_df.iloc[:, position].tolist()]
+        candidates = [field for field, keys in api_keys.items() if keys == ui_keys and field not in mapping]
+        if len(candidates) != 1:
+            found = 'no' if not candidates else f"{len(candidates)} ambiguous"
+            raise ValueError(f"UI column '{header}' has {found} matching API field(s)")
+        mapping[candidates[0]] = header
+    return mapping
+
+
+def align_columns(df, mapping):
+    """
+    Rename API fields to UI headers and order them as the UI table (mapping from column_mapping)
+
+    Raises:
+        ValueError: the API table has fields that are not in the mapping (or lacks mapped fields)
+    """
+    if df is None:
+        return df
+    unknown = [c for c in df.columns if c not in mapping]
+    missing = [c for c in mapping if c not in df.columns]
+    if unknown or missing:
+        raise ValueError(f"API fields do not match the column mapping (unknown: {unknown}, missing: {missing})")
+    return df[list(mapping)].rename(columns=mapping)
+
+
+class SMLogApiClient:
+    """Replay an SMLogEndpoint for many dates with the browser session cookies"""
+
+    def __init__(self, context, endpoint, concurrency=4, timeout=30000, rate_limiter=None):
+        self.request = context.request
+        self.endpoint = endpoint
+        self.concurrency = concurrency
+        self.timeout = timeout
+        # Pacing is per host and adapts to latency/429/5xx; the semaphore only caps in-flight requests
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_date(self, target_date):
+        """Fetch and parse the table for one date"""
+        url, body = self.endpoint.build(target_date)
+        async with self._semaphore:
+            response = await self.rate_limiter.fetch(
+                self.request,
+                url,
+                method=self.endpoint.method,
+                headers=self.endpoint.headers,
+                data=body if self.endpoint.method.upper() != 'GET' and body else None,
+                timeout=self.timeout,
+            )
+            if not response.ok:
+                raise RuntimeError(f"HTTP {response.status} for {target_date.strftime('%Y-%m-%d')}")
+            text = await response.text()
+        return parse_payload(text, self.endpoint.response_kind)
+
+    async def fetch_dates(self, dates):
+        """Fetch many dates concurrently. Returns {date_str: DataFrame | None | Exception}"""
+        logger.info(f"\n[API] Fetching {len(dates)} dates (concurrency={self.concurrency}, adaptive per-host rate limit)...")
+
+        async def fetch_one(target_date):
+            try:
+                return await self.fetch_date(target_date)
+            except Exception as e:
+                return e
+
+        results = await asyncio.gather(*(fetch_one(d) for d in dates))
+        return {d.strftime('%Y-%m-%d'): r for d, r in zip(dates, results)}
+
+
+def load_smlog_businesses(default_svid, catalog_path=None):
+    """
+    Read (business key, svid) pairs from the shared business catalog
+    (parsed by modules.business_catalog). Falls back to [("default", default_svid)].
+    """
+    catalog_path = catalog_path or DEFAULT_CATALOG_PATH
+    if not os.path.exists(catalog_path):
+        return [("default", default_svid)]
+    businesses = [(b.key, b.smlog_svid) for b in load_business_catalog(catalog_path) if b.smlog_svid]
+    return businesses or [("default", default_svid)]
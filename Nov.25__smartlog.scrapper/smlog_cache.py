@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Arrow Load Cache
+Converts analysis inputs (kwd.csv, {var}_merged.csv, merged SMLOG stores) into an
+uncompressed Arrow IPC (Feather v2) file once; later loads memory-map it instead of re-parsing
+
+- Key: source path + read options; validity: source signature (mtime_ns, size) + content hash
+- Signature unchanged -> cache used without touching the source
+- Signature changed but same content hash (copied / touched file) -> cache kept, signature refreshed
+- Files are memory-mapped: numeric columns are zero-copy and kernels share the OS page cache
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.run_log import get_logger
+
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+CACHE_DIRNAME = '_arrow'
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def content_hash(paths):
+    """blake2b over the bytes of the given files (read in chunks)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _replace_via_temp(path, write):
+    """Write through a unique temp file in the target directory, then swap it in (safe across kernels)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _options_key(options):
+    return json.dumps(options, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class ArrowCache:
+    """One cached table: {name}.arrow + {name}.json (sources, signatures, hash, read options)"""
+
+    def __init__(self, cache_dir, name):
+        self.arrow_path = os.path.join(cache_dir, f"{name}.arrow")
+        self.meta_path = os.path.join(cache_dir, f"{name}.json")
+
+    def _read_meta(self):
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.arrow_path)):
+            return None
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == CACHE_VERSION else None
+
+    def _write_meta(self, meta):
+        def write(tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        _replace_via_temp(self.meta_path, write)
+
+    def is_valid(self, sources, options):
+        """True when the cache matches the sources (hash only computed when a signature moved)"""
+        meta = self._read_meta()
+        if meta is None or meta['options'] != _options_key(options) or meta['sources'] != list(sources):
+            return False
+        signatures = [file_signature(p) for p in sources]
+        if meta['signatures'] == signatures:
+            return True
+        if meta['hash'] != content_hash(sources):
+            return False
+        meta['signatures'] = signatures
+        self._write_meta(meta)
+        return True
+
+    def write(self, df, sources, options):
+        os.makedirs(os.path.dirname(self.arrow_path), exist_ok=True)
+        # Uncompressed so the file can be memory-mapped without decoding
+        _replace_via_temp(self.arrow_path, lambda tmp_path: feather.write_feather(df, tmp_path, compression='uncompressed'))
+        self._write_meta({
+            'version': CACHE_VERSION,
+            'sources': list(sources),
+            'signatures': [file_signature(p) for p in sources],
+            'hash': content_hash(sources),
+            'options': _options_key(options),
+        })
+
+    def read(self, columns=None, as_table=False):
+        table = feather.read_table(self.arrow_path, columns=columns, memory_map=True)
+        if as_table:
+            return table
+        # split_blocks: one block per column so numeric columns stay views over the mapped file
+        return table.to_pandas(split_blocks=True, self_destruct=False)
+
+    def load(self, sources, options, build, columns=None, as_table=False):
+        if not self.is_valid(sources, options):
+            df = build()
+            self.write(df, sources, options)
+            logger.info(f"  ✓ [Cache] Built {self.arrow_path} ({len(df)} rows)")
+        return self.read(columns, as_table)
+
+
+def load_csv(path, cache_dir=None, columns=None, as_table=False, **read_csv_kwargs):
+    """
+    pd.read_csv replacement backed by an Arrow cache
+
+    Args:
+        path: Source CSV
+        cache_dir: Default: {source dir}/_arrow
+        columns: Only map these columns out of the cache
+        as_table: Return the memory-mapped pyarrow.Table instead of a DataFrame
+        **read_csv_kwargs: Passed to pd.read_csv on a cache miss (part of the cache key)
+
+    Returns:
+        DataFrame (or pyarrow.Table)
+    """
+    path = os.path.abspath(path)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(path), CACHE_DIRNAME)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    options_hash = hashlib.blake2b(_options_key(read_csv_kwargs).encode('utf-8'), digest_size=4).hexdigest()
+    cache = ArrowCache(cache_dir, f"{stem}-{options_hash}")
+    return cache.load([path], read_csv_kwargs, lambda: pd.read_csv(path, **read_csv_kwargs), columns, as_table)
+
+
+def load_merged(store, var, columns=None, as_table=False):
+    """SMLogMergeStore.load(var) backed by one Arrow file (rebuilt when any Parquet part changes)"""
+    parts = [os.path.abspath(p) for p in store.part_paths(var)]
+    if not parts:
+        return pd.DataFrame()
+    cache = ArrowCache(os.path.join(store.store_dir, CACHE_DIRNAME), var)
+    return cache.load(parts, {'var': var}, lambda: store.load(var), columns, as_table)
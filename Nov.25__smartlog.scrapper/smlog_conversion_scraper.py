@@ -4,18 +4,33 @@ SMLOG Conversion Summary Scraper
 Extracts data from conversion summary page (유입유형)
 Sets date range from start_date to end_date, iterates day by day
 Exports data as CSV/Excel files with date range in filename
+API mode: captures the table request once and replays it for every date
 """
 
+import argparse
 import asyncio
+import time
 import pandas as pd
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
 import os
 
+from smlog_api_client import SMLogNetworkCapture, SMLogApiClient, column_mapping, align_columns, load_smlog_businesses, SELECTOR_CACHE_PATH, PAGE_TAB_SELECTORS, METRICS_DIR
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.rate_limiter import get_rate_limiter
+from modules.selector_resolver import get_selector_resolver
+from modules.run_log import get_logger, configure_logging, task_context
+from modules.run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
+
 
 class SMLogConversionScraper:
-    def __init__(self, username, password, svid="33138", start_date=None, end_date=None, days_limit=None):
+    def __init__(self, username, password, svid="33138", start_date=None, end_date=None, days_limit=None, api_mode=False, api_concurrency=4, output_dir="smlog_data"):
         self.username = username
         self.password = password
         self.svid = svid
@@ -35,36 +50,66 @@ class SMLogConversionScraper:
         # Limit number of days to scrape (default: None = all days)
         self.days_limit = days_limit
 
+        # API mode: replay the captured table request instead of re-scraping the DOM per date
+        self.api_mode = api_mode
+        self.api_concurrency = api_concurrency
+
+        # Output root (per-business partition when several svids are scraped)
+        self.output_dir = output_dir
+
+        # Rows / bytes / per-date task status (shared process-wide registry)
+        self.metrics = get_metrics()
+
+        # Shared per-host rate limiter (paces navigations, date searches and API replays)
+        self.rate_limiter = get_rate_limiter()
+
+        # Page-tab lookup resolves all candidates in one round trip (winner cached on disk)
+        self.selector_resolver = get_selector_resolver(SELECTOR_CACHE_PATH)
+
+    def get_date_list(self):
+        """Dates to process (start_date to end_date, capped by days_limit and today)"""
+        end_date = self.end_date
+        if self.days_limit:
+            end_date = min(end_date, self.start_date + timedelta(days=self.days_limit - 1))
+        end_date = min(end_date, datetime.now())
+
+        dates = []
+        current_date = self.start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+        return dates
+
     async def login_and_navigate(self, page):
         """Complete login and navigation flow"""
-        print("\n[Navigation] Starting login and navigation flow...")
+        logger.info("\n[Navigation] Starting login and navigation flow...")
 
         # Step 1: Login page
-        print("  [1/5] Navigating to login page...")
-        await page.goto(self.login_url, wait_until="networkidle")
+        logger.info("  [1/5] Navigating to login page...")
+        await self.rate_limiter.goto(page, self.login_url, wait_until="networkidle")
         await asyncio.sleep(1)
 
         # Step 2: Enter credentials
-        print("  [2/5] Entering credentials...")
+        logger.info("  [2/5] Entering credentials...")
         await page.fill('#id', self.username)
         await page.fill('input[type="password"]', self.password)
 
         # Step 3: Click login button
-        print("  [3/5] Clicking login button...")
+        logger.info("  [3/5] Clicking login button...")
         login_button = await page.query_selector('.login-button-01')
         if login_button:
             await login_button.click()
             await asyncio.sleep(3)
 
         # Step 4: Click HMIS button
-        print("  [4/5] Clicking HMIS button...")
+        logger.info("  [4/5] Clicking HMIS button...")
         hmis_button = await page.query_selector('.hmis')
         if hmis_button:
             await hmis_button.click()
             await asyncio.sleep(3)
 
         # Step 5: Click service domain link
-        print("  [5/5] Clicking service domain link...")
+        logger.info("  [5/5] Clicking service domain link...")
         service_links = await page.query_selector_all('.service-domain-url')
         for link in service_links:
             href = await link.get_attribute('href')
@@ -74,43 +119,38 @@ class SMLogConversionScraper:
                 break
 
         # Navigate to conversion summary page
-        await page.goto(self.conversion_url, wait_until="domcontentloaded")
+        await self.rate_limiter.goto(page, self.conversion_url, wait_until="domcontentloaded")
         await asyncio.sleep(2)
 
-        print("✓ Navigation completed successfully")
+        logger.info("✓ Navigation completed successfully")
         return True
 
     async def find_and_click_button(self, page, button_text):
         """Find and click a button by text (class = page-tab)"""
-        print(f"\n[Button] Looking for button: {button_text}")
+        logger.info(f"\n[Button] Looking for button: {button_text}")
 
         try:
-            # Find the page-tab element
-            tabs = await page.query_selector_all('div.page-tab')
-            print(f"  Found {len(tabs)} page tabs")
-
-            for tab in tabs:
-                text = await tab.inner_text()
-                print(f"    Tab text: '{text}'")
-                if text == button_text or button_text in text:
-                    print(f"  ✓ Found matching tab: '{text}'")
-                    await tab.click()
-                    await asyncio.sleep(3)
-                    print(f"  ✓ Button clicked")
-                    return True
-
-            print(f"  ✗ Button not found in {len(tabs)} tabs")
-            return False
+            # Check every page-tab candidate for the text in a single evaluate
+            match = await self.selector_resolver.resolve(
+                page, 'smlog_conversion', 'page_tab', PAGE_TAB_SELECTORS, text=button_text
+            )
+            if match is None:
+                logger.error(f"  ✗ Button not found (candidates: {', '.join(PAGE_TAB_SELECTORS)})")
+                return False
+
+            logger.info(f"  ✓ Found matching tab: '{match.text}' via {match.selector}")
+            await match.locator(page).click()
+            await asyncio.sleep(3)
+            logger.info(f"  ✓ Button clicked")
+            return True
 
         except Exception as e:
-            print(f"  ✗ Error finding button: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error finding button: {e}", exc_info=True)
             return False
 
     async def set_date(self, page, target_date):
         """Set date using form-control input fields with robust UI interaction"""
-        print(f"\n[Date] Setting date to {target_date.strftime('%Y-%m-%d')}")
+        logger.info(f"\n[Date] Setting date to {target_date.strftime('%Y-%m-%d')}")
 
         try:
             # Format date as YYYY-MM-DD
@@ -124,7 +164,7 @@ class SMLogConversionScraper:
             except Exception:
                 date_inputs = await page.query_selector_all('input.form-control[type="date"], input.form-control[type="text"]')
             
-            print(f"  Found {len(date_inputs)} form-control inputs")
+            logger.info(f"  Found {len(date_inputs)} form-control inputs")
 
             if len(date_inputs) >= 2:
                 # Set start date (first input) with robust interaction
@@ -150,7 +190,7 @@ class SMLogConversionScraper:
                 
                 # Type the new date
                 await start_input.type(date_str, delay=40)
-                print(f"  Set start date: {date_str}")
+                logger.info(f"  Set start date: {date_str}")
                 await asyncio.sleep(0.5)
 
                 # Set end date (second input) - same date for single day
@@ -176,7 +216,7 @@ class SMLogConversionScraper:
                 
                 # Type the new date
                 await end_input.type(date_str, delay=40)
-                print(f"  Set end date: {date_str}")
+                logger.info(f"  Set end date: {date_str}")
                 await asyncio.sleep(0.5)
 
                 # Blur the input to ensure changes are registered
@@ -203,18 +243,18 @@ class SMLogConversionScraper:
                         candidate = await page.wait_for_selector(selector, timeout=2000)
                         if candidate and await candidate.is_visible():
                             apply_button = candidate
-                            print(f"  Found apply button with selector: {selector}")
+                            logger.debug("  Found apply button with selector: %s", selector)
                             break
                     except Exception:
                         continue
 
                 if apply_button:
-                    print("  Clicking apply button...")
+                    logger.info("  Clicking apply button...")
                     await apply_button.click()
                     await asyncio.sleep(1.5)
-                    print("  ✓ Apply button clicked")
+                    logger.info("  ✓ Apply button clicked")
                 else:
-                    print("  ℹ Apply button not visible; continuing")
+                    logger.info("  ℹ Apply button not visible; continuing")
 
                 # Step 2: Click search button with multiple selector attempts
                 search_button = None
@@ -232,18 +272,18 @@ class SMLogConversionScraper:
                         candidate = await page.wait_for_selector(selector, timeout=3000)
                         if candidate:
                             search_button = candidate
-                            print(f"  Found search button with selector: {selector}")
+                            logger.debug("  Found search button with selector: %s", selector)
                             break
                     except Exception:
                         continue
 
                 if search_button:
-                    print("  Clicking search button...")
+                    logger.info("  Clicking search button...")
                     await search_button.click()
                     await asyncio.sleep(2)
-                    print("  ✓ Search button clicked")
+                    logger.info("  ✓ Search button clicked")
                 else:
-                    print("  ⚠ Search button not found; data may not refresh")
+                    logger.warning("  ⚠ Search button not found; data may not refresh")
 
                 # Verify the input reflects our target date (retry up to 3 times)
                 date_set_correctly = False
@@ -251,9 +291,9 @@ class SMLogConversionScraper:
                     try:
                         start_value = await start_input.input_value()
                         end_value = await end_input.input_value()
-                        print(f"  Verification attempt {verify_attempt + 1}: start={start_value}, end={end_value}")
+                        logger.debug("  Verification attempt %s: start=%s, end=%s", verify_attempt + 1, start_value, end_value)
                         if start_value.strip() == date_str and end_value.strip() == date_str:
-                            print("  ✓ Date confirmed on inputs")
+                            logger.info("  ✓ Date confirmed on inputs")
                             date_set_correctly = True
                             break
                     except Exception:
@@ -261,7 +301,7 @@ class SMLogConversionScraper:
 
                     # Retry by re-entering the date
                     if verify_attempt < 2:
-                        print("  ⚠ Date mismatch, re-entering value")
+                        logger.warning("  ⚠ Date mismatch, re-entering value")
                         await start_input.click()
                         for shortcut in ['Meta+A', 'Control+A']:
                             try:
@@ -302,9 +342,9 @@ class SMLogConversionScraper:
                             await asyncio.sleep(2)
 
                 if not date_set_correctly:
-                    print(f"  ⚠ Unable to confirm date value (expected {date_str})")
+                    logger.warning(f"  ⚠ Unable to confirm date value (expected {date_str})")
 
-                print(f"  ✓ Date set and buttons clicked")
+                logger.info(f"  ✓ Date set and buttons clicked")
                 return True
             elif len(date_inputs) == 1:
                 # Single date input with robust interaction
@@ -330,7 +370,7 @@ class SMLogConversionScraper:
                 
                 # Type the new date
                 await single_input.type(date_str, delay=40)
-                print(f"  Set date: {date_str}")
+                logger.info(f"  Set date: {date_str}")
                 await asyncio.sleep(0.5)
 
                 # Blur the input
@@ -384,24 +424,23 @@ class SMLogConversionScraper:
                 if search_button:
                     await search_button.click()
                     await asyncio.sleep(2)
-                    print(f"  ✓ Date set and buttons clicked")
+                    logger.info(f"  ✓ Date set and buttons clicked")
                 else:
-                    print(f"  ⚠ Search button not found")
+                    logger.warning(f"  ⚠ Search button not found")
                 
                 return True
             else:
-                print(f"  ✗ Date input fields not found")
+                logger.error(f"  ✗ Date input fields not found")
                 return False
 
         except Exception as e:
-            print(f"  Error setting date: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.info(f"  Error setting date: {e}")
+            logger.debug("Traceback", exc_info=True)
             return False
 
     async def extract_table_data(self, page):
         """Extract table data from table with specific classes"""
-        print(f"\n[Table] Extracting table data...")
+        logger.info(f"\n[Table] Extracting table data...")
 
         try:
             await asyncio.sleep(2)  # Wait for page to load
@@ -427,10 +466,10 @@ class SMLogConversionScraper:
                     if not table:
                         # Try any table
                         table = soup.find('table')
-                        print(f"  Using fallback table selector")
+                        logger.info(f"  Using fallback table selector")
 
             if not table:
-                print(f"  ✗ No table found")
+                logger.error(f"  ✗ No table found")
                 return None
 
             # Extract headers
@@ -450,13 +489,13 @@ class SMLogConversionScraper:
                     if row_data:
                         rows.append(row_data)
 
-            print(f"  ✓ Extracted {len(rows)} rows with {len(headers)} headers")
+            logger.info(f"  ✓ Extracted {len(rows)} rows with {len(headers)} headers")
 
             # Create DataFrame
             if rows:
                 # If headers don't match column count, generate column names
                 if headers and len(headers) != len(rows[0]) if rows else 0:
-                    print(f"    Note: Header/column mismatch ({len(headers)} vs {len(rows[0]) if rows else 0}), using auto-generated column names")
+                    logger.info(f"    Note: Header/column mismatch ({len(headers)} vs {len(rows[0]) if rows else 0}), using auto-generated column names")
                     max_cols = max(len(row) for row in rows) if rows else 0
                     if headers and len(headers) > 0:
                         column_names = headers + [f'Column_{i}' for i in range(len(headers), max_cols)]
@@ -471,16 +510,14 @@ class SMLogConversionScraper:
             return None
 
         except Exception as e:
-            print(f"  ✗ Error extracting table: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting table: {e}", exc_info=True)
             return None
 
     async def process_all_dates(self, page, output_dir="smlog_data"):
         """Process data for all dates - saves individual CSV per date in category folder"""
-        print(f"\n" + "=" * 70)
-        print(f"PROCESSING: {self.button_text}")
-        print("=" * 70)
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"PROCESSING: {self.button_text}")
+        logger.info("=" * 70)
 
         # Create output directory with button name subdirectory
         button_name = self.button_text.replace('(', '').replace(')', '').replace(' ', '_')
@@ -489,7 +526,7 @@ class SMLogConversionScraper:
 
         # Click the button
         if not await self.find_and_click_button(page, self.button_text):
-            print(f"✗ Could not click button: {self.button_text}")
+            logger.error(f"✗ Could not click button: {self.button_text}")
             return False
 
         current_date = self.start_date
@@ -509,10 +546,14 @@ class SMLogConversionScraper:
         # Iterate through dates
         while current_date <= end_date:
             date_str = current_date.strftime('%Y-%m-%d')
-            print(f"\n[{date_str}] Processing date...")
-
-            # Set date
-            if await self.set_date(page, current_date):
+            logger.info(f"\n[{date_str}] Processing date...")
+
+            # Each date search hits smlog.co.kr once: pace it through the shared limiter
+            await self.rate_limiter.acquire(self.base_url)
+            started = time.monotonic()
+            date_set = await self.set_date(page, current_date)
+            self.rate_limiter.record(self.base_url, time.monotonic() - started)
+            if date_set:
                 # Extract data
                 df = await self.extract_table_data(page)
 
@@ -523,41 +564,135 @@ class SMLogConversionScraper:
                     # Save individual CSV file for this date
                     csv_filename = os.path.join(button_output_dir, f"{date_str}_{button_name}.csv")
                     df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-                    print(f"  ✓ CSV saved: {csv_filename} ({len(df)} rows)")
+                    self.record_date(f"smlog_{button_name}", "done", csv_filename, len(df))
+                    logger.info(f"  ✓ CSV saved: {csv_filename} ({len(df)} rows)")
                     success_count += 1
                 else:
-                    print(f"  ℹ No data for {date_str}")
+                    logger.info(f"  ℹ No data for {date_str}")
+                    self.record_date(f"smlog_{button_name}", "empty")
                     failed_dates.append(date_str)
             else:
-                print(f"  ✗ Could not set date for {date_str}")
+                logger.error(f"  ✗ Could not set date for {date_str}")
+                self.record_date(f"smlog_{button_name}", "failed")
                 failed_dates.append(date_str)
 
             # Move to next date
             current_date += timedelta(days=1)
 
-            # Minimal delay between date requests
-            await asyncio.sleep(0.5)
 
-        # Summary
-        print(f"\n" + "=" * 70)
-        print(f"SUMMARY for {self.button_text}")
-        print("=" * 70)
-        print(f"  ✓ Successfully saved: {success_count} dates")
+        self.print_summary(success_count, failed_dates)
+        return success_count > 0
+
+    def record_date(self, module, status, csv_filename=None, rows=None):
+        """Count one per-date result (done / empty / failed) and the CSV it produced"""
+        self.metrics.tasks.inc(module=module, status=status)
+        if csv_filename:
+            self.metrics.record_output(module, csv_filename, rows=rows)
+
+    def print_summary(self, success_count, failed_dates):
+        """Print success/failure summary"""
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"SUMMARY for {self.button_text}")
+        logger.info("=" * 70)
+        logger.info(f"  ✓ Successfully saved: {success_count} dates")
         if failed_dates:
-            print(f"  ✗ Failed dates: {len(failed_dates)}")
+            logger.error(f"  ✗ Failed dates: {len(failed_dates)}")
             if len(failed_dates) <= 10:
-                print(f"    {', '.join(failed_dates)}")
+                logger.info(f"    {', '.join(failed_dates)}")
             else:
-                print(f"    {', '.join(failed_dates[:10])} ... and {len(failed_dates) - 10} more")
-        print("=" * 70)
+                logger.info(f"    {', '.join(failed_dates[:10])} ... and {len(failed_dates) - 10} more")
+        logger.info("=" * 70)
+
+    async def process_all_dates_api(self, page, output_dir="smlog_data"):
+        """API mode: run the UI search once with network capture, then replay the data request for all dates"""
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"PROCESSING (API mode): {self.button_text}")
+        logger.info("=" * 70)
 
+        button_name = self.button_text.replace('(', '').replace(')', '').replace(' ', '_')
+        button_output_dir = os.path.join(output_dir, button_name)
+        os.makedirs(button_output_dir, exist_ok=True)
+
+        if not await self.find_and_click_button(page, self.button_text):
+            logger.error(f"✗ Could not click button: {self.button_text}")
+            return False
+
+        dates = self.get_date_list()
+        if not dates:
+            logger.info("  ℹ No dates to process")
+            return False
+
+        # 1) Run the first date through the UI while capturing XHR/fetch traffic
+        first_date = dates[0]
+        capture = SMLogNetworkCapture()
+        capture.attach(page)
+        try:
+            ui_df = None
+            if await self.set_date(page, first_date):
+                ui_df = await self.extract_table_data(page)
+        finally:
+            capture.detach()
+
+        if ui_df is None:
+            logger.warning("  ⚠ No UI table for the first date to map API columns, falling back to UI mode")
+            return await self.process_all_dates(page, output_dir)
+
+        endpoint = capture.identify_data_endpoint(first_date, expected_rows=len(ui_df))
+        if endpoint is None:
+            logger.warning(f"  ⚠ Data endpoint not identified, falling back to UI mode")
+            return await self.process_all_dates(page, output_dir)
+
+        # 2) Replay the request for every date with the session cookies
+        client = SMLogApiClient(page.context, endpoint, concurrency=self.api_concurrency)
+        results = await client.fetch_dates(dates)
+
+        # Map API fields to UI headers once, from the first date the UI rendered
+        first_str = first_date.strftime('%Y-%m-%d')
+        first_api = results.get(first_str)
+        if not isinstance(first_api, pd.DataFrame):
+            logger.warning(f"  ⚠ API replay failed for {first_str}, falling back to UI mode")
+            return await self.process_all_dates(page, output_dir)
+        try:
+            mapping = column_mapping(first_api, ui_df)
+        except ValueError as e:
+            logger.warning(f"  ⚠ API columns could not be mapped to the UI table ({e}), falling back to UI mode")
+            return await self.process_all_dates(page, output_dir)
+
+        success_count = 0
+        failed_dates = []
+        for date_str, df in results.items():
+            if isinstance(df, Exception):
+                logger.error(f"  ✗ {date_str}: {df}")
+                self.record_date(f"smlog_{button_name}", "failed")
+                failed_dates.append(date_str)
+                continue
+            if df is None or len(df) == 0:
+                self.record_date(f"smlog_{button_name}", "empty")
+                failed_dates.append(date_str)
+                continue
+
+            try:
+                df = align_columns(df, mapping)
+            except ValueError as e:
+                logger.error(f"  ✗ {date_str}: {e}")
+                self.record_date(f"smlog_{button_name}", "failed")
+                failed_dates.append(date_str)
+                continue
+            df['date'] = date_str
+            csv_filename = os.path.join(button_output_dir, f"{date_str}_{button_name}.csv")
+            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            self.record_date(f"smlog_{button_name}", "done", csv_filename, len(df))
+            success_count += 1
+
+        logger.info(f"  ✓ CSV saved for {success_count}/{len(dates)} dates in {button_output_dir}")
+        self.print_summary(success_count, failed_dates)
         return success_count > 0
 
     async def run(self):
         """Main execution"""
-        print("=" * 70)
-        print("SMLOG Conversion Summary Scraper")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("SMLOG Conversion Summary Scraper")
+        logger.info("=" * 70)
 
         # Calculate end date
         today = datetime.now()
@@ -569,43 +704,46 @@ class SMLogConversionScraper:
 
         num_days = (end_date - self.start_date).days + 1
 
-        print(f"\nDate Range: {self.start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-        print(f"Total days: {num_days}")
-        print(f"Button to scrape: {self.button_text}")
+        logger.info(f"\nDate Range: {self.start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        logger.info(f"Total days: {num_days}")
+        logger.info(f"Button to scrape: {self.button_text}")
+        logger.info(f"Mode: {'API' if self.api_mode else 'UI'}")
 
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
+            self.rate_limiter.observe(page)
 
             try:
                 # Login and navigate
                 if not await self.login_and_navigate(page):
-                    print("\n✗ Navigation failed")
+                    logger.error("\n✗ Navigation failed")
                     return False
 
                 # Process the button
-                try:
-                    success = await self.process_all_dates(page)
-                    result = "✓ Success" if success else "✗ Failed"
-                except Exception as e:
-                    print(f"\n✗ Error processing {self.button_text}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    result = f"✗ Error: {e}"
+                with task_context(module=self.button_text):
+                    try:
+                        if self.api_mode:
+                            success = await self.process_all_dates_api(page, self.output_dir)
+                        else:
+                            success = await self.process_all_dates(page, self.output_dir)
+                        result = "✓ Success" if success else "✗ Failed"
+                    except Exception as e:
+                        logger.error(f"\n✗ Error processing {self.button_text}: {e}", exc_info=True)
+                        result = f"✗ Error: {e}"
 
                 # Summary
-                print("\n" + "=" * 70)
-                print("SUMMARY")
-                print("=" * 70)
-                print(f"  {self.button_text}: {result}")
-                print("=" * 70)
+                logger.info("\n" + "=" * 70)
+                logger.info("SUMMARY")
+                logger.info("=" * 70)
+                logger.info(f"  {self.button_text}: {result}")
+                self.rate_limiter.print_summary()
+                logger.info("=" * 70)
 
                 return True
 
             except Exception as e:
-                print(f"\n✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"\n✗ Error: {e}", exc_info=True)
                 return False
 
             finally:
@@ -613,6 +751,13 @@ class SMLogConversionScraper:
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--api', action='store_true', help='Replay the captured data request for every date instead of driving the UI per date')
+    args = parser.parse_args()
+
+    # Console + JSON-lines log (level: NAVERPLACE_LOG_LEVEL, default INFO)
+    configure_logging(log_path=os.path.join('smlog_data', '_logs', 'conversion.jsonl'))
+
     # Load credentials from CSV file
     import os
     csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'info_smlog.csv')
@@ -624,22 +769,43 @@ if __name__ == '__main__':
         username = creds_df['usr'].iloc[0]
         password = creds_df['usrs'].iloc[0]
         svid = str(creds_df['svid'].iloc[0])
-        print(f"✓ Credentials loaded from {csv_path}")
+        logger.info(f"✓ Credentials loaded from {csv_path}")
     except Exception as e:
-        print(f"✗ Error loading credentials from CSV: {e}")
-        print("Please ensure data/info_smlog.csv exists with columns: usr, usrs, svid")
+        logger.error(f"✗ Error loading credentials from CSV: {e}")
+        logger.info("Please ensure data/info_smlog.csv exists with columns: usr, usrs, svid")
         raise
 
     # Scrape data from start_date to end_date
     days_to_scrape = None  # None = all data from start_date to end_date
 
-    scraper = SMLogConversionScraper(
-        username,
-        password,
-        svid,
-        start_date=datetime(2025, 8, 18),
-        end_date=datetime.now(),
-        days_limit=days_to_scrape
-    )
-    asyncio.run(scraper.run())
-
+    # One scraper per business svid (data/business_catalog.json), falling back to the CSV svid
+    businesses = load_smlog_businesses(svid)
+    max_concurrency = 2
+    metrics_path = os.path.join(METRICS_DIR, 'conversion.prom')
+
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(key, business_svid):
+            output_dir = "smlog_data" if len(businesses) == 1 else os.path.join("smlog_data", key)
+            scraper = SMLogConversionScraper(
+                username,
+                password,
+                business_svid,
+                start_date=datetime(2025, 8, 18),
+                end_date=datetime.now(),
+                days_limit=days_to_scrape,
+                api_mode=args.api,
+                output_dir=output_dir
+            )
+            async with semaphore:
+                with task_context(business=key):
+                    ok = await scraper.run()
+            get_metrics().write_textfile(metrics_path)
+            return ok
+
+        results = await asyncio.gather(*(run_one(key, business_svid) for key, business_svid in businesses))
+        for (key, business_svid), ok in zip(businesses, results):
+            logger.info(f"  [{key}] svid={business_svid}: {'✓ Success' if ok else '✗ Failed'}")
+
+    asyncio.run(run_all())
@@ -4,18 +4,33 @@ SMLOG Detailed Data Scraper
 Extracts data from each page (네트워크, 키워드, 사이트, 미디어)
 Sets same date for start and end, iterates from 2025.8.18
 Exports data as CSV/Excel files with page names
+API mode: captures the table request once per button and replays it for every date
 """
 
+import argparse
 import asyncio
+import time
 import pandas as pd
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
 import os
 
+from smlog_api_client import SMLogNetworkCapture, SMLogApiClient, column_mapping, align_columns, load_smlog_businesses, SELECTOR_CACHE_PATH, PAGE_TAB_SELECTORS, METRICS_DIR
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.rate_limiter import get_rate_limiter
+from modules.selector_resolver import get_selector_resolver
+from modules.run_log import get_logger, configure_logging, task_context
+from modules.run_metrics import get_metrics
+
+
+logger = get_logger(__name__)
+
 
 class SMLogDetailedScraper:
-    def __init__(self, username, password, svid="33138", start_date=None, days_limit=None):
+    def __init__(self, username, password, svid="33138", start_date=None, days_limit=None, api_mode=False, api_concurrency=4, output_dir="smlog_data"):
         self.username = username
         self.password = password
         self.svid = svid
@@ -32,36 +47,65 @@ class SMLogDetailedScraper:
         # Limit number of days to scrape (default: None = all days)
         self.days_limit = days_limit
 
+        # API mode: replay the captured table request instead of re-scraping the DOM per date
+        self.api_mode = api_mode
+        self.api_concurrency = api_concurrency
+
+        # Output root (per-business partition when several svids are scraped)
+        self.output_dir = output_dir
+
+        # Rows / bytes / per-date task status (shared process-wide registry)
+        self.metrics = get_metrics()
+
+        # Shared per-host rate limiter (paces navigations, date searches and API replays)
+        self.rate_limiter = get_rate_limiter()
+
+        # Page-tab lookup resolves all candidates in one round trip (winner cached on disk)
+        self.selector_resolver = get_selector_resolver(SELECTOR_CACHE_PATH)
+
+    def get_date_list(self):
+        """Dates to process (start_date to today, capped by days_limit)"""
+        end_date = datetime.now()
+        if self.days_limit:
+            end_date = min(end_date, self.start_date + timedelta(days=self.days_limit - 1))
+
+        dates = []
+        current_date = self.start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+        return dates
+
     async def login_and_navigate(self, page):
         """Complete login and navigation flow"""
-        print("\n[Navigation] Starting login and navigation flow...")
+        logger.info("\n[Navigation] Starting login and navigation flow...")
 
         # Step 1: Login page
-        print("  [1/5] Navigating to login page...")
-        await page.goto(self.login_url, wait_until="networkidle")
+        logger.info("  [1/5] Navigating to login page...")
+        await self.rate_limiter.goto(page, self.login_url, wait_until="networkidle")
         await asyncio.sleep(1)
 
         # Step 2: Enter credentials
-        print("  [2/5] Entering credentials...")
+        logger.info("  [2/5] Entering credentials...")
         await page.fill('#id', self.username)
         await page.fill('input[type="password"]', self.password)
 
         # Step 3: Click login button
-        print("  [3/5] Clicking login button...")
+        logger.info("  [3/5] Clicking login button...")
         login_button = await page.query_selector('.login-button-01')
         if login_button:
             await login_button.click()
             await asyncio.sleep(1)
 
         # Step 4: Click HMIS button
-        print("  [4/5] Clicking HMIS button...")
+        logger.info("  [4/5] Clicking HMIS button...")
         hmis_button = await page.query_selector('.hmis')
         if hmis_button:
             await hmis_button.click()
             await asyncio.sleep(1)
 
         # Step 5: Click service domain link
-        print("  [5/5] Clicking service domain link...")
+        logger.info("  [5/5] Clicking service domain link...")
         service_links = await page.query_selector_all('.service-domain-url')
         for link in service_links:
             href = await link.get_attribute('href')
@@ -71,62 +115,57 @@ class SMLogDetailedScraper:
                 break
 
         # Navigate to statistics page
-        await page.goto(self.stats_url, wait_until="domcontentloaded")
+        await self.rate_limiter.goto(page, self.stats_url, wait_until="domcontentloaded")
         await asyncio.sleep(1)
 
-        print("✓ Navigation completed successfully")
+        logger.info("✓ Navigation completed successfully")
         return True
 
     async def find_and_click_button(self, page, button_text):
         """Find and click a button by text"""
-        print(f"\n[Button] Looking for button: {button_text}")
+        logger.info(f"\n[Button] Looking for button: {button_text}")
 
         try:
-            # Try to find the page-tab element directly
-            tabs = await page.query_selector_all('div.page-tab')
-            print(f"  Found {len(tabs)} page tabs")
-
-            for tab in tabs:
-                text = await tab.inner_text()
-                print(f"    Tab text: '{text}'")
-                if text == button_text or button_text in text:
-                    print(f"  ✓ Found matching tab: '{text}'")
-                    await tab.click()
-                    await asyncio.sleep(1)
-                    print(f"  ✓ Button clicked")
-                    return True
+            # Check every page-tab candidate for the text in a single evaluate
+            match = await self.selector_resolver.resolve(
+                page, 'smlog_statistics', 'page_tab', PAGE_TAB_SELECTORS, text=button_text
+            )
+            if match is None:
+                logger.error(f"  ✗ Button not found (candidates: {', '.join(PAGE_TAB_SELECTORS)})")
+                return False
 
-            print(f"  ✗ Button not found in {len(tabs)} tabs")
-            return False
+            logger.info(f"  ✓ Found matching tab: '{match.text}' via {match.selector}")
+            await match.locator(page).click()
+            await asyncio.sleep(1)
+            logger.info(f"  ✓ Button clicked")
+            return True
 
         except Exception as e:
-            print(f"  ✗ Error finding button: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error finding button: {e}", exc_info=True)
             return False
 
     async def find_date_picker(self, page):
         """Find the date picker elements"""
-        print(f"\n[DatePicker] Looking for date picker...")
+        logger.info(f"\n[DatePicker] Looking for date picker...")
 
         try:
             # Look for date picker input fields
             date_inputs = await page.query_selector_all('input[type="date"], input[placeholder*="date"], input[class*="date"]')
-            print(f"  Found {len(date_inputs)} potential date input fields")
+            logger.info(f"  Found {len(date_inputs)} potential date input fields")
 
             # Also look for calendar elements
             calendar_cells = await page.query_selector_all('td[class*="weekend"][class*="active"][class*="available"], td[class*="start-date"], td[class*="end-date"]')
-            print(f"  Found {len(calendar_cells)} calendar cells")
+            logger.info(f"  Found {len(calendar_cells)} calendar cells")
 
             return date_inputs, calendar_cells
 
         except Exception as e:
-            print(f"  Error finding date picker: {e}")
+            logger.info(f"  Error finding date picker: {e}")
             return [], []
 
     async def set_date_range(self, page, target_date):
         """Set same date for both start and end using the on-page controls (no JS injection)."""
-        print(f"\n[Date] Setting date to {target_date.strftime('%Y-%m-%d')}")
+        logger.info(f"\n[Date] Setting date to {target_date.strftime('%Y-%m-%d')}")
 
         try:
             date_format_kr = target_date.strftime('%Y.%m.%d')
@@ -136,7 +175,7 @@ class SMLogDetailedScraper:
             try:
                 daterange_input = await page.wait_for_selector('input[name="daterange"]', timeout=5000)
             except Exception:
-                print("  ✗ daterange input not found")
+                logger.error("  ✗ daterange input not found")
                 return False
 
             await daterange_input.click()
@@ -160,7 +199,7 @@ class SMLogDetailedScraper:
 
             # 3) Type the new date range
             await daterange_input.type(date_range_str, delay=40)
-            print(f"  Filled daterange: {date_range_str}")
+            logger.info(f"  Filled daterange: {date_range_str}")
             await asyncio.sleep(0.5)
 
             # Blur the input to ensure changes are registered
@@ -186,18 +225,18 @@ class SMLogDetailedScraper:
                     candidate = await page.wait_for_selector(selector, timeout=2000)
                     if candidate and await candidate.is_visible():
                         apply_button = candidate
-                        print(f"  Found apply button with selector: {selector}")
+                        logger.debug("  Found apply button with selector: %s", selector)
                         break
                 except Exception:
                     continue
 
             if apply_button:
-                print("  Clicking apply button...")
+                logger.info("  Clicking apply button...")
                 await apply_button.click()
                 await asyncio.sleep(1.5)
-                print("  ✓ Apply button clicked")
+                logger.info("  ✓ Apply button clicked")
             else:
-                print("  ℹ Apply button not visible; continuing")
+                logger.info("  ℹ Apply button not visible; continuing")
 
             # 5) Click the "조회하기" (Search) button
             search_button = None
@@ -213,31 +252,31 @@ class SMLogDetailedScraper:
                     candidate = await page.wait_for_selector(selector, timeout=3000)
                     if candidate:
                         search_button = candidate
-                        print(f"  Found search button with selector: {selector}")
+                        logger.debug("  Found search button with selector: %s", selector)
                         break
                 except Exception:
                     continue
 
             if search_button:
-                print("  Clicking search button...")
+                logger.info("  Clicking search button...")
                 await search_button.click()
                 await asyncio.sleep(2)
-                print("  ✓ Search button clicked")
+                logger.info("  ✓ Search button clicked")
             else:
-                print("  ⚠ Search button not found; data may not refresh")
+                logger.warning("  ⚠ Search button not found; data may not refresh")
 
             # 6) Verify the input reflects our target date (retry up to 3 times)
             date_set_correctly = False
             for verify_attempt in range(3):
                 current_value = await daterange_input.input_value()
-                print(f"  Verification attempt {verify_attempt + 1}: {current_value}")
+                logger.debug("  Verification attempt %s: %s", verify_attempt + 1, current_value)
                 if current_value.strip() == date_range_str:
-                    print("  ✓ Date confirmed on input")
+                    logger.info("  ✓ Date confirmed on input")
                     date_set_correctly = True
                     break
 
                 # Retry by re-entering the date
-                print("  ⚠ Date mismatch, re-entering value")
+                logger.warning("  ⚠ Date mismatch, re-entering value")
                 await daterange_input.click()
                 for shortcut in ['Meta+A', 'Control+A']:
                     try:
@@ -263,19 +302,18 @@ class SMLogDetailedScraper:
                     await asyncio.sleep(2)
 
             if not date_set_correctly:
-                print(f"  ⚠ Unable to confirm date value (expected {date_range_str})")
+                logger.warning(f"  ⚠ Unable to confirm date value (expected {date_range_str})")
 
             return True
 
         except Exception as e:
-            print(f"  Error setting date: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.info(f"  Error setting date: {e}")
+            logger.debug("Traceback", exc_info=True)
             return False
 
     async def extract_table_data(self, page):
         """Extract table data from card-table"""
-        print(f"\n[Table] Extracting table data...")
+        logger.info(f"\n[Table] Extracting table data...")
 
         try:
             # Wait for table to load - check if table exists and has data
@@ -302,16 +340,16 @@ class SMLogDetailedScraper:
                     if tbody and tbody.find_all('tr'):
                         break  # Table found with data, exit retry loop
                     elif retry < max_retries - 1:
-                        print(f"  ⚠ Table found but no data rows, retrying... ({retry + 1}/{max_retries})")
+                        logger.warning(f"  ⚠ Table found but no data rows, retrying... ({retry + 1}/{max_retries})")
                         await asyncio.sleep(2)
                         continue
 
                 if retry < max_retries - 1:
-                    print(f"  ⚠ No table found, retrying... ({retry + 1}/{max_retries})")
+                    logger.warning(f"  ⚠ No table found, retrying... ({retry + 1}/{max_retries})")
                     await asyncio.sleep(2)
 
             if not card_table:
-                print(f"  ✗ No table found after {max_retries} retries")
+                logger.error(f"  ✗ No table found after {max_retries} retries")
                 return None
 
             # Extract headers - check all potential header rows
@@ -346,13 +384,13 @@ class SMLogDetailedScraper:
                     if row_data and any(cell.strip() for cell in row_data):
                         rows.append(row_data)
 
-            print(f"  ✓ Extracted {len(rows)} rows with {len(headers)} headers")
+            logger.info(f"  ✓ Extracted {len(rows)} rows with {len(headers)} headers")
 
             # Create DataFrame
             if rows:
                 # If headers don't match column count, generate column names
                 if headers and len(headers) != len(rows[0]) if rows else 0:
-                    print(f"    Note: Header/column mismatch ({len(headers)} vs {len(rows[0]) if rows else 0}), using auto-generated column names")
+                    logger.info(f"    Note: Header/column mismatch ({len(headers)} vs {len(rows[0]) if rows else 0}), using auto-generated column names")
                     # Get the maximum number of columns
                     max_cols = max(len(row) for row in rows) if rows else 0
                     # Generate column names if needed
@@ -367,20 +405,18 @@ class SMLogDetailedScraper:
 
                 return df
 
-            print(f"  ℹ Table found but no data rows")
+            logger.info(f"  ℹ Table found but no data rows")
             return None
 
         except Exception as e:
-            print(f"  ✗ Error extracting table: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting table: {e}", exc_info=True)
             return None
 
     async def process_all_dates(self, page, button_text, output_dir="smlog_data"):
         """Process data for all dates for a specific button - saves individual CSV per date"""
-        print(f"\n" + "=" * 70)
-        print(f"PROCESSING: {button_text}")
-        print("=" * 70)
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"PROCESSING: {button_text}")
+        logger.info("=" * 70)
 
         # Create output directory with button name subdirectory
         button_output_dir = os.path.join(output_dir, button_text)
@@ -388,7 +424,7 @@ class SMLogDetailedScraper:
 
         # Click the button
         if not await self.find_and_click_button(page, button_text):
-            print(f"✗ Could not click button: {button_text}")
+            logger.error(f"✗ Could not click button: {button_text}")
             return False
 
         current_date = self.start_date
@@ -406,10 +442,14 @@ class SMLogDetailedScraper:
         # Iterate through dates
         while current_date <= today:
             date_str = current_date.strftime('%Y-%m-%d')
-            print(f"\n[{date_str}] Processing date...")
-
-            # Set date range
-            if await self.set_date_range(page, current_date):
+            logger.info(f"\n[{date_str}] Processing date...")
+
+            # Each date search hits smlog.co.kr once: pace it through the shared limiter
+            await self.rate_limiter.acquire(self.base_url)
+            started = time.monotonic()
+            date_set = await self.set_date_range(page, current_date)
+            self.rate_limiter.record(self.base_url, time.monotonic() - started)
+            if date_set:
                 # Wait a bit more to ensure data is loaded
                 await asyncio.sleep(2)
                 
@@ -423,41 +463,135 @@ class SMLogDetailedScraper:
                     # Save individual CSV file for this date
                     csv_filename = os.path.join(button_output_dir, f"{date_str}_{button_text}.csv")
                     df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-                    print(f"  ✓ CSV saved: {csv_filename} ({len(df)} rows)")
+                    self.record_date(f"smlog_{button_text}", "done", csv_filename, len(df))
+                    logger.info(f"  ✓ CSV saved: {csv_filename} ({len(df)} rows)")
                     success_count += 1
                 else:
-                    print(f"  ℹ No data for {date_str}")
+                    logger.info(f"  ℹ No data for {date_str}")
+                    self.record_date(f"smlog_{button_text}", "empty")
                     failed_dates.append(date_str)
             else:
-                print(f"  ✗ Could not set date for {date_str}")
+                logger.error(f"  ✗ Could not set date for {date_str}")
+                self.record_date(f"smlog_{button_text}", "failed")
                 failed_dates.append(date_str)
 
             # Move to next date
             current_date += timedelta(days=1)
 
-            # Delay between date requests to avoid overwhelming the server
-            await asyncio.sleep(1)
 
-        # Summary
-        print(f"\n" + "=" * 70)
-        print(f"SUMMARY for {button_text}")
-        print("=" * 70)
-        print(f"  ✓ Successfully saved: {success_count} dates")
+        self.print_summary(button_text, success_count, failed_dates)
+        return success_count > 0
+
+    def record_date(self, module, status, csv_filename=None, rows=None):
+        """Count one per-date result (done / empty / failed) and the CSV it produced"""
+        self.metrics.tasks.inc(module=module, status=status)
+        if csv_filename:
+            self.metrics.record_output(module, csv_filename, rows=rows)
+
+    def print_summary(self, button_text, success_count, failed_dates):
+        """Print per-button success/failure summary"""
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"SUMMARY for {button_text}")
+        logger.info("=" * 70)
+        logger.info(f"  ✓ Successfully saved: {success_count} dates")
         if failed_dates:
-            print(f"  ✗ Failed dates: {len(failed_dates)}")
+            logger.error(f"  ✗ Failed dates: {len(failed_dates)}")
             if len(failed_dates) <= 10:
-                print(f"    {', '.join(failed_dates)}")
+                logger.info(f"    {', '.join(failed_dates)}")
             else:
-                print(f"    {', '.join(failed_dates[:10])} ... and {len(failed_dates) - 10} more")
-        print("=" * 70)
+                logger.info(f"    {', '.join(failed_dates[:10])} ... and {len(failed_dates) - 10} more")
+        logger.info("=" * 70)
 
+    async def process_all_dates_api(self, page, button_text, output_dir="smlog_data"):
+        """API mode: run the UI search once with network capture, then replay the data request for all dates"""
+        logger.info(f"\n" + "=" * 70)
+        logger.info(f"PROCESSING (API mode): {button_text}")
+        logger.info("=" * 70)
+
+        button_output_dir = os.path.join(output_dir, button_text)
+        os.makedirs(button_output_dir, exist_ok=True)
+
+        if not await self.find_and_click_button(page, button_text):
+            logger.error(f"✗ Could not click button: {button_text}")
+            return False
+
+        dates = self.get_date_list()
+        if not dates:
+            logger.info("  ℹ No dates to process")
+            return False
+
+        # 1) Run the first date through the UI while capturing XHR/fetch traffic
+        first_date = dates[0]
+        capture = SMLogNetworkCapture()
+        capture.attach(page)
+        try:
+            ui_df = None
+            if await self.set_date_range(page, first_date):
+                await asyncio.sleep(2)
+                ui_df = await self.extract_table_data(page)
+        finally:
+            capture.detach()
+
+        if ui_df is None:
+            logger.warning("  ⚠ No UI table for the first date to map API columns, falling back to UI mode")
+            return await self.process_all_dates(page, button_text, output_dir)
+
+        endpoint = capture.identify_data_endpoint(first_date, expected_rows=len(ui_df))
+        if endpoint is None:
+            logger.warning(f"  ⚠ Data endpoint not identified, falling back to UI mode")
+            return await self.process_all_dates(page, button_text, output_dir)
+
+        # 2) Replay the request for every date with the session cookies
+        client = SMLogApiClient(page.context, endpoint, concurrency=self.api_concurrency)
+        results = await client.fetch_dates(dates)
+
+        # Map API fields to UI headers once, from the first date the UI rendered
+        first_str = first_date.strftime('%Y-%m-%d')
+        first_api = results.get(first_str)
+        if not isinstance(first_api, pd.DataFrame):
+            logger.warning(f"  ⚠ API replay failed for {first_str}, falling back to UI mode")
+            return await self.process_all_dates(page, button_text, output_dir)
+        try:
+            mapping = column_mapping(first_api, ui_df)
+        except ValueError as e:
+            logger.warning(f"  ⚠ API columns could not be mapped to the UI table ({e}), falling back to UI mode")
+            return await self.process_all_dates(page, button_text, output_dir)
+
+        success_count = 0
+        failed_dates = []
+        for date_str, df in results.items():
+            if isinstance(df, Exception):
+                logger.error(f"  ✗ {date_str}: {df}")
+                self.record_date(f"smlog_{button_text}", "failed")
+                failed_dates.append(date_str)
+                continue
+            if df is None or len(df) == 0:
+                self.record_date(f"smlog_{button_text}", "empty")
+                failed_dates.append(date_str)
+                continue
+
+            try:
+                df = align_columns(df, mapping)
+            except ValueError as e:
+                logger.error(f"  ✗ {date_str}: {e}")
+                self.record_date(f"smlog_{button_text}", "failed")
+                failed_dates.append(date_str)
+                continue
+            df['date'] = date_str
+            csv_filename = os.path.join(button_output_dir, f"{date_str}_{button_text}.csv")
+            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            self.record_date(f"smlog_{button_text}", "done", csv_filename, len(df))
+            success_count += 1
+
+        logger.info(f"  ✓ CSV saved for {success_count}/{len(dates)} dates in {button_output_dir}")
+        self.print_summary(button_text, success_count, failed_dates)
         return success_count > 0
 
     async def run(self):
         """Main execution"""
-        print("=" * 70)
-        print("SMLOG Detailed Data Scraper")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("SMLOG Detailed Data Scraper")
+        logger.info("=" * 70)
 
         # Calculate end date
         today = datetime.now()
@@ -469,44 +603,49 @@ class SMLogDetailedScraper:
             end_date = today
             num_days = (end_date - self.start_date).days + 1
 
-        print(f"\nDate Range: {self.start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-        print(f"Total days: {num_days}")
-        print(f"Buttons to scrape: {', '.join(self.buttons_to_scrape)}")
+        logger.info(f"\nDate Range: {self.start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        logger.info(f"Total days: {num_days}")
+        logger.info(f"Buttons to scrape: {', '.join(self.buttons_to_scrape)}")
+        logger.info(f"Mode: {'API' if self.api_mode else 'UI'}")
 
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
+            self.rate_limiter.observe(page)
 
             try:
                 # Login and navigate
                 if not await self.login_and_navigate(page):
-                    print("\n✗ Navigation failed")
+                    logger.error("\n✗ Navigation failed")
                     return False
 
                 # Process each button
                 results = {}
                 for button_text in self.buttons_to_scrape:
-                    try:
-                        success = await self.process_all_dates(page, button_text)
-                        results[button_text] = "✓ Success" if success else "✗ Failed"
-                    except Exception as e:
-                        print(f"\n✗ Error processing {button_text}: {e}")
-                        results[button_text] = f"✗ Error: {e}"
+                    with task_context(module=button_text):
+                        try:
+                            if self.api_mode:
+                                success = await self.process_all_dates_api(page, button_text, self.output_dir)
+                            else:
+                                success = await self.process_all_dates(page, button_text, self.output_dir)
+                            results[button_text] = "✓ Success" if success else "✗ Failed"
+                        except Exception as e:
+                            logger.error(f"\n✗ Error processing {button_text}: {e}")
+                            results[button_text] = f"✗ Error: {e}"
 
                 # Summary
-                print("\n" + "=" * 70)
-                print("SUMMARY")
-                print("=" * 70)
+                logger.info("\n" + "=" * 70)
+                logger.info("SUMMARY")
+                logger.info("=" * 70)
                 for button_text, status in results.items():
-                    print(f"  {button_text}: {status}")
-                print("=" * 70)
+                    logger.info(f"  {button_text}: {status}")
+                self.rate_limiter.print_summary()
+                logger.info("=" * 70)
 
                 return True
 
             except Exception as e:
-                print(f"\n✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"\n✗ Error: {e}", exc_info=True)
                 return False
 
             finally:
@@ -514,6 +653,13 @@ class SMLogDetailedScraper:
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--api', action='store_true', help='Replay the captured data request for every date instead of driving the UI per date')
+    args = parser.parse_args()
+
+    # Console + JSON-lines log (level: NAVERPLACE_LOG_LEVEL, default INFO)
+    configure_logging(log_path=os.path.join('smlog_data', '_logs', 'detailed.jsonl'))
+
     # Load credentials from CSV file
     import os
     csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'info_smlog.csv')
@@ -525,20 +671,42 @@ if __name__ == '__main__':
         username = creds_df['usr'].iloc[0]
         password = creds_df['usrs'].iloc[0]
         svid = str(creds_df['svid'].iloc[0])
-        print(f"✓ Credentials loaded from {csv_path}")
+        logger.info(f"✓ Credentials loaded from {csv_path}")
     except Exception as e:
-        print(f"✗ Error loading credentials from CSV: {e}")
-        print("Please ensure data/info_smlog.csv exists with columns: usr, usrs, svid")
+        logger.error(f"✗ Error loading credentials from CSV: {e}")
+        logger.info("Please ensure data/info_smlog.csv exists with columns: usr, usrs, svid")
         raise
 
     # Scrape ALL data from 2025-08-18 to today
     days_to_scrape = None  # None = all data from 2025-08-18 to today
 
-    scraper = SMLogDetailedScraper(
-        username,
-        password,
-        svid,
-        start_date=datetime(2025, 11, 17),
-        days_limit=days_to_scrape
-    )
-    asyncio.run(scraper.run())
+    # One scraper per business svid (data/business_catalog.json), falling back to the CSV svid
+    businesses = load_smlog_businesses(svid)
+    max_concurrency = 2
+    metrics_path = os.path.join(METRICS_DIR, 'detailed.prom')
+
+    async def run_all():
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(key, business_svid):
+            output_dir = "smlog_data" if len(businesses) == 1 else os.path.join("smlog_data", key)
+            scraper = SMLogDetailedScraper(
+                username,
+                password,
+                business_svid,
+                start_date=datetime(2025, 11, 17),
+                days_limit=days_to_scrape,
+                api_mode=args.api,
+                output_dir=output_dir
+            )
+            async with semaphore:
+                with task_context(business=key):
+                    ok = await scraper.run()
+            get_metrics().write_textfile(metrics_path)
+            return ok
+
+        results = await asyncio.gather(*(run_one(key, business_svid) for key, business_svid in businesses))
+        for (key, business_svid), ok in zip(businesses, results):
+            logger.info(f"  [{key}] svid={business_svid}: {'✓ Success' if ok else '✗ Failed'}")
+
+    asyncio.run(run_all())
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+SMLOG Incremental Merge
+Merges the per-date CSVs under smlog_data into one columnar store per variable
+(네트워크, 키워드, 사이트, 미디어, 유입유형전체) without re-reading the whole history
+
+- Watermark per variable: file signature (mtime, size) of every merged source + latest date seen
+- Only new or changed files are read (in parallel threads); each run appends new Parquet parts
+- Changed / deleted sources are dropped from the parts that held them before the new part is appended
+- Dates covered by both a range export and a per-date file are taken from the per-date file only
+- Rows are typed at ingest (smlog_schema): counts -> Int64, rates -> float, durations -> seconds
+- Parts are capped at part_rows rows, so a multi-year first build never holds more than one part in memory;
+  iter_batches() streams the store back in record batches (see smlog_aggregate for out-of-core group-bys)
+"""
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from naverplace_shared import use_naverplace_modules
+
+use_naverplace_modules()
+from modules.run_log import get_logger, configure_logging
+from smlog_schema import normalize, SCHEMA_VERSION
+
+
+logger = get_logger(__name__)
+
+DATA_DIR = 'smlog_data'
+STORE_DIRNAME = '_merged'
+STATE_FILENAME = '_state.json'
+SOURCE_COLUMN = '_source'
+PART_ROWS = 500_000
+BATCH_ROWS = 100_000
+
+# smlog_data/<var>/<date>_<var>.csv (scrapers) and smlog_data/<start>_<end>_<var>.csv (older exports)
+DATED_FILE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.+)\.csv$")
+RANGE_FILE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}_(\d{4}-\d{2}-\d{2})_(.+)\.csv$")
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def discover_sources(data_dir):
+    """
+    Group source CSVs by variable
+
+    Returns:
+        {var: {relative_path: date_str}}
+    """
+    grouped = {}
+
+    def add(var, rel_path, date_str):
+        grouped.setdefault(var, {})[rel_path] = date_str
+
+    for entry in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, entry)
+        if entry.startswith('_') or entry.startswith('.'):
+            continue
+        if os.path.isfile(path):
+            m = RANGE_FILE_PATTERN.match(entry)
+            if m:
+                add(m.group(2), entry, m.group(1))
+            continue
+        # Button folder: every file must carry the folder name as its variable
+        for fname in sorted(os.listdir(path)):
+            m = DATED_FILE_PATTERN.match(fname)
+            if m and m.group(2) == entry:
+                add(entry, os.path.join(entry, fname), m.group(1))
+    return grouped
+
+
+def overlapping_dates(sources):
+    """
+    Dates of each range export that also have a per-date file (the per-date file wins)
+
+    Returns:
+        {range_relative_path: [date_str, ...]}
+    """
+    dated = sorted(date for rel, date in sources.items() if os.sep in rel)
+    overlaps = {}
+    for rel, end in sources.items():
+        if os.sep not in rel and RANGE_FILE_PATTERN.match(rel):
+            start = rel[:10]
+            overlaps[rel] = [d for d in dated if start <= d <= end]
+    return overlaps
+
+
+class SMLogMergeStore:
+    """Columnar merged store + per-variable watermarks for one smlog_data directory"""
+
+    def __init__(self, data_dir=DATA_DIR, max_workers=8, part_rows=PART_ROWS):
+        self.data_dir = data_dir
+        self.part_rows = part_rows
+        self.store_dir = os.path.join(data_dir, STORE_DIRNAME)
+        self.state_path = os.path.join(self.store_dir, STATE_FILENAME)
+        self.max_workers = max_workers
+        self.state = {}
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠ [Merge] Could not read {self.state_path}, starting over: {e}")
+
+    def save_state(self):
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def var_dir(self, var):
+        return os.path.join(self.store_dir, var)
+
+    def part_paths(self, var):
+        var_dir = self.var_dir(var)
+        if not os.path.isdir(var_dir):
+            return []
+        return [os.path.join(var_dir, f) for f in sorted(os.listdir(var_dir)) if f.endswith('.parquet')]
+
+    def plan(self, var, sources, overlaps=None):
+        """Split sources into (to_read, to_drop) against the variable's watermark"""
+        known = self.state.get(var, {}).get('files', {})
+        overlaps = overlaps or {}
+        to_read = []
+        for rel_path in sources:
+            entry = known.get(rel_path)
+            if entry is None or entry['signature'] != file_signature(os.path.join(self.data_dir, rel_path)):
+                to_read.append(rel_path)
+            elif entry.get('excluded', []) != overlaps.get(rel_path, []):
+                # A per-date file appeared/disappeared inside this range export: re-read it with the new exclusions
+                to_read.append(rel_path)
+        # Changed files are re-read, so their old rows go too
+        to_drop = set(rel for rel in known if rel not in sources) | set(rel for rel in to_read if rel in known)
+        return to_read, to_drop
+
+    def read_sources(self, var, rel_paths, overlaps=None):
+        """Read and type CSVs in parallel threads (I/O bound); unreadable files are skipped"""
+        overlaps = overlaps or {}
+
+        def read_one(rel_path):
+            try:
+                df = normalize(pd.read_csv(os.path.join(self.data_dir, rel_path), dtype=str), var)
+            except Exception as e:
+                logger.warning(f"  ⚠ [Merge] Skipping {rel_path}: {e}")
+                return rel_path, None
+            excluded = overlaps.get(rel_path)
+            if excluded and 'date' in df.columns:
+                df = df[~df['date'].astype(str).str[:10].isin(excluded)]
+            df[SOURCE_COLUMN] = rel_path
+            return rel_path, df
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(pool.map(read_one, rel_paths))
+
+    def drop_sources(self, var, rel_paths):
+        """Rewrite only the parts that contain dropped sources"""
+        files = self.state[var]['files']
+        parts = sorted(set(files[rel]['part'] for rel in rel_paths if rel in files))
+        for part in parts:
+            path = os.path.join(self.var_dir(var), part)
+            if not os.path.exists(path):
+                continue
+            df = pd.read_parquet(path)
+            df = df[~df[SOURCE_COLUMN].isin(rel_paths)]
+            if len(df) == 0:
+                os.remove(path)
+            else:
+                df.to_parquet(path + '.tmp', index=False)
+                os.replace(path + '.tmp', path)
+        for rel in rel_paths:
+            files.pop(rel, None)
+        logger.info(f"  ℹ [{var}] Dropped {len(rel_paths)} changed/removed sources from {len(parts)} parts")
+
+    def next_part_name(self, var):
+        var_state = self.state[var]
+        var_state['next_part'] = var_state.get('next_part', 0) + 1
+        return f"part-{var_state['next_part']:05d}.parquet"
+
+    def merge_var(self, var, sources):
+        """Merge one variable; returns the number of rows appended"""
+        var_state = self.state.setdefault(var, {'files': {}, 'watermark': None})
+        if var_state.get('schema') != SCHEMA_VERSION:
+            # Parts written with another schema would mix dtypes: rebuild this variable
+            for path in self.part_paths(var):
+                os.remove(path)
+            var_state.update({'files': {}, 'watermark': None, 'schema': SCHEMA_VERSION})
+        overlaps = overlapping_dates(sources)
+        to_read, to_drop = self.plan(var, sources, overlaps)
+        if not to_read and not to_drop:
+            logger.info(f"  ✓ [{var}] Up to date (watermark {var_state['watermark']})")
+            return 0
+
+        if to_drop:
+            self.drop_sources(var, to_drop)
+
+        # Read in slices and flush a part whenever part_rows is reached (bounded memory on large backfills)
+        appended, pending, pending_rows = 0, {}, 0
+        step = max(1, self.max_workers * 4)
+        for i in range(0, len(to_read), step):
+            frames = self.read_sources(var, to_read[i:i + step], overlaps)
+            for rel_path, df in frames.items():
+                if df is not None:
+                    pending[rel_path] = df
+                    pending_rows += len(df)
+            if pending_rows >= self.part_rows:
+                appended += self.write_part(var, sources, pending, overlaps)
+                pending, pending_rows = {}, 0
+        if pending:
+            appended += self.write_part(var, sources, pending, overlaps)
+
+        dates = [entry['date'] for entry in var_state['files'].values()]
+        var_state['watermark'] = max(dates) if dates else None
+        self.save_state()
+        logger.info(f"  ✓ [{var}] {len(to_read)} new/changed files, {appended} rows appended (watermark {var_state['watermark']})")
+        return appended
+
+    def write_part(self, var, sources, frames, overlaps=None):
+        """Append one Parquet part holding the given sources; returns its row count"""
+        overlaps = overlaps or {}
+        var_state = self.state[var]
+        batch = pd.concat(frames.values(), ignore_index=True)
+        part = self.next_part_name(var)
+        os.makedirs(self.var_dir(var), exist_ok=True)
+        path = os.path.join(self.var_dir(var), part)
+        batch.to_parquet(path + '.tmp', index=False)
+        os.replace(path + '.tmp', path)
+        for rel_path in frames:
+            var_state['files'][rel_path] = {
+                'signature': file_signature(os.path.join(self.data_dir, rel_path)),
+                'date': sources[rel_path],
+                'part': part,
+            }
+            if overlaps.get(rel_path):
+                var_state['files'][rel_path]['excluded'] = overlaps[rel_path]
+        self.save_state()
+        return len(batch)
+
+    def merge(self, variables=None, export_csv=False):
+        """Merge every variable found under data_dir (or only `variables`)"""
+        grouped = discover_sources(self.data_dir)
+        # Variables whose sources all disappeared still need their rows dropped
+        for var in self.state:
+            grouped.setdefault(var, {})
+        results = {}
+        for var, sources in sorted(grouped.items()):
+            if variables and var not in variables:
+                continue
+            results[var] = self.merge_var(var, sources)
+            if export_csv:
+                self.export_csv(var)
+        return results
+
+    def load(self, var, columns=None):
+        """Read the merged store of one variable (source column dropped)"""
+        parts = self.part_paths(var)
+        if not parts:
+            return pd.DataFrame()
+        df = pd.concat([pd.read_parquet(p, columns=columns) for p in parts], ignore_index=True)
+        return df.drop(columns=[SOURCE_COLUMN], errors='ignore')
+
+    def iter_batches(self, var, columns=None, batch_rows=BATCH_ROWS):
+        """Stream the merged store as DataFrames of at most batch_rows rows (one part open at a time)"""
+        for path in self.part_paths(var):
+            parquet = pq.ParquetFile(path)
+            names = [c for c in (columns or parquet.schema_arrow.names) if c != SOURCE_COLUMN]
+            for batch in parquet.iter_batches(batch_size=batch_rows, columns=names):
+                yield batch.to_pandas()
+
+    def load_sources(self, var, rel_paths, columns=None, keep_source=False):
+        """Read only the rows of the given sources (only the parts that hold them are opened)"""
+        files = self.state.get(var, {}).get('files', {})
+        rel_paths = [rel for rel in rel_paths if rel in files]
+        parts = sorted(set(files[rel]['part'] for rel in rel_paths))
+        if columns is not None:
+            columns = list(columns) + [SOURCE_COLUMN]
+        frames = []
+        for part in parts:
+            df = pd.read_parquet(os.path.join(self.var_dir(var), part), columns=columns)
+            frames.append(df[df[SOURCE_COLUMN].isin(rel_paths)])
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        return df if keep_source else df.drop(columns=[SOURCE_COLUMN])
+
+    def export_csv(self, var):
+        """Write {var}_merged.csv next to the sources (same file the analysis notebooks read)"""
+        output_path = os.path.join(self.data_dir, f"{var}_merged.csv")
+        # Parts can differ in columns (schema-less variables): align every batch to the union, in first-seen order
+        columns = []
+        for path in self.part_paths(var):
+            columns.extend(c for c in pq.read_schema(path).names if c != SOURCE_COLUMN and c not in columns)
+        with open(output_path + '.tmp', 'w', encoding='utf-8-sig', newline='') as f:
+            for i, batch in enumerate(self.iter_batches(var)):
+                batch.reindex(columns=columns).to_csv(f, index=False, header=(i == 0))
+        os.replace(output_path + '.tmp', output_path)
+        logger.info(f"  ✓ [{var}] Exported {output_path}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Incrementally merge SMLOG per-date CSVs')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='smlog_data directory (or a per-business partition)')
+    parser.add_argument('--var', action='append', help='Only merge these variables (repeatable)')
+    parser.add_argument('--workers', type=int, default=8, help='Parallel CSV reader threads')
+    parser.add_argument('--export-csv', action='store_true', help='Also write {var}_merged.csv for the notebooks')
+    parser.add_argument('--part-rows', type=int, default=PART_ROWS, help='Max rows per Parquet part (bounds merge memory)')
+    args = parser.parse_args()
+
+    configure_logging(log_path=os.path.join(args.data_dir, '_logs', 'merge.jsonl'))
+    store = SMLogMergeStore(args.data_dir, max_workers=args.workers, part_rows=args.part_rows)
+    results = store.merge(args.var, export_csv=args.export_csv)
+    logger.info(f"✓ Merged {len(results)} variables, {sum(results.values())} rows appended")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+SMLOG Column Schema
+Typed, vectorized normalization of the raw table strings the scrapers save
+(thousands separators, %, ₩, HH:MM:SS durations) into numeric columns
+
+- One positional schema per variable (same names the analysis notebooks use)
+- Column-wise pandas string ops only: no per-cell Python
+- Unparseable cells ('-', blanks) become NA instead of failing the whole file
+"""
+
+import pandas as pd
+
+
+# Bump when a schema or parser changes: merged stores built with an older version are rebuilt
+SCHEMA_VERSION = 1
+
+STR = 'str'
+COUNT = 'count'        # "1,234" -> 1234 (Int64)
+RATE = 'rate'          # "45.2%" -> 45.2 (float, still in percent)
+DURATION = 'duration'  # "00:01:25" / "1:25" / "1분 25초" -> 85 (seconds, Int64)
+MONEY = 'money'        # "₩1,234,000" -> 1234000 (Int64)
+DATE = 'date'          # "2025-11-17" -> datetime64
+
+METRIC_COLUMNS = [
+    ('totalClick', COUNT),
+    ('validClick', COUNT),
+    ('churnRate', RATE),
+    ('avgSesstionTime', DURATION),
+    ('conv_ask', COUNT),
+    ('conv_join', COUNT),
+    ('conv_order', COUNT),
+    ('conv_rev', MONEY),
+    ('date', DATE),
+]
+
+SCHEMAS = {
+    '네트워크': [('media', STR), ('network', STR)] + METRIC_COLUMNS,
+    '키워드': [('media', STR), ('keyword', STR)] + METRIC_COLUMNS,
+    '사이트': [('media', STR), ('site', STR)] + METRIC_COLUMNS,
+    '미디어': [('media', STR)] + METRIC_COLUMNS,
+}
+
+_NUMBER_NOISE = r'[,\s₩원%]'
+
+
+def _clean_numeric(series):
+    """Strip separators / units; '-' and blanks become NA"""
+    cleaned = series.astype('string').str.replace(_NUMBER_NOISE, '', regex=True)
+    return pd.to_numeric(cleaned.mask(cleaned.isin(['', '-'])), errors='coerce')
+
+
+def parse_count(series):
+    return _clean_numeric(series).round().astype('Int64')
+
+
+def parse_rate(series):
+    return _clean_numeric(series).astype('float64')
+
+
+def parse_duration(series):
+    """HH:MM:SS, MM:SS, Korean units (1시간 2분 3초) or plain seconds -> seconds"""
+    text = series.astype('string').str.strip()
+
+    clock = text.str.extract(r'^(?:(\d+):)?(\d+):(\d+)$').apply(pd.to_numeric)
+    seconds = clock[0].fillna(0) * 3600 + clock[1] * 60 + clock[2]
+
+    units = pd.concat([
+        text.str.extract(r'(\d+)\s*시간', expand=False),
+        text.str.extract(r'(\d+)\s*분', expand=False),
+        text.str.extract(r'(\d+)\s*초', expand=False),
+    ], axis=1).apply(pd.to_numeric)
+    has_units = units.notna().any(axis=1)
+    seconds = seconds.fillna((units.fillna(0) * [3600, 60, 1]).sum(axis=1).where(has_units))
+
+    seconds = seconds.fillna(_clean_numeric(text))
+    return seconds.round().astype('Int64')
+
+
+def parse_date(series):
+    return pd.to_datetime(series, errors='coerce')
+
+
+PARSERS = {
+    COUNT: parse_count,
+    RATE: parse_rate,
+    DURATION: parse_duration,
+    MONEY: parse_count,
+    DATE: parse_date,
+}
+
+
+def normalize(df, var):
+    """
+    Rename columns by position and convert them to typed columns
+
+    Args:
+        df: raw per-date table (all strings, as saved by the scrapers)
+        var: variable (button) name, e.g. '네트워크'
+
+    Returns:
+        Typed DataFrame (df unchanged when the variable has no schema)
+
+    Raises:
+        ValueError: the table width does not match the schema (layout changed on the site)
+    """
+    schema = SCHEMAS.get(var)
+    if schema is None:
+        return df
+    if len(df.columns) != len(schema):
+        raise ValueError(f"{var}: expected {len(schema)} columns, got {len(df.columns)}")
+
+    typed = pd.DataFrame(index=df.index)
+    for (name, kind), column in zip(schema, df.columns):
+        parser = PARSERS.get(kind)
+        typed[name] = parser(df[column]) if parser else df[column].astype('string')
+    return typed